@@ -0,0 +1,86 @@
+"""
+Import-time budget check for pypalace.
+
+Each import is timed in fresh interpreters (best of ``--repeat`` runs) and
+compared with its budget. The script exits non-zero if an import is over
+budget or pulls in a dependency that should only load on first use, e.g.
+matplotlib or pyvista on the job-submission path.
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --scale 2   # slower machine
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+# heavy dependencies that only plotting, field visualization, Quantum Metal
+# meshing, or result parsing should load
+DEFERRED = ("matplotlib", "pyvista", "vtk", "scqubits", "shapely", "gmsh", "scipy")
+
+# (label, statement, budget in seconds, modules that must stay unloaded)
+CASES = [
+    ("import pypalace", "import pypalace", 0.5, DEFERRED + ("pandas",)),
+    (
+        "submission path",
+        "from pypalace import Config, Simulation, SimulationSweep\n"
+        "Simulation.HPC_options('p', '01:00:00', 1, 8, 16, 'job')",
+        0.75,
+        DEFERRED + ("pandas",),
+    ),
+    ("import pypalace.analysis", "import pypalace.analysis", 1.5, DEFERRED),
+    ("import pypalace.meshing", "import pypalace.meshing", 1.5, DEFERRED),
+]
+
+PROBE = """
+import sys, json
+{statement}
+print(json.dumps(sorted({{name.split(".")[0] for name in sys.modules}})))
+"""
+
+
+def time_import(statement, repeat):
+    """Best wall time of ``statement`` in a fresh interpreter, and the top-level modules it loaded."""
+    best, loaded = float("inf"), []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE.format(statement=statement)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        best = min(best, time.perf_counter() - start)
+        loaded = json.loads(result.stdout.strip().splitlines()[-1])
+    return best, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per case (default 5)")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget (default 1)")
+    args = parser.parse_args()
+
+    baseline, _ = time_import("pass", args.repeat)
+    print(f"{'interpreter startup':28s} {baseline:7.3f} s")
+
+    failed = False
+    for label, statement, budget, deferred in CASES:
+        elapsed, loaded = time_import(statement, args.repeat)
+        cost = elapsed - baseline
+        early = sorted(set(deferred) & set(loaded))
+        status = "ok"
+        if cost > budget * args.scale:
+            status = f"OVER BUDGET ({budget * args.scale:.2f} s)"
+        if early:
+            status += f", eagerly imports {', '.join(early)}"
+        failed |= status != "ok"
+        print(f"{label:28s} {cost:7.3f} s  {status}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
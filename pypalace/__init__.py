@@ -1,7 +1,7 @@
 from .config import Config
 from .palace_env import *
 
-__all__ = ["Config", "Simulation", "Mesh", "mesh"]
+__all__ = ["Config", "Simulation", "SimulationSweep", "ResultCache", "Mesh", "mesh"]
 
 
 def __getattr__(name):
@@ -9,6 +9,14 @@ def __getattr__(name):
         from .simulation import Simulation
 
         return Simulation
+    if name == "SimulationSweep":
+        from .simulation import SimulationSweep
+
+        return SimulationSweep
+    if name == "ResultCache":
+        from .simulation import ResultCache
+
+        return ResultCache
     if name in ("Mesh", "mesh"):
         from .meshing import Mesh
 
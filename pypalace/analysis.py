@@ -4,12 +4,18 @@ superconducting circuit Hamiltonian parameters
 from electromagnetic simulation results.
 """
 
+from collections import OrderedDict
 import pandas as pd
 import numpy as np
-import scqubits as scq
-from scipy.constants import e,hbar,h,pi
-import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+from math import pi
 from .utils import *
+from .palace_env import _usable_cpus
+
+# exact SI values, as in scipy.constants, without importing scipy
+e = 1.602176634e-19
+h = 6.62607015e-34
+hbar = h / (2 * pi)
 phi0 = 2.0678338484619295e-15
 
 class EPR:
@@ -92,6 +98,49 @@ class EPR:
         
         return -chi / (2*np.pi)
     
+    @staticmethod
+    def calculate_chi_matrix(p, f, LJ):
+
+        """
+        Compute the full anharmonicity / cross-Kerr matrix of many modes and junctions.
+
+        Generalizes :meth:`calculate_anharmonicity` and
+        :meth:`calculate_dispersive_shift` to every pair of modes and sums
+        the contributions of all junctions, in a single array expression.
+
+        Parameters
+        ----------
+        p : array_like
+            Participation ratios of shape (n_modes, n_junctions), e.g. from
+            :meth:`~pypalace.simulation.Simulation.get_portEPR_matrix`.
+        f : array_like
+            Mode frequencies in Hz, shape (n_modes,).
+        LJ : float or array_like
+            Josephson inductance in Henries, one value or one per junction.
+
+        Returns
+        -------
+        numpy.ndarray
+            Matrix of shape (n_modes, n_modes) in Hz. Off-diagonal entries
+            are the cross-Kerr shifts chi_mn, diagonal entries the
+            anharmonicities alpha_m (negative for transmons).
+
+        Notes
+        -----
+        chi_mn = -hbar w_m w_n / (4 h) * sum_j p_mj p_nj / EJ_j, with
+        alpha_m = chi_mm / 2, following Eqs. (9) and (11) of
+        https://arxiv.org/pdf/2010.00620.
+        """
+
+        p = np.atleast_2d(np.asarray(p, dtype=float))
+        w = 2 * np.pi * np.asarray(f, dtype=float)
+        EJ = phi0**2/((2*pi)**2*np.broadcast_to(np.asarray(LJ, dtype=float), p.shape[1:]))
+
+        chi = -(p / EJ) @ p.T * np.outer(w, w) * hbar / (4 * 2*pi)
+        chi[np.diag_indices_from(chi)] /= 2
+
+        return chi
+
     ## from https://arxiv.org/pdf/2010.00620
     @staticmethod
     def calculate_lamb_shift(alpha_q,chi):
@@ -141,8 +190,21 @@ class LOM:
     lumped oscillator model (LOM).
 
     These methods map capacitance and inductance values to effective
-    transmon parameters using scqubits and analytic expressions.
+    transmon parameters using a charge-basis transmon spectrum and analytic
+    expressions.
     """
+
+    # (EJ, EC) in MHz -> (E01, anharmonicity) in MHz, least recently used first
+    _spectrum_cache = OrderedDict()
+    _SPECTRUM_CACHE_SIZE = 1 << 16
+    # transmon Hamiltonians diagonalized per batched eigvalsh call
+    _SPECTRUM_BATCH = 512
+    # EJ/EC range covered by the interpolation table, and its relative error bound
+    _SPECTRUM_RATIO_RANGE = (1.0, 1e4)
+    _SPECTRUM_RTOL = 1e-9
+    # new points in one call that justify building the table (about its cost)
+    _SPECTRUM_TABLE_MIN_POINTS = 2000
+    _spectrum_table = None
     
     @staticmethod
     def calculate_C_Sigma(capacitance_matrix, topology):
@@ -297,6 +359,73 @@ class LOM:
         
         return chi/(2*pi)
     
+    @staticmethod
+    def _transmon_spectrum_exact(EJ, EC, ncut=31):
+        """E01 and anharmonicity (same units as EJ, EC) of 1-D arrays of transmons at ng=0."""
+        n = np.arange(-ncut, ncut + 1, dtype=float)
+        dim = len(n)
+        off = np.arange(dim - 1)
+        E01 = np.empty(len(EJ))
+        alpha = np.empty(len(EJ))
+
+        for start in range(0, len(EJ), LOM._SPECTRUM_BATCH):
+            stop = min(start + LOM._SPECTRUM_BATCH, len(EJ))
+            H = np.zeros((stop - start, dim, dim))
+            H[:, np.arange(dim), np.arange(dim)] = 4.0 * EC[start:stop, None] * n**2
+            H[:, off, off + 1] = -EJ[start:stop, None] / 2.0
+            H[:, off + 1, off] = -EJ[start:stop, None] / 2.0
+            levels = np.linalg.eigvalsh(H)[:, :3]
+            E01[start:stop] = levels[:, 1] - levels[:, 0]
+            alpha[start:stop] = levels[:, 2] - 2 * levels[:, 1] + levels[:, 0]
+
+        return E01, alpha
+
+    @staticmethod
+    def _ratio_spline():
+        """
+        Cubic spline of (E01, anharmonicity) / EC against log(EJ/EC).
+
+        At ng=0 the spectrum in units of EC depends only on EJ/EC. Nodes are
+        doubled until the spline matches exact diagonalization at every
+        midpoint to ``_SPECTRUM_RTOL``; built once per process.
+        """
+        if LOM._spectrum_table is None:
+            from scipy.interpolate import CubicSpline
+
+            lo, hi = np.log(LOM._SPECTRUM_RATIO_RANGE)
+            x = np.linspace(lo, hi, 257)
+            y = np.column_stack(LOM._transmon_spectrum_exact(np.exp(x), np.ones_like(x)))
+            while True:
+                spline = CubicSpline(x, y)
+                mid = 0.5 * (x[:-1] + x[1:])
+                exact = np.column_stack(LOM._transmon_spectrum_exact(np.exp(mid), np.ones_like(mid)))
+                error = np.max(np.abs(spline(mid) - exact) / np.abs(exact))
+                if error <= LOM._SPECTRUM_RTOL or len(x) > 1 << 14:
+                    break
+                # the checked midpoints become the new nodes
+                x = np.insert(x, np.arange(1, len(x)), mid)
+                y = np.insert(y, np.arange(1, len(y)), exact, axis=0)
+            LOM._spectrum_table = spline
+        return LOM._spectrum_table
+
+    @staticmethod
+    def _transmon_spectrum(EJ, EC):
+        """E01 and anharmonicity of 1-D arrays of transmons, interpolated where tabulated."""
+        ratio = EJ / EC
+        lo, hi = LOM._SPECTRUM_RATIO_RANGE
+        tabulated = (ratio >= lo) & (ratio <= hi)
+        if LOM._spectrum_table is None and len(EJ) < LOM._SPECTRUM_TABLE_MIN_POINTS:
+            tabulated[:] = False
+        E01 = np.empty(len(EJ))
+        alpha = np.empty(len(EJ))
+        if tabulated.any():
+            scaled = LOM._ratio_spline()(np.log(ratio[tabulated]))
+            E01[tabulated] = scaled[:, 0] * EC[tabulated]
+            alpha[tabulated] = scaled[:, 1] * EC[tabulated]
+        if not tabulated.all():
+            E01[~tabulated], alpha[~tabulated] = LOM._transmon_spectrum_exact(EJ[~tabulated], EC[~tabulated])
+        return E01, alpha
+
     @staticmethod
     def get_qubit_Hamiltonian_parameters(C_Sigma,LJ):
     
@@ -305,10 +434,11 @@ class LOM:
 
         Parameters
         ----------
-        C_Sigma : float
+        C_Sigma : float or array_like
             Total capacitance in Farads.
-        LJ : float
-            Josephson inductance in Henries.
+        LJ : float or array_like
+            Josephson inductance in Henries. Arrays are broadcast against
+            ``C_Sigma``, so a grid of design points is evaluated in one call.
 
         Returns
         -------
@@ -317,23 +447,45 @@ class LOM:
             - ``frequency_GHz`` : qubit transition frequency
             - ``anharmonicity_MHz`` : qubit anharmonicity
 
+            Values are floats for scalar inputs, otherwise arrays of the
+            broadcast shape.
+
         Notes
         -----
-        Uses :mod:`scqubits` to compute transmon energy levels.
+        Diagonalizes the transmon Hamiltonian in the charge basis
+        (``ncut=31``, ``ng=0``, as :class:`scqubits.Transmon`) in batched
+        :func:`numpy.linalg.eigvalsh` calls. Once a call brings thousands of
+        new points, a table of the exact spectrum against EJ/EC is built and
+        points with 1 <= EJ/EC <= 1e4 are interpolated from it, to a relative
+        error below 1e-9. Results are memoized, so repeated design points are
+        free.
         """
     
-        EJ = phi0**2/((2*np.pi)**2*LJ) / h * 1e-6 # in MHz
-        EC = e**2/(2*C_Sigma) / h * 1e-6 # in MHz
-        
-        qubit = scq.Transmon(EJ=EJ,
-                        EC=EC,
-                        ng=0,
-                        ncut=31)
-                        
-        f_q = qubit.E01() / 1000 # in GHz
-        alpha = qubit.anharmonicity() # in MHz
-        
-        return {"frequency_GHz":float(f_q),"anharmonicity_MHz":float(alpha)}
+        EJ = phi0**2/((2*np.pi)**2*np.asarray(LJ, dtype=float)) / h * 1e-6 # in MHz
+        EC = e**2/(2*np.asarray(C_Sigma, dtype=float)) / h * 1e-6 # in MHz
+        EJ, EC = np.broadcast_arrays(EJ, EC)
+        shape = EJ.shape
+
+        cache = LOM._spectrum_cache
+        keys = list(zip(EJ.ravel().tolist(), EC.ravel().tolist()))
+        missing = list(dict.fromkeys(key for key in keys if key not in cache))
+        if missing:
+            EJ_new, EC_new = (np.array(column) for column in zip(*missing))
+            for key, E01, alpha in zip(missing, *LOM._transmon_spectrum(EJ_new, EC_new)):
+                cache[key] = (float(E01), float(alpha))
+
+        values = np.array([cache[key] for key in keys]).reshape(len(keys), 2)
+        for key in keys:
+            cache.move_to_end(key)
+        while len(cache) > LOM._SPECTRUM_CACHE_SIZE:
+            cache.popitem(last=False)
+
+        f_q = values[:, 0].reshape(shape) / 1000 # in GHz
+        alpha = values[:, 1].reshape(shape) # in MHz
+
+        if shape == ():
+            return {"frequency_GHz":float(f_q),"anharmonicity_MHz":float(alpha)}
+        return {"frequency_GHz":f_q,"anharmonicity_MHz":alpha}
         
     @staticmethod
     def calculate_C_r(f_r,m,Zc=50):
@@ -371,6 +523,7 @@ class resonator_analysis:
         *,
         auto_trim: bool = True,
         min_points: int = 8,
+        warm_start: dict | None = None,
     ):
         """
         Extract f_r and kappa from a driven resonator S-parameter sweep.
@@ -393,6 +546,9 @@ class resonator_analysis:
             fitting. Helps when a wide coarse sweep is passed accidentally.
         min_points : int, optional
             Minimum number of points required after trimming.
+        warm_start : dict or None, optional
+            Result of a previous call on a neighboring trace of a sweep; its
+            ``kappa_kHz`` seeds the fit instead of the half-max estimate.
 
         Returns
         -------
@@ -421,9 +577,11 @@ class resonator_analysis:
             f_dip,
             rmse_db,
             df_min,
-        ) = DCM_backend.DCM_fit(S_ij, auto_trim=auto_trim, min_points=min_points)
+        ) = DCM_backend.DCM_fit(S_ij, auto_trim=auto_trim, min_points=min_points, warm_start=warm_start)
 
         if show or save is not None:
+            import matplotlib.pyplot as plt
+
             f_plot = np.linspace(f.min(), f.max(), 500)
             f_khz = (f - f0_fit) / 1e3
             f_plot_khz = (f_plot - f0_fit) / 1e3
@@ -463,3 +621,77 @@ class resonator_analysis:
             "fit_rmse": rmse,
             "fit_rmse_db": rmse_db,
         }
+
+    @staticmethod
+    def get_resonator_parameters_driven_batch(
+        traces,
+        *,
+        processes: int | None = None,
+        auto_trim: bool = True,
+        min_points: int = 8,
+    ):
+        """
+        Extract f_r and kappa from many driven S-parameter sweeps at once.
+
+        Each trace is fitted as in :meth:`get_resonator_parameters_driven`,
+        spread over a pool of worker processes. A trace whose fit fails does
+        not stop the batch; its error is reported in the ``error`` column.
+
+        Parameters
+        ----------
+        traces : dict, list, or numpy.ndarray
+            Sweeps to fit: a dict or list of DataFrames as returned by
+            :meth:`~pypalace.simulation.Simulation.get_Sij`, or an array of
+            shape (n_traces, n_freqs, 3) whose last axis holds frequency (GHz),
+            |S| (dB), and arg(S) (deg).
+        processes : int or None, optional
+            Number of worker processes. Default is the number of CPUs this
+            process may use (its affinity mask, e.g. a Slurm allocation); 1
+            fits in the calling process.
+        auto_trim : bool, optional
+            Passed to each fit, see :meth:`get_resonator_parameters_driven`.
+        min_points : int, optional
+            Passed to each fit, see :meth:`get_resonator_parameters_driven`.
+
+        Returns
+        -------
+        pandas.DataFrame
+            One row per trace, indexed by dict key or position, with the
+            columns returned by :meth:`get_resonator_parameters_driven` plus
+            ``error`` (None for successful fits). Failed fits have NaN values.
+        """
+        if isinstance(traces, dict):
+            keys, frames = list(traces.keys()), list(traces.values())
+        elif isinstance(traces, np.ndarray):
+            if traces.ndim != 3 or traces.shape[2] < 3:
+                raise ValueError("stacked traces must have shape (n_traces, n_freqs, 3)")
+            keys = list(range(len(traces)))
+            frames = [pd.DataFrame(trace[:, :3]) for trace in traces]
+        else:
+            frames = list(traces)
+            keys = list(range(len(frames)))
+
+        items = [(key, frame, auto_trim, min_points) for key, frame in zip(keys, frames)]
+        if processes is None:
+            processes = len(_usable_cpus())
+        processes = max(1, min(int(processes), len(items)))
+
+        if processes == 1:
+            fits = [DCM_backend._fit_trace(item) for item in items]
+        else:
+            chunksize = max(1, len(items) // (4 * processes))
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                fits = list(pool.map(DCM_backend._fit_trace, items, chunksize=chunksize))
+
+        columns = [
+            "frequency_GHz",
+            "kappa_kHz",
+            "frequency_dip_GHz",
+            "frequency_step_kHz",
+            "fit_rmse",
+            "fit_rmse_db",
+        ]
+        rows = [result if result is not None else dict.fromkeys(columns, np.nan) for _, result, _ in fits]
+        table = pd.DataFrame(rows, index=keys, columns=columns)
+        table["error"] = pd.Series([error for _, _, error in fits], index=table.index, dtype=object)
+        return table
@@ -2,21 +2,32 @@
 pyPalace utilities for mesh generation and mesh inspection
 """
 
+from __future__ import annotations
+
 import pandas as pd
 import subprocess
 import numpy as np
+import io
 import json
 import math
+import mmap
+import os
+import shutil
+import struct
+import hashlib
+import time
+import zipfile
 from .config import Config
+from .palace_env import _usable_cpus
 
-from collections import defaultdict
-from dataclasses import dataclass, field
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any, Mapping
+from typing import TYPE_CHECKING, Any, Mapping
 
-from shapely.affinity import scale as shapely_scale
-from shapely.geometry import CAP_STYLE, JOIN_STYLE, LineString, MultiLineString, MultiPolygon, Point, Polygon
-from shapely.ops import unary_union
+# shapely is only needed to mesh Quantum Metal designs; imported where used
+if TYPE_CHECKING:
+    from shapely.geometry import LineString, Polygon
 
 class Mesh:
     """Mesh I/O and Gmsh export helpers for Palace workflows."""
@@ -34,9 +45,75 @@ class Mesh:
         "#D32F2F",  # red
         "#00B0FF",  # azure
     )
-    
+
+    # Nodes per Gmsh element type (first- and second-order types).
+    _MSH_NODES_PER_ELEMENT = {
+        1: 2, 2: 3, 3: 4, 4: 4, 5: 8, 6: 6, 7: 5, 8: 3, 9: 6, 10: 9,
+        11: 10, 12: 27, 13: 18, 14: 14, 15: 1, 16: 8, 17: 20, 18: 15, 19: 13,
+    }
+    # Element types kept by the plotting readers: 3-node triangles, 4-node tets.
+    _MSH_PLOT_ELEMENT_TYPES = frozenset({2, 4})
+    # Local node indices of the four faces and six edges of a tetrahedron.
+    _TET_FACES = np.array([[0, 1, 2], [0, 1, 3], [0, 2, 3], [1, 2, 3]])
+    _TET_EDGES = np.array([[0, 1], [0, 2], [0, 3], [1, 2], [1, 3], [2, 3]])
+
+    # Parsed-mesh cache: ``.npz`` sidecars next to the mesh, plus an in-process
+    # LRU. Both are bounded by total array bytes; the oldest entries go first.
+    _MESH_CACHE_VERSION = 1
+    _MESH_CACHE_SUFFIX = ".pypalace.npz"
+    _MESH_CACHE_MEMORY_BYTES = 2 << 30
+    _MESH_CACHE_DISK_BYTES = 8 << 30
+    _mesh_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+    # Quantum Metal meshes keyed by a hash of their inputs; bump the version
+    # when a meshing change alters the output for the same inputs.
+    _QM_MESH_CACHE_VERSION = 1
+
+    # Attribute section markers, and the header index that records where they
+    # are. The index is only written when the section sits past the offset.
+    _MESH_ATTRIBUTE_MARKERS = {
+        ".msh": (b"$PhysicalNames", b"$EndPhysicalNames"),
+        ".bdf": (b"$ Property cards", b"$ Material cards"),
+    }
+    _MESH_INDEX_SUFFIX = ".pypalace-index.json"
+    _MESH_INDEX_MIN_OFFSET = 1 << 20
+
+    @dataclass(frozen=True)
+    class MeshArrays:
+        """
+        Contiguous NumPy view of the nodes and 2D/3D elements of a mesh file.
+
+        Connectivity arrays hold zero-based row indices into ``coords``, not
+        the node IDs written in the file; ``node_ids[row]`` recovers the ID.
+        """
+
+        node_ids: np.ndarray
+        coords: np.ndarray
+        tris: np.ndarray
+        tri_phys: np.ndarray
+        tets: np.ndarray
+        tet_phys: np.ndarray
+
+    @dataclass(frozen=True, eq=False)
+    class SliceIndex:
+        """
+        Sorted-bounds index of mesh elements along one cut-plane normal.
+
+        Built once by :meth:`Mesh.slice_index` and reused for every slice with
+        that normal. Elements are grouped by their extent along the normal (in
+        powers of two) and sorted by lower bound within each group, so a slice
+        only visits elements whose bounds straddle it.
+        """
+
+        mesh: "Mesh.MeshArrays"
+        attributes: pd.DataFrame
+        normal: str | tuple[float, float, float]
+        unit_normal: np.ndarray
+        basis: np.ndarray
+        tri_bins: tuple
+        tet_bins: tuple
+
     @staticmethod
-    def get_mesh_attributes(filename: str | Path):
+    def get_mesh_attributes(filename: str | Path, cache: bool = True, header_index: bool = True):
         """
         Extract physical attribute names, IDs, and entity types from a mesh file.
 
@@ -46,6 +123,15 @@ class Mesh:
         ----------
         filename : str
             Path to the mesh file.
+        cache : bool, optional
+            If True (default), return the attribute table stored with the
+            parsed-mesh cache when a valid one exists for this file, instead
+            of scanning the file. The cache is written by ``plot_mesh``.
+        header_index : bool, optional
+            If True (default), locate the attribute section with a byte-level
+            search instead of reading the file line by line, and record its
+            offsets in a ``.<filename>.pypalace-index.json`` sidecar when it
+            lies deep in the file. Later lookups seek straight to the section.
 
         Returns
         -------
@@ -57,6 +143,11 @@ class Mesh:
         attributes_dict = {"Name":[],"ID":[],"Type":[]}
 
         filename = str(filename)
+        if cache:
+            cached = Mesh._cached_mesh_attributes(filename)
+            if cached is not None:
+                return cached
+
         filetype = filename[-4:]
         
         if filetype == '.bdf':
@@ -65,7 +156,7 @@ class Mesh:
             attributes_end = "$ Material cards"
             on_off_switch = 0
             
-            with open(filename, 'r') as f:
+            with Mesh._open_attribute_section(filename, header_index) as f:
                 for line in f:
                     if attributes_start in line:
                         on_off_switch = 1
@@ -101,7 +192,7 @@ class Mesh:
             attributes_end = "$EndPhysicalNames"
             on_off_switch = 0
             
-            with open(filename, 'r') as f:
+            with Mesh._open_attribute_section(filename, header_index) as f:
                 for line in f:
                     if on_off_switch == 1:
                         attributes_list.append(line)
@@ -130,6 +221,39 @@ class Mesh:
             
         return pd.DataFrame(attributes_dict,index = None)
 
+    @staticmethod
+    def clear_mesh_cache(filename: str | Path | None = None):
+        """
+        Remove cached parsed meshes.
+
+        Parameters
+        ----------
+        filename : str or Path, optional
+            Mesh file whose cache sidecars and in-memory entry are removed. If
+            omitted, every sidecar recorded in the cache index is removed,
+            along with the index itself and the cached Quantum Metal meshes.
+        """
+        if filename is not None:
+            path = str(Path(filename).resolve())
+            for key in [key for key in Mesh._mesh_cache if key[0] == path]:
+                del Mesh._mesh_cache[key]
+            Mesh._mesh_index_sidecar(filename).unlink(missing_ok=True)
+            sidecar = Mesh._mesh_cache_sidecar(filename)
+            sidecar.unlink(missing_ok=True)
+            Mesh._touch_mesh_cache_index(sidecar, remove=True)
+            return
+
+        Mesh._mesh_cache.clear()
+        index_path = Mesh._mesh_cache_index_path()
+        try:
+            index = json.loads(index_path.read_text())
+        except (OSError, ValueError):
+            index = {}
+        for sidecar in index:
+            Path(sidecar).unlink(missing_ok=True)
+        index_path.unlink(missing_ok=True)
+        shutil.rmtree(Mesh._qm_mesh_cache_paths("")[0].parent, ignore_errors=True)
+
     @staticmethod
     def _mesh_filetype(filename: str | Path) -> str:
         suffix = Path(filename).suffix.lower()
@@ -162,6 +286,15 @@ class Mesh:
 
     @staticmethod
     def _read_msh_for_plot(filename: str | Path):
+        with open(filename, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                version, binary, _, _ = Mesh._msh_format(mm)
+        if int(version) != 2 or binary:
+            raise ValueError(
+                f"the line-by-line reader only supports ASCII MSH 2.2; {filename} is "
+                f"{'binary' if binary else 'ASCII'} MSH {version:g}. Use reader='numpy'."
+            )
+
         nodes: dict[int, tuple[float, float, float]] = {}
         tris: list[tuple[int, tuple[int, int, int]]] = []
         tets: list[tuple[int, tuple[int, int, int, int]]] = []
@@ -221,6 +354,539 @@ class Mesh:
 
         return nodes, tris, tets
 
+    @staticmethod
+    def _msh_body_start(buf: Any, name: str, pos: int = 0) -> int:
+        """Offset just past the ``$name`` marker line at or after ``pos``, or -1."""
+        marker = f"${name}".encode()
+        start = buf.find(marker + b"\n", pos)
+        if start < 0:
+            start = buf.find(marker + b"\r\n", pos)
+        if start < 0:
+            return -1
+        return buf.find(b"\n", start) + 1
+
+    @staticmethod
+    def _msh_section(buf: Any, name: str) -> tuple[int, int]:
+        """Byte range between the ``$name`` and ``$Endname`` marker lines."""
+        end_marker = f"$End{name}".encode()
+
+        start = Mesh._msh_body_start(buf, name)
+        if start < 0:
+            return -1, -1
+        end = buf.find(end_marker, start)
+        if end < 0:
+            raise ValueError(f"mesh file has ${name} without {end_marker.decode()}")
+        return start, end
+
+    @staticmethod
+    def _iter_line_chunks(
+        buf: Any,
+        start: int,
+        end: int,
+        chunk_bytes: int,
+        continuation: bytes | None = None,
+    ):
+        """
+        Yield pieces of ``buf[start:end]`` of about ``chunk_bytes``, cut at line ends.
+
+        When ``continuation`` is set, a piece never ends right before a line
+        starting with it, so continued cards stay in one piece.
+        """
+
+        def can_cut(newline: int) -> bool:
+            if continuation is None:
+                return True
+            return buf[newline + 1 : newline + 1 + len(continuation)] != continuation
+
+        pos = start
+        while pos < end:
+            stop = min(pos + chunk_bytes, end)
+            if stop < end:
+                newline = buf.rfind(b"\n", pos, stop)
+                while newline >= 0 and not can_cut(newline):
+                    newline = buf.rfind(b"\n", pos, newline)
+                if newline < 0:
+                    newline = buf.find(b"\n", stop, end)
+                    while newline >= 0 and not can_cut(newline):
+                        newline = buf.find(b"\n", newline + 1, end)
+                stop = end if newline < 0 else newline + 1
+            yield buf[pos:stop]
+            pos = stop
+
+    @staticmethod
+    def _tokens_per_line(block: bytes) -> np.ndarray:
+        """Whitespace-separated token count of every non-empty line in ``block``."""
+        chars = np.frombuffer(block, dtype=np.uint8)
+        if chars.size == 0:
+            return np.zeros(0, dtype=np.int64)
+        is_space = chars <= 32
+        token_start = ~is_space
+        token_start[1:] &= is_space[:-1]
+        newlines = np.flatnonzero(chars == 10)
+        line_of_token = np.searchsorted(newlines, np.flatnonzero(token_start))
+        counts = np.bincount(line_of_token, minlength=len(newlines) + 1)
+        return counts[counts > 0]
+
+    @staticmethod
+    def _node_row_map(node_ids: np.ndarray):
+        """Return a function mapping node IDs to rows of the coordinate array."""
+        index_dtype = np.int32 if len(node_ids) < 2**31 else np.int64
+        if node_ids.size == 0:
+
+            def no_rows(ids: np.ndarray) -> np.ndarray:
+                if np.size(ids):
+                    raise ValueError("mesh elements reference nodes, but no nodes were read")
+                return np.zeros(np.shape(ids), dtype=index_dtype)
+
+            return no_rows
+
+        max_id = int(node_ids.max())
+        if int(node_ids.min()) >= 0 and max_id <= 4 * len(node_ids) + 1024:
+            lookup = np.full(max_id + 2, -1, dtype=index_dtype)
+            lookup[node_ids] = np.arange(len(node_ids), dtype=index_dtype)
+
+            def rows_and_valid(ids: np.ndarray):
+                rows = lookup[np.clip(ids, -1, max_id + 1)]
+                return rows, rows >= 0
+
+        else:
+            order = np.argsort(node_ids, kind="stable").astype(index_dtype)
+            sorted_ids = node_ids[order]
+
+            def rows_and_valid(ids: np.ndarray):
+                pos = np.clip(np.searchsorted(sorted_ids, ids), 0, len(order) - 1)
+                return order[pos], sorted_ids[pos] == ids
+
+        def to_rows(ids: np.ndarray) -> np.ndarray:
+            rows, valid = rows_and_valid(ids)
+            if not np.all(valid):
+                missing = int(np.asarray(ids)[~valid].flat[0])
+                raise ValueError(f"mesh element references unknown node ID {missing}")
+            return rows
+
+        return to_rows
+
+    @staticmethod
+    def _parse_msh22_element_chunk(
+        block: bytes,
+    ) -> tuple[dict[int, tuple[np.ndarray, np.ndarray]], int]:
+        """Node-ID connectivity and physical tags for tris/tets in MSH 2.2 rows.
+
+        Returns a ``{nodes_per_element: (conn, phys)}`` map and the row count.
+        """
+        counts = Mesh._tokens_per_line(block)
+        flat = np.fromstring(block, dtype=np.int64, sep=" ")
+        if int(counts.sum()) != flat.size:
+            raise ValueError("could not parse $Elements block of MSH 2.2 file")
+
+        offsets = np.zeros(len(counts), dtype=np.int64)
+        np.cumsum(counts[:-1], out=offsets[1:])
+        elm_type = flat[offsets + 1]
+        num_tags = flat[offsets + 2]
+
+        out: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+        for msh_type, n_per in ((2, 3), (4, 4)):
+            sel = (elm_type == msh_type) & (counts == 3 + num_tags + n_per)
+            sel &= num_tags > 0
+            starts = offsets[sel] + 3 + num_tags[sel]
+            conn = flat[starts[:, None] + np.arange(n_per)]
+            phys = flat[offsets[sel] + 3].astype(np.int32)
+            out[n_per] = (conn, phys)
+        return out, len(counts)
+
+    @staticmethod
+    def _msh_format(buf: Any) -> tuple[float, bool, int, str]:
+        """Version, binary flag, data size and byte order from ``$MeshFormat``."""
+        start = Mesh._msh_body_start(buf, "MeshFormat")
+        if start < 0:
+            raise ValueError("not a Gmsh mesh file: missing $MeshFormat")
+        line_end = buf.find(b"\n", start)
+        fields = bytes(buf[start:line_end]).split()
+        if len(fields) < 3:
+            raise ValueError("could not parse $MeshFormat header")
+        version, file_type, data_size = float(fields[0]), int(fields[1]), int(fields[2])
+
+        byteorder = "<"
+        binary = file_type == 1
+        if binary:
+            (one,) = struct.unpack_from("<i", buf, line_end + 1)
+            if one != 1:
+                byteorder = ">"
+        return version, binary, data_size, byteorder
+
+    @staticmethod
+    def _fromstring_chunks(
+        buf: Any, start: int, end: int, dtype: Any, chunk_bytes: int
+    ) -> np.ndarray:
+        """Parse the whitespace-separated numbers in ``buf[start:end]``."""
+        pieces = [
+            np.fromstring(block, dtype=dtype, sep=" ")
+            for block in Mesh._iter_line_chunks(buf, start, end, chunk_bytes)
+        ]
+        if not pieces:
+            return np.zeros(0, dtype=dtype)
+        return np.concatenate(pieces)
+
+    @staticmethod
+    def _stack_mesh_arrays(
+        node_ids: np.ndarray,
+        coords: np.ndarray,
+        pieces: dict[int, list[tuple[np.ndarray, np.ndarray]]],
+    ) -> "Mesh.MeshArrays":
+        """Concatenate per-block tri/tet connectivity into :class:`MeshArrays`."""
+        index_dtype = np.int32 if len(node_ids) < 2**31 else np.int64
+
+        def stack(n_per: int) -> tuple[np.ndarray, np.ndarray]:
+            if not pieces.get(n_per):
+                return (
+                    np.zeros((0, n_per), dtype=index_dtype),
+                    np.zeros(0, dtype=np.int32),
+                )
+            return (
+                np.concatenate([conn for conn, _ in pieces[n_per]]),
+                np.concatenate([phys for _, phys in pieces[n_per]]),
+            )
+
+        tris, tri_phys = stack(3)
+        tets, tet_phys = stack(4)
+
+        return Mesh.MeshArrays(
+            node_ids=node_ids,
+            coords=coords,
+            tris=tris,
+            tri_phys=tri_phys,
+            tets=tets,
+            tet_phys=tet_phys,
+        )
+
+    @staticmethod
+    def _read_msh22_ascii(
+        buf: Any, filename: str | Path, chunk_bytes: int
+    ) -> "Mesh.MeshArrays":
+        """Chunked NumPy parse of the sections of an ASCII MSH 2.2 file."""
+        start, end = Mesh._msh_section(buf, "Nodes")
+        if start < 0:
+            n_nodes = 0
+        else:
+            body = buf.find(b"\n", start, end) + 1
+            n_nodes = int(buf[start:body])
+            start = body
+
+        node_ids = np.empty(n_nodes, dtype=np.int64)
+        coords = np.empty((n_nodes, 3), dtype=np.float64)
+        n_read = 0
+        if n_nodes:
+            for block in Mesh._iter_line_chunks(buf, start, end, chunk_bytes):
+                values = np.fromstring(block, dtype=np.float64, sep=" ")
+                if values.size % 4 != 0 or n_read + values.size // 4 > n_nodes:
+                    raise ValueError(f"could not parse $Nodes block of {filename}")
+                values = values.reshape(-1, 4)
+                node_ids[n_read : n_read + len(values)] = values[:, 0]
+                coords[n_read : n_read + len(values)] = values[:, 1:4]
+                n_read += len(values)
+        if n_read != n_nodes:
+            raise ValueError(f"expected {n_nodes} nodes in {filename}, parsed {n_read}")
+
+        to_rows = Mesh._node_row_map(node_ids)
+        pieces: dict[int, list[tuple[np.ndarray, np.ndarray]]] = {3: [], 4: []}
+        start, end = Mesh._msh_section(buf, "Elements")
+        n_elems = 0
+        n_read = 0
+        if start >= 0:
+            body = buf.find(b"\n", start, end) + 1
+            n_elems = int(buf[start:body])
+            for block in Mesh._iter_line_chunks(buf, body, end, chunk_bytes):
+                parsed, n_lines = Mesh._parse_msh22_element_chunk(block)
+                for n_per, (conn, phys) in parsed.items():
+                    pieces[n_per].append((to_rows(conn), phys))
+                n_read += n_lines
+        if n_read != n_elems:
+            raise ValueError(
+                f"expected {n_elems} elements in {filename}, parsed {n_read}"
+            )
+
+        return Mesh._stack_mesh_arrays(node_ids, coords, pieces)
+
+    @staticmethod
+    def _read_msh22_binary(
+        buf: Any, filename: str | Path, byteorder: str, chunk_bytes: int
+    ) -> "Mesh.MeshArrays":
+        """Read the fixed-size records of a binary MSH 2.2 file with ``np.frombuffer``."""
+        pos = Mesh._msh_body_start(buf, "Nodes")
+        n_nodes = 0
+        node_ids = np.zeros(0, dtype=np.int64)
+        coords = np.zeros((0, 3), dtype=np.float64)
+        if pos >= 0:
+            body = buf.find(b"\n", pos) + 1
+            n_nodes = int(buf[pos:body])
+            record = np.dtype([("id", byteorder + "i4"), ("xyz", byteorder + "f8", (3,))])
+            nbytes = n_nodes * record.itemsize
+            nodes = np.frombuffer(buf[body : body + nbytes], dtype=record, count=n_nodes)
+            node_ids = nodes["id"].astype(np.int64)
+            coords = nodes["xyz"].astype(np.float64)
+            del nodes
+            pos = body + nbytes
+
+        to_rows = Mesh._node_row_map(node_ids)
+        pieces: dict[int, list[tuple[np.ndarray, np.ndarray]]] = {3: [], 4: []}
+        pos = Mesh._msh_body_start(buf, "Elements", max(pos, 0))
+        if pos >= 0:
+            body = buf.find(b"\n", pos) + 1
+            n_elems = int(buf[pos:body])
+            pos = body
+            n_read = 0
+            int32 = byteorder + "i4"
+            while n_read < n_elems:
+                elm_type, n_follow, num_tags = struct.unpack_from(
+                    byteorder + "3i", buf, pos
+                )
+                if elm_type not in Mesh._MSH_NODES_PER_ELEMENT:
+                    raise ValueError(f"unsupported Gmsh element type {elm_type} in {filename}")
+                width = 1 + num_tags + Mesh._MSH_NODES_PER_ELEMENT[elm_type]
+
+                if n_follow == 1:
+                    # Gmsh repeats the 3-int header before every element; treat a
+                    # run of identical headers as fixed-stride records.
+                    n_window = min(n_elems - n_read, max(1, chunk_bytes // (4 * (3 + width))))
+                    records = np.frombuffer(
+                        buf[pos : pos + 4 * (3 + width) * n_window], dtype=int32
+                    ).reshape(n_window, 3 + width)
+                    same = (
+                        (records[:, 0] == elm_type)
+                        & (records[:, 1] == 1)
+                        & (records[:, 2] == num_tags)
+                    )
+                    n_follow = n_window if same.all() else int(np.argmin(same))
+                    data = records[:n_follow, 3:]
+                    pos += 4 * (3 + width) * n_follow
+                else:
+                    pos += 12
+                    nbytes = 4 * n_follow * width
+                    data = np.frombuffer(buf[pos : pos + nbytes], dtype=int32).reshape(
+                        n_follow, width
+                    )
+                    pos += nbytes
+
+                if elm_type in Mesh._MSH_PLOT_ELEMENT_TYPES and num_tags > 0:
+                    conn = to_rows(data[:, 1 + num_tags :].astype(np.int64))
+                    pieces[conn.shape[1]].append((conn, data[:, 1].astype(np.int32)))
+                n_read += n_follow
+
+        return Mesh._stack_mesh_arrays(node_ids, coords, pieces)
+
+    @staticmethod
+    def _msh41_entity_physicals(
+        buf: Any, binary: bool, data_size: int, byteorder: str, chunk_bytes: int
+    ) -> tuple[dict[tuple[int, int], list[int]], int]:
+        """
+        Physical tags of every model entity from an MSH 4.1 ``$Entities`` section.
+
+        Returns the ``{(dim, tag): [physical tags]}`` map and the byte offset
+        where the section data ends (0 when the section is absent).
+        """
+        physicals: dict[tuple[int, int], list[int]] = {}
+        pos = Mesh._msh_body_start(buf, "Entities")
+        if pos < 0:
+            return physicals, 0
+
+        if not binary:
+            end = buf.find(b"$EndEntities", pos)
+            values = Mesh._fromstring_chunks(buf, pos, end, np.float64, chunk_bytes)
+            counts = values[:4].astype(int)
+            p = 4
+            for dim, count in enumerate(counts):
+                for _ in range(count):
+                    tag = int(values[p])
+                    p += 4 if dim == 0 else 7
+                    n_phys = int(values[p])
+                    physicals[(dim, tag)] = values[p + 1 : p + 1 + n_phys].astype(int).tolist()
+                    p += 1 + n_phys
+                    if dim > 0:
+                        p += 1 + int(values[p])
+            return physicals, end
+
+        size_code = "Q" if data_size == 8 else "I"
+        size_t = byteorder + size_code
+        counts = struct.unpack_from(f"{byteorder}4{size_code}", buf, pos)
+        pos += 4 * data_size
+        for dim, count in enumerate(counts):
+            for _ in range(count):
+                (tag,) = struct.unpack_from(byteorder + "i", buf, pos)
+                pos += 4 + 8 * (3 if dim == 0 else 6)
+                (n_phys,) = struct.unpack_from(size_t, buf, pos)
+                pos += data_size
+                physicals[(dim, tag)] = list(
+                    struct.unpack_from(f"{byteorder}{n_phys}i", buf, pos)
+                )
+                pos += 4 * n_phys
+                if dim > 0:
+                    (n_bound,) = struct.unpack_from(size_t, buf, pos)
+                    pos += data_size + 4 * n_bound
+        return physicals, pos
+
+    @staticmethod
+    def _read_msh41(
+        buf: Any,
+        filename: str | Path,
+        binary: bool,
+        data_size: int,
+        byteorder: str,
+        chunk_bytes: int,
+    ) -> "Mesh.MeshArrays":
+        """
+        Read an ASCII or binary MSH 4.1 file entity block by entity block.
+
+        Element physical tags come from ``$Entities``; an element whose entity
+        belongs to several physical groups is emitted once per group, as in
+        MSH 2.2.
+        """
+        physicals, pos = Mesh._msh41_entity_physicals(
+            buf, binary, data_size, byteorder, chunk_bytes
+        )
+        size_code = "Q" if data_size == 8 else "I"
+        size_t = byteorder + size_code
+        tag_dtype = np.dtype(byteorder + f"u{data_size}")
+
+        pos = Mesh._msh_body_start(buf, "Nodes", pos)
+        n_nodes = 0
+        node_ids = np.zeros(0, dtype=np.int64)
+        coords = np.zeros((0, 3), dtype=np.float64)
+        if pos >= 0:
+            if binary:
+                n_blocks, n_nodes, _, _ = struct.unpack_from(
+                    f"{byteorder}4{size_code}", buf, pos
+                )
+                pos += 4 * data_size
+            else:
+                end = buf.find(b"$EndNodes", pos)
+                values = Mesh._fromstring_chunks(buf, pos, end, np.float64, chunk_bytes)
+                n_blocks, n_nodes = int(values[0]), int(values[1])
+                p = 4
+                pos = end
+
+            node_ids = np.empty(n_nodes, dtype=np.int64)
+            coords = np.empty((n_nodes, 3), dtype=np.float64)
+            n_read = 0
+            for _ in range(n_blocks):
+                if binary:
+                    dim, _, parametric = struct.unpack_from(byteorder + "3i", buf, pos)
+                    (n,) = struct.unpack_from(size_t, buf, pos + 12)
+                    pos += 12 + data_size
+                    n_comp = 3 + (dim if parametric else 0)
+                    tags = np.frombuffer(buf[pos : pos + n * data_size], dtype=tag_dtype)
+                    pos += n * data_size
+                    xyz = np.frombuffer(
+                        buf[pos : pos + 8 * n * n_comp], dtype=byteorder + "f8"
+                    ).reshape(n, n_comp)
+                    pos += 8 * n * n_comp
+                else:
+                    dim, _, parametric, n = values[p : p + 4].astype(int)
+                    p += 4
+                    n_comp = 3 + (dim if parametric else 0)
+                    tags = values[p : p + n]
+                    p += n
+                    xyz = values[p : p + n * n_comp].reshape(n, n_comp)
+                    p += n * n_comp
+                node_ids[n_read : n_read + n] = tags
+                coords[n_read : n_read + n] = xyz[:, :3]
+                n_read += n
+            if not binary:
+                del values
+            if n_read != n_nodes:
+                raise ValueError(f"expected {n_nodes} nodes in {filename}, parsed {n_read}")
+
+        to_rows = Mesh._node_row_map(node_ids)
+        pieces: dict[int, list[tuple[np.ndarray, np.ndarray]]] = {3: [], 4: []}
+        pos = Mesh._msh_body_start(buf, "Elements", max(pos, 0))
+        if pos >= 0:
+            if binary:
+                n_blocks = struct.unpack_from(size_t, buf, pos)[0]
+                pos += 4 * data_size
+            else:
+                end = buf.find(b"$EndElements", pos)
+                values = Mesh._fromstring_chunks(buf, pos, end, np.int64, chunk_bytes)
+                n_blocks = int(values[0])
+                p = 4
+
+            for _ in range(n_blocks):
+                if binary:
+                    dim, tag, elm_type = struct.unpack_from(byteorder + "3i", buf, pos)
+                    (n,) = struct.unpack_from(size_t, buf, pos + 12)
+                    pos += 12 + data_size
+                else:
+                    dim, tag, elm_type, n = values[p : p + 4].tolist()
+                    p += 4
+                if elm_type not in Mesh._MSH_NODES_PER_ELEMENT:
+                    raise ValueError(f"unsupported Gmsh element type {elm_type} in {filename}")
+                width = 1 + Mesh._MSH_NODES_PER_ELEMENT[elm_type]
+
+                if elm_type in Mesh._MSH_PLOT_ELEMENT_TYPES:
+                    if binary:
+                        data = np.frombuffer(
+                            buf[pos : pos + n * width * data_size], dtype=tag_dtype
+                        ).reshape(n, width)
+                    else:
+                        data = values[p : p + n * width].reshape(n, width)
+                    conn = to_rows(data[:, 1:].astype(np.int64))
+                    for phys in physicals.get((dim, tag)) or [0]:
+                        pieces[conn.shape[1]].append(
+                            (conn, np.full(n, phys, dtype=np.int32))
+                        )
+
+                if binary:
+                    pos += n * width * data_size
+                else:
+                    p += n * width
+
+        return Mesh._stack_mesh_arrays(node_ids, coords, pieces)
+
+    @staticmethod
+    def _read_msh_arrays(
+        filename: str | Path, chunk_bytes: int = 1 << 22
+    ) -> "Mesh.MeshArrays":
+        """
+        Block-parse a Gmsh ``.msh`` file into :class:`MeshArrays`.
+
+        Supports MSH 2.2 and 4.1, ASCII or binary. ASCII sections are parsed
+        with NumPy in line-aligned chunks of about ``chunk_bytes``; binary
+        blocks are decoded with ``np.frombuffer``. Peak memory stays close to
+        the size of the returned arrays.
+        """
+        with open(filename, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                version, binary, data_size, byteorder = Mesh._msh_format(mm)
+                if int(version) == 2:
+                    if binary:
+                        return Mesh._read_msh22_binary(mm, filename, byteorder, chunk_bytes)
+                    return Mesh._read_msh22_ascii(mm, filename, chunk_bytes)
+                if int(version) == 4 and version >= 4.1:
+                    return Mesh._read_msh41(
+                        mm, filename, binary, data_size, byteorder, chunk_bytes
+                    )
+        raise ValueError(
+            f"unsupported MSH format version {version:g} in {filename}; "
+            "expected 2.2 or 4.1"
+        )
+
+    @staticmethod
+    def _mesh_arrays_from_records(
+        nodes: dict[int, tuple[float, float, float]],
+        tris: list[tuple[int, tuple[int, int, int]]],
+        tets: list[tuple[int, tuple[int, int, int, int]]],
+    ) -> "Mesh.MeshArrays":
+        """Pack the ``(nodes, tris, tets)`` output of the line readers into :class:`MeshArrays`."""
+        node_ids = np.fromiter(nodes.keys(), dtype=np.int64, count=len(nodes))
+        coords = np.asarray(list(nodes.values()), dtype=np.float64).reshape(-1, 3)
+        to_rows = Mesh._node_row_map(node_ids)
+
+        pieces = {}
+        for n_per, records in ((3, tris), (4, tets)):
+            if records:
+                conn = np.asarray([nids for _, nids in records], dtype=np.int64)
+                phys = np.asarray([phys for phys, _ in records], dtype=np.int32)
+                pieces[n_per] = [(to_rows(conn), phys)]
+        return Mesh._stack_mesh_arrays(node_ids, coords, pieces)
+
     @staticmethod
     def _read_bdf_for_plot(filename: str | Path):
         nodes: dict[int, tuple[float, float, float]] = {}
@@ -271,233 +937,907 @@ class Mesh:
         return nodes, tris, tets
 
     @staticmethod
-    def _triangles_on_plane(
-        nodes: dict[int, tuple[float, float, float]],
-        tris: list[tuple[int, tuple[int, int, int]]],
-        tets: list[tuple[int, tuple[int, int, int, int]]],
-        normal: str,
-        origin: tuple[float, float, float],
-        tol: float,
-    ) -> list[tuple[int, np.ndarray]]:
-        axis = {"x": 0, "y": 1, "z": 2}[normal]
-        origin_val = float(origin[axis])
-        out: list[tuple[int, np.ndarray]] = []
-
-        def on_plane(nid: int) -> bool:
-            return abs(nodes[nid][axis] - origin_val) <= tol
+    def _fixed_width_fields(
+        chars: np.ndarray,
+        line_starts: np.ndarray,
+        line_ends: np.ndarray,
+        fields: tuple[tuple[int, int], ...],
+        dtype: Any,
+    ) -> np.ndarray:
+        """
+        Parse fixed-width card fields ``(column, width)`` of many lines at once.
 
-        def add_tri(phys: int, nids: tuple[int, int, int]):
-            if not (on_plane(nids[0]) and on_plane(nids[1]) and on_plane(nids[2])):
-                return
-            out.append(
-                (
-                    phys,
-                    np.asarray(
-                        [nodes[nids[0]], nodes[nids[1]], nodes[nids[2]]], dtype=float
-                    ),
-                )
+        Field bytes are gathered into one buffer with a separator after every
+        field, so values that fill their field and touch the next one (e.g.
+        ``-1.000000000e+00-2.000000000e+00``) still parse with one
+        ``np.fromstring`` call.
+        """
+        columns = np.concatenate([np.arange(col, col + width + 1) for col, width in fields])
+        separator = np.concatenate(
+            [np.arange(width + 1) == width for _, width in fields]
+        )
+        idx = line_starts[:, None] + columns
+        inside = (idx < line_ends[:, None]) & ~separator
+        text = np.where(
+            inside, chars[np.minimum(idx, len(chars) - 1)], np.uint8(32)
+        ).astype(np.uint8)
+        values = np.fromstring(text.tobytes(), dtype=dtype, sep=" ")
+        if values.size != len(line_starts) * len(fields):
+            raise ValueError(
+                "could not parse fixed-width BDF fields; the card may use free-field "
+                "or implicit-exponent format. Use reader='python'."
             )
+        return values.reshape(len(line_starts), len(fields))
 
-        for phys, nids in tris:
-            add_tri(phys, nids)
+    @staticmethod
+    def _parse_bdf_block(
+        block: Any,
+        grid_pieces: list[tuple[np.ndarray, np.ndarray]],
+        elem_pieces: dict[int, list[tuple[np.ndarray, np.ndarray]]],
+    ) -> None:
+        """
+        Internal: parse one line-aligned ``.bdf`` chunk into node and element pieces.
 
-        tet_faces = (
-            (0, 1, 2),
-            (0, 1, 3),
-            (0, 2, 3),
-            (1, 2, 3),
+        The byte view of ``block`` lives only for this call, so the memory map
+        behind it can be closed once the chunks are read.
+        """
+        # (card prefix, nodes per element); PID and node fields are 8 wide from column 16
+        element_cards = ((b"CTRIA3", 3), (b"CTETRA", 4))
+
+        chars = np.frombuffer(block, dtype=np.uint8)
+        newlines = np.flatnonzero(chars == 10)
+        line_starts = np.r_[0, newlines + 1]
+        line_ends = np.r_[newlines, len(chars)]
+        keep = line_starts < len(chars)
+        line_starts, line_ends = line_starts[keep], line_ends[keep]
+        crlf = (line_ends > line_starts) & (
+            chars[np.maximum(line_ends - 1, 0)] == 13
         )
-        for phys, nids in tets:
-            for face in tet_faces:
-                add_tri(phys, (nids[face[0]], nids[face[1]], nids[face[2]]))
+        line_ends = line_ends - crlf
+
+        def has_prefix(prefix: bytes) -> np.ndarray:
+            mask = line_ends - line_starts >= len(prefix)
+            for k, ch in enumerate(prefix):
+                pos = np.minimum(line_starts + k, len(chars) - 1)
+                mask &= chars[pos] == ch
+            return mask
+
+        grid = np.flatnonzero(has_prefix(b"GRID*"))
+        if grid.size:
+            is_cont = np.r_[has_prefix(b"*"), False]
+            grid = grid[is_cont[grid + 1]]
+            xy = Mesh._fixed_width_fields(
+                chars,
+                line_starts[grid],
+                line_ends[grid],
+                ((8, 16), (40, 16), (56, 16)),
+                np.float64,
+            )
+            z = Mesh._fixed_width_fields(
+                chars,
+                line_starts[grid + 1],
+                line_ends[grid + 1],
+                ((8, 16),),
+                np.float64,
+            )
+            grid_pieces.append(
+                (xy[:, 0].astype(np.int64), np.column_stack([xy[:, 1:], z]))
+            )
 
-        return out
+        for prefix, n_per in element_cards:
+            rows = has_prefix(prefix)
+            if not rows.any():
+                continue
+            values = Mesh._fixed_width_fields(
+                chars,
+                line_starts[rows],
+                line_ends[rows],
+                tuple((16 + 8 * k, 8) for k in range(n_per + 1)),
+                np.int64,
+            )
+            # 8-character fields: IDs always fit in int32
+            elem_pieces[n_per].append(
+                (values[:, 1:].astype(np.int32), values[:, 0].astype(np.int32))
+            )
 
     @staticmethod
-    def _triangle_area_2d(tri: np.ndarray) -> float:
-        a, b, c = tri
-        return 0.5 * abs(
-            (b[0] - a[0]) * (c[1] - a[1]) - (c[0] - a[0]) * (b[1] - a[1])
-        )
+    def _read_bdf_arrays(
+        filename: str | Path, chunk_bytes: int = 1 << 20
+    ) -> "Mesh.MeshArrays":
+        """
+        Vectorized reader for Cubit/Nastran ``.bdf`` exports.
 
-    @staticmethod
-    def _label_anchor_for_polys(polys: list[np.ndarray]) -> np.ndarray:
-        """Anchor labels on the largest face in a physical group."""
-        areas = [Mesh._triangle_area_2d(tri) for tri in polys]
-        return polys[int(np.argmax(areas))].mean(axis=0)
+        Memory-maps the bulk data section and walks it in line-aligned chunks
+        of about ``chunk_bytes``. Within a chunk, ``GRID*`` (with its ``*``
+        continuation), ``CTRIA3`` and ``CTETRA`` cards are selected by line
+        prefix and their fixed-width fields are parsed in bulk.
+        """
+        grid_pieces: list[tuple[np.ndarray, np.ndarray]] = []
+        elem_pieces: dict[int, list[tuple[np.ndarray, np.ndarray]]] = {3: [], 4: []}
+
+        with open(filename, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                bulk = mm.find(b"BEGIN BULK")
+                start = mm.find(b"\n", bulk) + 1 if bulk >= 0 else 0
+                if bulk < 0 or start == 0:
+                    start = len(mm)
+
+                for block in Mesh._iter_line_chunks(
+                    mm, start, len(mm), chunk_bytes, continuation=b"*"
+                ):
+                    Mesh._parse_bdf_block(block, grid_pieces, elem_pieces)
+
+        if grid_pieces:
+            node_ids = np.concatenate([ids for ids, _ in grid_pieces])
+            coords = np.concatenate([xyz for _, xyz in grid_pieces])
+        else:
+            node_ids = np.zeros(0, dtype=np.int64)
+            coords = np.zeros((0, 3), dtype=np.float64)
+        del grid_pieces
+
+        to_rows = Mesh._node_row_map(node_ids)
+        pieces = {
+            n_per: [(to_rows(conn), phys) for conn, phys in elem_pieces[n_per]]
+            for n_per in elem_pieces
+        }
+        return Mesh._stack_mesh_arrays(node_ids, coords, pieces)
 
     @staticmethod
-    def _ray_extent_from_point(
-        px: float,
-        py: float,
-        ux: float,
-        uy: float,
-        xmin: float,
-        xmax: float,
-        ymin: float,
-        ymax: float,
-    ) -> float:
-        """Distance from a point to the plot boundary along a unit direction."""
-        t_candidates = []
-        if ux > 1e-12:
-            t_candidates.append((xmax - px) / ux)
-        elif ux < -1e-12:
-            t_candidates.append((xmin - px) / ux)
-        if uy > 1e-12:
-            t_candidates.append((ymax - py) / uy)
-        elif uy < -1e-12:
-            t_candidates.append((ymin - py) / uy)
-        if not t_candidates:
-            return max(xmax - xmin, ymax - ymin, 1e-9) * 0.5
-        valid = [t for t in t_candidates if t > 1e-9]
-        if not valid:
-            return max(xmax - xmin, ymax - ymin, 1e-9) * 0.5
-        return min(valid)
+    def _mesh_cache_sidecar(filename: str | Path) -> Path:
+        """Path of the cache sidecar stored next to ``filename``."""
+        path = Path(filename)
+        return path.with_name(f".{path.name}{Mesh._MESH_CACHE_SUFFIX}")
 
     @staticmethod
-    def _callout_label_position(
-        anchor: np.ndarray,
-        center: np.ndarray,
-        xmin: float,
-        xmax: float,
-        ymin: float,
-        ymax: float,
-    ) -> np.ndarray:
-        """Place a callout label inside the mesh bounds, away from its anchor."""
-        span = max(xmax - xmin, ymax - ymin, 1e-9)
-        inset = 0.035 * span
+    def _mesh_cache_key(filename: str | Path) -> tuple[str, int, int]:
+        """In-memory cache key: resolved path, size, and mtime (ns)."""
+        path = Path(filename).resolve()
+        stat = path.stat()
+        return str(path), stat.st_size, stat.st_mtime_ns
 
-        cx, cy = float(center[0]), float(center[1])
-        ax, ay = float(anchor[0]), float(anchor[1])
-        dx, dy = ax - cx, ay - cy
-        norm = float(np.hypot(dx, dy))
-        if norm < 0.05 * span:
-            dy = 1.0 if ay >= cy else -1.0
-            dx = 0.0
-            norm = 1.0
-        ux, uy = dx / norm, dy / norm
+    @staticmethod
+    def _mesh_file_digest(filename: str | Path, block_bytes: int = 1 << 23) -> str:
+        """BLAKE2b digest of the file contents, read in fixed-size blocks."""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(filename, "rb") as f:
+            for block in iter(lambda: f.read(block_bytes), b""):
+                digest.update(block)
+        return digest.hexdigest()
 
-        t_edge = Mesh._ray_extent_from_point(ax, ay, ux, uy, xmin, xmax, ymin, ymax)
-        offset = float(np.clip(0.22 * t_edge, 0.10 * span, 0.28 * t_edge))
-        pos = np.array([ax + ux * offset, ay + uy * offset])
-        pos[0] = np.clip(pos[0], xmin + inset, xmax - inset)
-        pos[1] = np.clip(pos[1], ymin + inset, ymax - inset)
-        return pos
+    @staticmethod
+    def _mesh_cache_index_path() -> Path:
+        """JSON index of sidecars used for disk LRU eviction."""
+        root = os.environ.get("PYPALACE_CACHE_DIR")
+        root = Path(root).expanduser() if root else Path.home() / ".cache" / "pypalace"
+        return root / "mesh_cache_index.json"
 
     @staticmethod
-    def _initial_callout_positions(
-        anchors: np.ndarray,
-        center: np.ndarray,
-        bounds: tuple[float, float, float, float],
-    ) -> np.ndarray:
-        """Build starting callout positions, fanning out labels near the mesh center."""
-        xmin, xmax, ymin, ymax = bounds
-        span = max(xmax - xmin, ymax - ymin, 1e-9)
-        inset = 0.035 * span
-        xmin_i, xmax_i = xmin + inset, xmax - inset
-        ymin_i, ymax_i = ymin + inset, ymax - inset
+    def _touch_mesh_cache_index(
+        sidecar: Path, nbytes: int | None = None, remove: bool = False
+    ) -> None:
+        """Record a sidecar use, then evict least recently used sidecars over budget."""
+        index_path = Mesh._mesh_cache_index_path()
+        try:
+            index = json.loads(index_path.read_text())
+        except (OSError, ValueError):
+            index = {}
 
-        positions = np.asarray(
-            [
-                Mesh._callout_label_position(anchor, center, xmin, xmax, ymin, ymax)
-                for anchor in anchors
-            ],
-            dtype=float,
-        )
+        key = str(sidecar.resolve())
+        if remove:
+            index.pop(key, None)
+        else:
+            entry = index.setdefault(key, {"bytes": 0})
+            if nbytes is not None:
+                entry["bytes"] = int(nbytes)
+            entry["last_used"] = time.time()
+
+        index = {path: entry for path, entry in index.items() if Path(path).exists()}
+        total = sum(entry.get("bytes", 0) for entry in index.values())
+        for path in sorted(index, key=lambda p: index[p].get("last_used", 0.0)):
+            if total <= Mesh._MESH_CACHE_DISK_BYTES:
+                break
+            if path == key:
+                continue
+            total -= index.pop(path).get("bytes", 0)
+            Path(path).unlink(missing_ok=True)
 
-        center_dists = np.linalg.norm(anchors - center, axis=1)
-        near_idx = np.flatnonzero(center_dists < 0.15 * span)
-        if len(near_idx) > 1:
-            angles = np.linspace(np.pi / 4.0, 3.0 * np.pi / 4.0, len(near_idx))
-            offset = 0.16 * span
-            for k, idx in enumerate(near_idx):
-                positions[idx] = anchors[idx] + offset * np.array(
-                    [np.cos(angles[k]), np.sin(angles[k])]
+        # the cache is best-effort: an unwritable index only disables eviction
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(index))
+            os.replace(tmp, index_path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _load_mesh_cache(filename: str | Path, key: tuple[str, int, int], arrays: bool = True):
+        """Return ``(MeshArrays or None, attributes)`` from a valid sidecar, else None."""
+        sidecar = Mesh._mesh_cache_sidecar(filename)
+        if not sidecar.is_file():
+            return None
+
+        try:
+            with np.load(sidecar, allow_pickle=False) as data:
+                meta = json.loads(str(data["meta"]))
+                if meta.get("version") != Mesh._MESH_CACHE_VERSION or meta.get("size") != key[1]:
+                    return None
+                # a touched or copied file keeps its cache if the contents match
+                moved = meta.get("mtime_ns") != key[2]
+                if moved and meta.get("hash") != Mesh._mesh_file_digest(filename):
+                    return None
+                attributes = pd.DataFrame(
+                    {
+                        "Name": data["attr_name"].tolist(),
+                        "ID": data["attr_id"].tolist(),
+                        "Type": data["attr_type"].tolist(),
+                    },
+                    index=None,
                 )
+                mesh = None
+                if arrays:
+                    mesh = Mesh.MeshArrays(
+                        **{name: data[name] for name in Mesh.MeshArrays.__dataclass_fields__}
+                    )
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            return None
 
-        positions[:, 0] = np.clip(positions[:, 0], xmin_i, xmax_i)
-        positions[:, 1] = np.clip(positions[:, 1], ymin_i, ymax_i)
-        return positions
+        if arrays and moved:
+            Mesh._store_mesh_cache(filename, key, mesh, attributes, digest=meta["hash"])
+        else:
+            Mesh._touch_mesh_cache_index(sidecar)
+        return mesh, attributes
 
     @staticmethod
-    def _spread_label_positions(
-        initial: np.ndarray,
-        texts: list[str],
-        xspan: float,
-        yspan: float,
-        bounds: tuple[float, float, float, float],
-        fontsize: float = 8,
-        n_iter: int = 160,
-    ) -> np.ndarray:
-        """Separate labels that are too close, keeping them inside the mesh bounds."""
-        n = len(texts)
-        xmin, xmax, ymin, ymax = bounds
-        if n <= 1:
-            return initial.copy()
+    def _store_mesh_cache(
+        filename: str | Path,
+        key: tuple[str, int, int],
+        mesh: "Mesh.MeshArrays",
+        attributes: pd.DataFrame,
+        digest: str | None = None,
+    ) -> None:
+        """Write the parsed arrays and attribute table to the sidecar of ``filename``."""
+        sidecar = Mesh._mesh_cache_sidecar(filename)
+        meta = {
+            "version": Mesh._MESH_CACHE_VERSION,
+            "source": key[0],
+            "size": key[1],
+            "mtime_ns": key[2],
+            "hash": digest or Mesh._mesh_file_digest(filename),
+        }
+        payload = {name: getattr(mesh, name) for name in Mesh.MeshArrays.__dataclass_fields__}
+        for column in ("Name", "ID", "Type"):
+            payload[f"attr_{column.lower()}"] = np.array(
+                [str(value) for value in attributes[column]], dtype=str
+            )
 
-        span = max(xspan, yspan, 1e-9)
-        inset = 0.035 * span
-        xmin_i, xmax_i = xmin + inset, xmax - inset
-        ymin_i, ymax_i = ymin + inset, ymax - inset
+        tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp, "wb") as f:
+                np.savez(f, meta=np.array(json.dumps(meta)), **payload)
+            os.replace(tmp, sidecar)
+        except OSError as e:
+            tmp.unlink(missing_ok=True)
+            print(f"USER WARNING: could not write mesh cache {sidecar}: {e}")
+            return
+        Mesh._touch_mesh_cache_index(sidecar, sidecar.stat().st_size)
 
-        pos = initial.astype(float).copy()
-        preferred = pos.copy()
+    @staticmethod
+    def _remember_mesh(key: tuple[str, int, int], mesh: "Mesh.MeshArrays", attributes: pd.DataFrame) -> None:
+        """Insert into the in-process LRU, evicting the oldest entries over budget."""
+        cache = Mesh._mesh_cache
+        for stale in [k for k in cache if k[0] == key[0] and k != key]:
+            del cache[stale]
+        for name in Mesh.MeshArrays.__dataclass_fields__:
+            # shared between callers, so never modified in place
+            getattr(mesh, name).setflags(write=False)
+        cache[key] = (mesh, attributes)
+        cache.move_to_end(key)
+
+        def nbytes(entry) -> int:
+            return sum(getattr(entry[0], name).nbytes for name in Mesh.MeshArrays.__dataclass_fields__)
+
+        total = sum(nbytes(entry) for entry in cache.values())
+        while total > Mesh._MESH_CACHE_MEMORY_BYTES and len(cache) > 1:
+            _, entry = cache.popitem(last=False)
+            total -= nbytes(entry)
 
-        char_w = span * 0.011 * (fontsize / 8.0)
-        char_h = span * 0.028 * (fontsize / 8.0)
-        half_sizes = np.array([[0.5 * len(t) * char_w, 0.5 * char_h] for t in texts])
+    @staticmethod
+    def _load_mesh_arrays(filename: str | Path, cache: bool = True):
+        """Return ``(MeshArrays, attributes)`` for a mesh, through the parsed-mesh cache."""
+        filetype = Mesh._mesh_filetype(filename)
 
-        def clip_positions(points: np.ndarray) -> np.ndarray:
-            points[:, 0] = np.clip(points[:, 0], xmin_i, xmax_i)
-            points[:, 1] = np.clip(points[:, 1], ymin_i, ymax_i)
-            return points
+        def parse():
+            if filetype == ".msh":
+                mesh = Mesh._read_msh_arrays(filename)
+            else:
+                mesh = Mesh._read_bdf_arrays(filename)
+            return mesh, Mesh.get_mesh_attributes(filename, cache=False)
 
-        max_drift = 0.30 * span
+        if not cache:
+            return parse()
 
-        for _ in range(n_iter):
-            for i in range(n):
-                for j in range(i + 1, n):
-                    dx = pos[j, 0] - pos[i, 0]
-                    dy = pos[j, 1] - pos[i, 1]
-                    dist = float(np.hypot(dx, dy))
-                    min_dist = float(
-                        np.hypot(
-                            half_sizes[i, 0] + half_sizes[j, 0],
-                            half_sizes[i, 1] + half_sizes[j, 1],
-                        )
-                        + 0.04 * span
-                    )
-                    if dist >= min_dist:
-                        continue
+        key = Mesh._mesh_cache_key(filename)
+        hit = Mesh._mesh_cache.get(key)
+        if hit is not None:
+            Mesh._mesh_cache.move_to_end(key)
+        else:
+            hit = Mesh._load_mesh_cache(filename, key)
+            if hit is None:
+                hit = parse()
+                Mesh._store_mesh_cache(filename, key, *hit)
+            Mesh._remember_mesh(key, *hit)
 
-                    if dist > 1e-9:
-                        push = 0.70 * (min_dist - dist) / 2.0
-                        pos[i, 0] -= push * dx / dist
-                        pos[i, 1] -= push * dy / dist
-                        pos[j, 0] += push * dx / dist
-                        pos[j, 1] += push * dy / dist
-                    else:
-                        push = 0.70 * min_dist / 2.0
-                        sign = 1.0 if j > i else -1.0
-                        pos[i, 1] -= push * sign
-                        pos[j, 1] += push * sign
+        mesh, attributes = hit
+        return mesh, attributes.copy()
 
-            drift = pos - preferred
-            drift_dist = np.linalg.norm(drift, axis=1)
-            over = drift_dist > max_drift
-            if np.any(over):
-                pos[over] = preferred[over] + drift[over] * (
-                    max_drift / drift_dist[over, None]
-                )
+    @staticmethod
+    def _cached_mesh_attributes(filename: str | Path) -> pd.DataFrame | None:
+        """Attribute table from the in-memory or sidecar cache, without parsing the mesh."""
+        try:
+            key = Mesh._mesh_cache_key(filename)
+        except OSError:
+            return None
+        hit = Mesh._mesh_cache.get(key)
+        if hit is None:
+            hit = Mesh._load_mesh_cache(filename, key, arrays=False)
+        return None if hit is None else hit[1].copy()
 
-            pos += 0.08 * (preferred - pos)
+    @staticmethod
+    def _mesh_index_sidecar(filename: str | Path) -> Path:
+        """Path of the header index stored next to ``filename``."""
+        path = Path(filename)
+        return path.with_name(f".{path.name}{Mesh._MESH_INDEX_SUFFIX}")
+
+    @staticmethod
+    def _attribute_section_span(filename: str | Path) -> tuple[int, int]:
+        """Byte span of the attribute section, from the header index or one search."""
+        start_marker, end_marker = Mesh._MESH_ATTRIBUTE_MARKERS[Mesh._mesh_filetype(filename)]
+        stat = Path(filename).stat()
+        index_path = Mesh._mesh_index_sidecar(filename)
+
+        try:
+            index = json.loads(index_path.read_text())
+        except (OSError, ValueError):
+            index = None
+        if (
+            index is not None
+            and index.get("size") == stat.st_size
+            and index.get("mtime_ns") == stat.st_mtime_ns
+        ):
+            start, end = index["attributes"]
+            if start == end:
+                return start, end
+            # cheap guard against a file rewritten with the same size and mtime
+            with open(filename, "rb") as f:
+                f.seek(start)
+                if f.read(len(start_marker)) == start_marker:
+                    return start, end
+
+        if stat.st_size == 0:
+            return 0, 0
+        with open(filename, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            found = buf.find(start_marker)
+            if found == -1:
+                start = end = len(buf)
+            else:
+                start = buf.rfind(b"\n", 0, found) + 1
+                end = buf.find(end_marker, found)
+                end = len(buf) if end == -1 else buf.find(b"\n", end) + 1 or len(buf)
+
+        if start >= Mesh._MESH_INDEX_MIN_OFFSET:
+            try:
+                index_path.write_text(
+                    json.dumps(
+                        {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "attributes": [start, end]}
+                    )
+                )
+            except OSError:
+                pass
+        return start, end
+
+    @staticmethod
+    def _open_attribute_section(filename: str | Path, header_index: bool = True):
+        """Text stream over the attribute section, or the whole file without the index."""
+        # binary .msh files keep the attribute section as text, but the bulk data does not decode
+        if not header_index:
+            return open(filename, "r", errors="replace")
+        start, end = Mesh._attribute_section_span(filename)
+        with open(filename, "rb") as f:
+            f.seek(start)
+            text = f.read(end - start).decode(errors="replace")
+        return io.StringIO(text, newline=None)
+
+    @staticmethod
+    def _triangles_on_plane(
+        mesh: "Mesh.MeshArrays",
+        normal: str | tuple[float, float, float],
+        origin: tuple[float, float, float],
+        tol: float,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Collect mesh triangles and tet faces whose nodes all lie on the cut plane.
+
+        Returns ``(phys_ids, tris)`` with ``tris`` of shape ``(K, 3, 3)``. A face
+        shared by two elements of the same physical group is kept once.
+        """
+        if isinstance(normal, str):
+            axis = {"x": 0, "y": 1, "z": 2}[normal]
+            dist = mesh.coords[:, axis] - float(origin[axis])
+        else:
+            dist = (mesh.coords - np.asarray(origin, dtype=float)) @ Mesh._plane_normal(normal)
+        on_plane = np.abs(dist) <= tol
+
+        tri_keep = on_plane[mesh.tris].all(axis=1)
+        faces = [mesh.tris[tri_keep]]
+        phys = [mesh.tri_phys[tri_keep]]
+
+        tet_on_plane = on_plane[mesh.tets]
+        tet_keep = tet_on_plane.sum(axis=1) >= 3
+        if np.any(tet_keep):
+            # (M, 4, 3) node rows of the four faces of every candidate tet
+            tet_faces = mesh.tets[tet_keep][:, Mesh._TET_FACES]
+            face_keep = tet_on_plane[tet_keep][:, Mesh._TET_FACES].all(axis=2)
+            faces.append(tet_faces[face_keep])
+            phys.append(np.repeat(mesh.tet_phys[tet_keep], face_keep.sum(axis=1)))
+
+        faces = np.concatenate(faces)
+        phys = np.concatenate(phys)
+        if len(faces) == 0:
+            return phys, np.zeros((0, 3, 3), dtype=mesh.coords.dtype)
+
+        # stable lexsort keeps the first occurrence of each (phys, face) at the head of its run
+        keys = np.sort(faces, axis=1)
+        order = np.lexsort((keys[:, 2], keys[:, 1], keys[:, 0], phys))
+        keys, sorted_phys = keys[order], phys[order]
+        head = np.ones(len(order), dtype=bool)
+        head[1:] = (keys[1:] != keys[:-1]).any(axis=1) | (sorted_phys[1:] != sorted_phys[:-1])
+        first = np.sort(order[head])
+        return phys[first], mesh.coords[faces[first]]
+
+    @staticmethod
+    def _plane_normal(normal) -> np.ndarray:
+        """Unit normal for ``"x"``, ``"y"``, ``"z"``, or a 3-vector."""
+        if isinstance(normal, str):
+            if normal not in ("x", "y", "z"):
+                raise ValueError("normal must be 'x', 'y', 'z', or a 3-vector")
+            return np.eye(3)[{"x": 0, "y": 1, "z": 2}[normal]]
+        vec = np.asarray(normal, dtype=float)
+        norm = float(np.linalg.norm(vec)) if vec.shape == (3,) else 0.0
+        if norm == 0.0 or not np.isfinite(norm):
+            raise ValueError("normal must be 'x', 'y', 'z', or a nonzero 3-vector")
+        return vec / norm
+
+    @staticmethod
+    def _plane_basis(normal) -> np.ndarray:
+        """``(2, 3)`` in-plane axes; axis-aligned normals keep the ``plot_mesh`` axes."""
+        if isinstance(normal, str):
+            return np.eye(3)[list(Mesh._plane_axes(normal))]
+        unit = Mesh._plane_normal(normal)
+        helper = np.eye(3)[int(np.argmin(np.abs(unit)))]
+        u = np.cross(helper, unit)
+        u /= np.linalg.norm(u)
+        return np.stack([u, np.cross(unit, u)])
+
+    @staticmethod
+    def _sorted_bounds_bins(lo: np.ndarray, hi: np.ndarray) -> tuple:
+        """Group elements by extent class and sort each group by lower bound."""
+        extent_class = np.frexp(hi - lo)[1]
+        order = np.lexsort((lo, extent_class))
+        starts = np.flatnonzero(np.diff(extent_class[order])) + 1
+        bins = []
+        for rows in np.split(order, starts):
+            if len(rows):
+                bins.append((rows, lo[rows], hi[rows], float((hi[rows] - lo[rows]).max())))
+        return tuple(bins)
+
+    @staticmethod
+    def _query_bounds_bins(bins: tuple, offset: float, tol: float) -> np.ndarray:
+        """Rows of elements whose bounds intersect ``[offset - tol, offset + tol]``."""
+        hits = [np.zeros(0, dtype=np.intp)]
+        for rows, lo, hi, max_extent in bins:
+            i0 = np.searchsorted(lo, offset - tol - max_extent, side="left")
+            i1 = np.searchsorted(lo, offset + tol, side="right")
+            hits.append(rows[i0:i1][hi[i0:i1] >= offset - tol])
+        return np.sort(np.concatenate(hits))
+
+    @staticmethod
+    def _build_slice_index(
+        mesh: "Mesh.MeshArrays", attributes: pd.DataFrame, normal
+    ) -> "Mesh.SliceIndex":
+        unit = Mesh._plane_normal(normal)
+        if not isinstance(normal, str):
+            normal = tuple(float(x) for x in normal)
+        height = mesh.coords @ unit
+
+        def bins(conn: np.ndarray) -> tuple:
+            h = height[conn]
+            return Mesh._sorted_bounds_bins(h.min(axis=1), h.max(axis=1)) if len(conn) else ()
+
+        return Mesh.SliceIndex(
+            mesh=mesh,
+            attributes=attributes,
+            normal=normal,
+            unit_normal=unit,
+            basis=Mesh._plane_basis(normal),
+            tri_bins=bins(mesh.tris),
+            tet_bins=bins(mesh.tets),
+        )
+
+    @staticmethod
+    def slice_index(meshfile, normal="z", reader="numpy", cache=True) -> "Mesh.SliceIndex":
+        """
+        Build a reusable index for cutting a mesh with many parallel planes.
+
+        Parameters
+        ----------
+        meshfile : str or Path
+            Path to a ``.msh`` or ``.bdf`` mesh file.
+        normal : str or tuple, optional
+            ``"x"``, ``"y"``, ``"z"`` (default), or any 3-vector.
+        reader : str, optional
+            Mesh reader, as in :meth:`plot_mesh`.
+        cache : bool, optional
+            Use the parsed-mesh cache, as in :meth:`plot_mesh`.
+
+        Returns
+        -------
+        Mesh.SliceIndex
+            Index to pass to :meth:`plot_mesh_slices` in place of the mesh file.
+        """
+        mesh, attributes = Mesh._load_plot_mesh(meshfile, reader, cache)
+        return Mesh._build_slice_index(mesh, attributes, normal)
+
+    @staticmethod
+    def _tet_cross_sections(
+        mesh: "Mesh.MeshArrays",
+        tets: np.ndarray,
+        tet_phys: np.ndarray,
+        unit_normal: np.ndarray,
+        offset: float,
+        tol: float,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Cut tets that straddle the plane ``x . n = offset``.
+
+        Returns ``(phys_ids, polys)`` with ``polys`` of shape ``(K, 4, 3)``;
+        triangular sections repeat their last vertex. Vertices are unordered.
+        """
+        pts = mesh.coords[tets]
+        dist = pts @ unit_normal - offset
+        side = np.where(dist > tol, 1, np.where(dist < -tol, -1, 0))
+        straddle = (side.min(axis=1) < 0) & (side.max(axis=1) > 0)
+        pts, dist, side = pts[straddle], dist[straddle], side[straddle]
+        if len(pts) == 0:
+            return tet_phys[straddle], np.zeros((0, 4, 3))
+
+        a, b = Mesh._TET_EDGES.T
+        crosses = side[:, a] * side[:, b] < 0
+        t = dist[:, a] / np.where(crosses, dist[:, a] - dist[:, b], 1.0)
+        edge_pts = pts[:, a] + t[..., None] * (pts[:, b] - pts[:, a])
+        node_pts = pts - dist[..., None] * unit_normal
+
+        # every straddling tet has 3 or 4 section vertices: nodes in the band
+        # plus edges that change sign
+        candidates = np.concatenate([node_pts, edge_pts], axis=1)
+        valid = np.concatenate([side == 0, crosses], axis=1)
+        first = np.argsort(~valid, axis=1, kind="stable")[:, :4]
+        polys = np.take_along_axis(candidates, first[..., None], axis=1)
+        triangles = valid.sum(axis=1) == 3
+        polys[triangles, 3] = polys[triangles, 2]
+        return tet_phys[straddle], polys
+
+    @staticmethod
+    def _slice_polygons(
+        index: "Mesh.SliceIndex", offset: float, tol: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """In-plane ``(phys_ids, (K, 4, 2) polys)`` of one slice, ordered counterclockwise."""
+        mesh = index.mesh
+        tri_rows = Mesh._query_bounds_bins(index.tri_bins, offset, tol)
+        tet_rows = Mesh._query_bounds_bins(index.tet_bins, offset, tol)
+        candidates = replace(
+            mesh,
+            tris=mesh.tris[tri_rows],
+            tri_phys=mesh.tri_phys[tri_rows],
+            tets=mesh.tets[tet_rows],
+            tet_phys=mesh.tet_phys[tet_rows],
+        )
+
+        origin = offset * index.unit_normal
+        face_phys, faces = Mesh._triangles_on_plane(candidates, index.normal, origin, tol)
+        cut_phys, cuts = Mesh._tet_cross_sections(
+            mesh, candidates.tets, candidates.tet_phys, index.unit_normal, offset, tol
+        )
+
+        faces = np.concatenate([faces, faces[:, 2:]], axis=1)
+        polys = np.concatenate([faces, cuts]) @ index.basis.T
+        rel = polys - polys.mean(axis=1, keepdims=True)
+        order = np.argsort(np.arctan2(rel[..., 1], rel[..., 0]), axis=1)
+        polys = np.take_along_axis(polys, order[..., None], axis=1)
+        return np.concatenate([face_phys, cut_phys]), polys
+
+    @staticmethod
+    def _triangle_area_2d(tri: np.ndarray) -> float | np.ndarray:
+        """Area of a ``(3, 2)`` triangle, or of each triangle in a ``(K, 3, 2)`` stack."""
+        a, b, c = tri[..., 0, :], tri[..., 1, :], tri[..., 2, :]
+        return 0.5 * np.abs(
+            (b[..., 0] - a[..., 0]) * (c[..., 1] - a[..., 1])
+            - (c[..., 0] - a[..., 0]) * (b[..., 1] - a[..., 1])
+        )
+
+    @staticmethod
+    def _polys_overlapping_view(
+        polys: np.ndarray, xmin: float, xmax: float, ymin: float, ymax: float
+    ) -> np.ndarray:
+        """Triangles whose bounding box overlaps the viewport."""
+        lo = polys.min(axis=1)
+        hi = polys.max(axis=1)
+        keep = (hi[:, 0] >= xmin) & (lo[:, 0] <= xmax) & (hi[:, 1] >= ymin) & (lo[:, 1] <= ymax)
+        return polys[keep]
+
+    @staticmethod
+    def _group_outline_path(polys: np.ndarray):
+        """
+        Outline of the union of a group's ``(n, 3, 2)`` triangles as a matplotlib Path.
+
+        Triangles are turned counterclockwise, so edges used by exactly one
+        triangle form the boundary with outer loops counterclockwise and holes
+        clockwise; the nonzero fill rule then leaves the holes empty.
+        """
+        from matplotlib.path import Path as MplPath
+
+        a, b, c = polys[:, 0], polys[:, 1], polys[:, 2]
+        cross = (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (c[:, 0] - a[:, 0]) * (b[:, 1] - a[:, 1])
+        keep = cross != 0
+        polys = np.where((cross[keep] < 0)[:, None, None], polys[keep][:, ::-1], polys[keep])
+        if len(polys) == 0:
+            return MplPath(np.zeros((0, 2)))
+
+        # shared vertices carry bit-identical coordinates; rank x and y
+        # separately so vertex and edge keys are single int64 values
+        pts = polys.reshape(-1, 2) + 0.0
+        _, x_rank = np.unique(pts[:, 0], return_inverse=True)
+        y_vals, y_rank = np.unique(pts[:, 1], return_inverse=True)
+        vert_keys, first_pt, ids = np.unique(
+            x_rank.astype(np.int64) * len(y_vals) + y_rank, return_index=True, return_inverse=True
+        )
+        verts = pts[first_pt]
+        ids = ids.reshape(-1, 3)
+        edges = np.concatenate([ids[:, [0, 1]], ids[:, [1, 2]], ids[:, [2, 0]]])
+        edge_keys = edges.min(axis=1).astype(np.int64) * len(verts) + edges.max(axis=1)
+        _, first, counts = np.unique(edge_keys, return_index=True, return_counts=True)
+        boundary = edges[first[counts == 1]]
+        boundary = boundary[np.argsort(boundary[:, 0], kind="stable")]
+        # outgoing boundary edges of vertex v are boundary[out[v]:out[v + 1]]
+        out = np.searchsorted(boundary[:, 0], np.arange(len(verts) + 1))
+        tails = boundary[:, 1].tolist()
+        next_free = out[:-1].tolist()
+        out = out.tolist()
+        used = [False] * len(boundary)
+
+        loops = []
+        for start_edge in range(len(boundary)):
+            if used[start_edge]:
+                continue
+            start = int(boundary[start_edge, 0])
+            loop = [start]
+            edge = start_edge
+            while True:
+                used[edge] = True
+                v = tails[edge]
+                if v == start:
+                    break
+                loop.append(v)
+                k = next_free[v]
+                while k < out[v + 1] and used[k]:
+                    k += 1
+                if k == out[v + 1]:
+                    break
+                next_free[v] = k + 1
+                edge = k
+            if len(loop) >= 3:
+                loops.append(loop)
+        if not loops:
+            return MplPath(np.zeros((0, 2)))
+
+        vertices = np.concatenate([verts[loop + [loop[0]]] for loop in loops])
+        codes = np.full(len(vertices), MplPath.LINETO, dtype=MplPath.code_type)
+        ends = np.cumsum([len(loop) + 1 for loop in loops])
+        codes[ends - 1] = MplPath.CLOSEPOLY
+        codes[np.concatenate([[0], ends[:-1]])] = MplPath.MOVETO
+        return MplPath(vertices, codes)
+
+    @staticmethod
+    def _label_anchor_for_polys(polys: np.ndarray) -> np.ndarray:
+        """Anchor labels on the largest face in a physical group."""
+        polys = np.asarray(polys)
+        areas = Mesh._triangle_area_2d(polys)
+        return polys[int(np.argmax(areas))].mean(axis=0)
+
+    @staticmethod
+    def _ray_extent_from_point(
+        px: float | np.ndarray,
+        py: float | np.ndarray,
+        ux: float | np.ndarray,
+        uy: float | np.ndarray,
+        xmin: float,
+        xmax: float,
+        ymin: float,
+        ymax: float,
+    ) -> float | np.ndarray:
+        """Distance from points to the plot boundary along unit directions."""
+        px, py, ux, uy = np.broadcast_arrays(
+            *(np.asarray(v, dtype=float) for v in (px, py, ux, uy))
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tx = np.where(
+                ux > 1e-12, (xmax - px) / ux, np.where(ux < -1e-12, (xmin - px) / ux, np.inf)
+            )
+            ty = np.where(
+                uy > 1e-12, (ymax - py) / uy, np.where(uy < -1e-12, (ymin - py) / uy, np.inf)
+            )
+        t = np.minimum(np.where(tx > 1e-9, tx, np.inf), np.where(ty > 1e-9, ty, np.inf))
+        t = np.where(np.isfinite(t), t, max(xmax - xmin, ymax - ymin, 1e-9) * 0.5)
+        return float(t) if t.ndim == 0 else t
+
+    @staticmethod
+    def _callout_label_position(
+        anchor: np.ndarray,
+        center: np.ndarray,
+        xmin: float,
+        xmax: float,
+        ymin: float,
+        ymax: float,
+    ) -> np.ndarray:
+        """Place callout labels inside the mesh bounds, away from their ``(2,)`` or ``(n, 2)`` anchors."""
+        span = max(xmax - xmin, ymax - ymin, 1e-9)
+        inset = 0.035 * span
+
+        anchor = np.asarray(anchor, dtype=float)
+        ax, ay = np.atleast_2d(anchor).T
+        cx, cy = float(center[0]), float(center[1])
+        dx, dy = ax - cx, ay - cy
+        norm = np.hypot(dx, dy)
+        near = norm < 0.05 * span
+        dx = np.where(near, 0.0, dx)
+        dy = np.where(near, np.where(ay >= cy, 1.0, -1.0), dy)
+        norm = np.where(near, 1.0, norm)
+        ux, uy = dx / norm, dy / norm
+
+        t_edge = Mesh._ray_extent_from_point(ax, ay, ux, uy, xmin, xmax, ymin, ymax)
+        offset = np.clip(0.22 * t_edge, 0.10 * span, 0.28 * t_edge)
+        pos = np.column_stack([ax + ux * offset, ay + uy * offset])
+        pos[:, 0] = np.clip(pos[:, 0], xmin + inset, xmax - inset)
+        pos[:, 1] = np.clip(pos[:, 1], ymin + inset, ymax - inset)
+        return pos.reshape(anchor.shape)
+
+    @staticmethod
+    def _initial_callout_positions(
+        anchors: np.ndarray,
+        center: np.ndarray,
+        bounds: tuple[float, float, float, float],
+    ) -> np.ndarray:
+        """Build starting callout positions, fanning out labels near the mesh center."""
+        xmin, xmax, ymin, ymax = bounds
+        span = max(xmax - xmin, ymax - ymin, 1e-9)
+        inset = 0.035 * span
+        xmin_i, xmax_i = xmin + inset, xmax - inset
+        ymin_i, ymax_i = ymin + inset, ymax - inset
+
+        positions = Mesh._callout_label_position(anchors, center, xmin, xmax, ymin, ymax)
+
+        center_dists = np.linalg.norm(anchors - center, axis=1)
+        near_idx = np.flatnonzero(center_dists < 0.15 * span)
+        if len(near_idx) > 1:
+            angles = np.linspace(np.pi / 4.0, 3.0 * np.pi / 4.0, len(near_idx))
+            offset = 0.16 * span
+            positions[near_idx] = anchors[near_idx] + offset * np.column_stack(
+                [np.cos(angles), np.sin(angles)]
+            )
+
+        positions[:, 0] = np.clip(positions[:, 0], xmin_i, xmax_i)
+        positions[:, 1] = np.clip(positions[:, 1], ymin_i, ymax_i)
+        return positions
+
+    @staticmethod
+    def _spread_label_positions(
+        initial: np.ndarray,
+        texts: list[str],
+        xspan: float,
+        yspan: float,
+        bounds: tuple[float, float, float, float],
+        fontsize: float = 8,
+        n_iter: int = 160,
+    ) -> np.ndarray:
+        """
+        Separate labels that are too close, keeping them inside the mesh bounds.
+
+        Each pass finds overlapping pairs with a KD-tree and applies all pushes
+        at once; iteration stops early once no label moves appreciably.
+        """
+        from scipy.spatial import cKDTree
+
+        n = len(texts)
+        xmin, xmax, ymin, ymax = bounds
+        if n <= 1:
+            return initial.copy()
+
+        span = max(xspan, yspan, 1e-9)
+        inset = 0.035 * span
+        xmin_i, xmax_i = xmin + inset, xmax - inset
+        ymin_i, ymax_i = ymin + inset, ymax - inset
+
+        pos = initial.astype(float).copy()
+        preferred = pos.copy()
+
+        char_w = span * 0.011 * (fontsize / 8.0)
+        char_h = span * 0.028 * (fontsize / 8.0)
+        half_sizes = np.array([[0.5 * len(t) * char_w, 0.5 * char_h] for t in texts])
+
+        def clip_positions(points: np.ndarray) -> np.ndarray:
+            points[:, 0] = np.clip(points[:, 0], xmin_i, xmax_i)
+            points[:, 1] = np.clip(points[:, 1], ymin_i, ymax_i)
+            return points
+
+        max_drift = 0.30 * span
+        # no pair of labels interacts beyond this distance
+        reach = float(
+            np.hypot(2.0 * half_sizes[:, 0].max(), 2.0 * half_sizes[:, 1].max()) + 0.04 * span
+        )
+
+        for _ in range(n_iter):
+            previous = pos.copy()
+            pairs = cKDTree(pos).query_pairs(reach, output_type="ndarray")
+            if len(pairs):
+                i, j = pairs[:, 0], pairs[:, 1]
+                delta = pos[j] - pos[i]
+                dist = np.hypot(delta[:, 0], delta[:, 1])
+                min_dist = (
+                    np.hypot(
+                        half_sizes[i, 0] + half_sizes[j, 0],
+                        half_sizes[i, 1] + half_sizes[j, 1],
+                    )
+                    + 0.04 * span
+                )
+                close = dist < min_dist
+                i, j, delta, dist, min_dist = (
+                    v[close] for v in (i, j, delta, dist, min_dist)
+                )
+
+                # coincident labels are pushed apart vertically
+                coincident = dist <= 1e-9
+                push = np.where(
+                    coincident, 0.70 * min_dist / 2.0, 0.70 * (min_dist - dist) / 2.0
+                )
+                direction = np.where(
+                    coincident[:, None],
+                    np.array([0.0, 1.0]),
+                    delta / np.where(coincident, 1.0, dist)[:, None],
+                )
+                step = push[:, None] * direction
+                for axis in (0, 1):
+                    pos[:, axis] += np.bincount(j, step[:, axis], minlength=n) - np.bincount(
+                        i, step[:, axis], minlength=n
+                    )
+
+            drift = pos - preferred
+            drift_dist = np.linalg.norm(drift, axis=1)
+            over = drift_dist > max_drift
+            if np.any(over):
+                pos[over] = preferred[over] + drift[over] * (
+                    max_drift / drift_dist[over, None]
+                )
+
+            pos += 0.08 * (preferred - pos)
             clip_positions(pos)
+            if np.max(np.abs(pos - previous)) < 1e-4 * span:
+                break
 
         return pos
 
     @staticmethod
     def _plot_mesh_component_bounds(
-        groups: dict[int, list[np.ndarray]],
+        groups: dict[int, np.ndarray],
         name_to_phys: dict[str, int],
         component: str | list[str],
         pad_frac: float = 0.1,
@@ -517,8 +1857,8 @@ class Mesh:
                 )
             phys_ids.append(name_to_phys[name])
 
-        pts = np.vstack(
-            [tri for pid in phys_ids for tri in groups[pid]]
+        pts = np.concatenate(
+            [groups[pid].reshape(-1, 2) for pid in phys_ids if pid in groups]
         )
         xmin = float(pts[:, 0].min())
         xmax = float(pts[:, 0].max())
@@ -529,23 +1869,21 @@ class Mesh:
 
     @staticmethod
     def _group_in_view(
-        polys: list[np.ndarray],
+        polys: np.ndarray,
         xmin: float,
         xmax: float,
         ymin: float,
         ymax: float,
     ) -> bool:
         """Return True if any triangle from the group lies inside the viewport."""
-        for tri in polys:
-            inside = (
-                (tri[:, 0] >= xmin)
-                & (tri[:, 0] <= xmax)
-                & (tri[:, 1] >= ymin)
-                & (tri[:, 1] <= ymax)
-            )
-            if np.any(inside):
-                return True
-        return False
+        pts = np.asarray(polys).reshape(-1, 2)
+        inside = (
+            (pts[:, 0] >= xmin)
+            & (pts[:, 0] <= xmax)
+            & (pts[:, 1] >= ymin)
+            & (pts[:, 1] <= ymax)
+        )
+        return bool(np.any(inside))
 
     @staticmethod
     def _plot_mesh_crop_bounds(
@@ -573,6 +1911,23 @@ class Mesh:
             min(ymax, fymax),
         )
 
+    @staticmethod
+    def _load_plot_mesh(meshfile, reader: str, cache: bool):
+        """``(MeshArrays, attributes)`` for the plotting entry points."""
+        if reader not in ("numpy", "python"):
+            raise ValueError("reader must be 'numpy' or 'python'")
+
+        meshfile = Path(meshfile)
+        filetype = Mesh._mesh_filetype(meshfile)
+        if reader == "numpy":
+            return Mesh._load_mesh_arrays(meshfile, cache=cache)
+
+        if filetype == ".msh":
+            records = Mesh._read_msh_for_plot(meshfile)
+        else:
+            records = Mesh._read_bdf_for_plot(meshfile)
+        return Mesh._mesh_arrays_from_records(*records), Mesh.get_mesh_attributes(meshfile)
+
     @staticmethod
     def plot_mesh(
         meshfile,
@@ -584,6 +1939,10 @@ class Mesh:
         crop=None,
         show=True,
         save=None,
+        reader="numpy",
+        cache=True,
+        lod="auto",
+        lod_threshold=50000,
     ):
         """
         Plot a 2D cut through a Palace mesh, colored by physical attribute.
@@ -614,30 +1973,52 @@ class Mesh:
             If True (default), display the plot.
         save : str or None, optional
             If set, save the figure to this path.
+        reader : str, optional
+            ``"numpy"`` (default) block-parses the mesh into arrays: MSH 2.2
+            and 4.1 (ASCII or binary), and fixed-width ``.bdf`` cards.
+            ``"python"`` uses the original line-by-line readers (ASCII MSH 2.2
+            and ``.bdf``).
+        cache : bool, optional
+            If True (default) and ``reader="numpy"``, keep the parsed arrays in
+            a ``.<meshfile>.pypalace.npz`` sidecar next to the mesh and in
+            memory, so repeated plots skip parsing. The sidecar is reused while
+            the mesh contents are unchanged; ``Mesh.clear_mesh_cache`` removes
+            it. Sidecars are evicted least-recently-used once they exceed the
+            disk budget, tracked in ``$PYPALACE_CACHE_DIR`` (default
+            ``~/.cache/pypalace``).
+        lod : str, optional
+            Level of detail. ``"full"`` draws every triangle with its edges.
+            ``"outline"`` merges each physical group into filled, rasterized
+            outlines, and overlays element edges only when zoomed in with
+            ``crop`` or ``zoom_to_component`` and at most ``lod_threshold``
+            triangles are in view. ``"auto"`` (default) picks ``"full"`` when
+            the triangles in view number at most ``lod_threshold``.
+        lod_threshold : int, optional
+            Triangle count in view above which ``"auto"`` switches to outlines.
+            Default is 50000.
         """
         import matplotlib.pyplot as plt
         from matplotlib.collections import PolyCollection
+        from matplotlib.patches import PathPatch
 
-        meshfile = Path(meshfile)
-        filetype = Mesh._mesh_filetype(meshfile)
+        if lod not in ("auto", "full", "outline"):
+            raise ValueError("lod must be 'auto', 'full', or 'outline'")
 
-        if filetype == ".msh":
-            nodes, tris, tets = Mesh._read_msh_for_plot(meshfile)
-        else:
-            nodes, tris, tets = Mesh._read_bdf_for_plot(meshfile)
+        meshfile = Path(meshfile)
+        mesh_arrays, attr_df = Mesh._load_plot_mesh(meshfile, reader, cache)
+        coords = mesh_arrays.coords
 
-        if not nodes:
+        if len(coords) == 0:
             raise ValueError(f"No nodes found in mesh file {meshfile}")
 
-        coords = np.asarray(list(nodes.values()), dtype=float)
         span = float(np.max(coords.max(axis=0) - coords.min(axis=0)))
         if tol == None:
             tol = max(1e-9, 1e-3 * span)
 
         origin = tuple(float(x) for x in origin)
-        sliced = Mesh._triangles_on_plane(nodes, tris, tets, normal, origin, tol)
+        sliced_phys, sliced_tris = Mesh._triangles_on_plane(mesh_arrays, normal, origin, tol)
 
-        if not sliced:
+        if len(sliced_phys) == 0:
             axis = {"x": 0, "y": 1, "z": 2}[normal]
             raise ValueError(
                 f"No mesh faces found on the cut plane {normal}={origin[axis]:g} "
@@ -645,17 +2026,22 @@ class Mesh:
             )
 
         i_ax, j_ax = Mesh._plane_axes(normal)
-        attr_df = Mesh.get_mesh_attributes(str(meshfile))
         id_to_name = {
             str(row.ID): str(row.Name) for _, row in attr_df.iterrows()
         }
         name_to_phys = {name: int(pid) for pid, name in id_to_name.items()}
 
-        groups: dict[int, list[np.ndarray]] = defaultdict(list)
-        for phys, tri in sliced:
-            groups[int(phys)].append(tri[:, [i_ax, j_ax]])
+        # (K, 3, 2) in-plane triangles, split into one contiguous block per group
+        order = np.argsort(sliced_phys, kind="stable")
+        tris_2d = sliced_tris[order][:, :, [i_ax, j_ax]]
+        phys_sorted = sliced_phys[order]
+        group_ids, group_starts = np.unique(phys_sorted, return_index=True)
+        groups: dict[int, np.ndarray] = {
+            int(phys): block
+            for phys, block in zip(group_ids, np.split(tris_2d, group_starts[1:]))
+        }
 
-        all_pts = np.vstack([tri[:, [i_ax, j_ax]] for _, tri in sliced])
+        all_pts = tris_2d.reshape(-1, 2)
         full_xmin = float(all_pts[:, 0].min())
         full_xmax = float(all_pts[:, 0].max())
         full_ymin = float(all_pts[:, 1].min())
@@ -686,18 +2072,52 @@ class Mesh:
         phys_ids = sorted(groups.keys())
         label_specs: list[tuple[np.ndarray, str]] = []
 
+        # only triangles overlapping the viewport are drawn as polygons
+        zoomed = zoom_to_component != None or crop != None
+        visible = {
+            phys: Mesh._polys_overlapping_view(groups[phys], xmin, xmax, ymin, ymax)
+            if zoomed
+            else groups[phys]
+            for phys in phys_ids
+        }
+        n_visible = sum(len(polys) for polys in visible.values())
+        outline = lod == "outline" or (lod == "auto" and n_visible > lod_threshold)
+
         for idx, phys in enumerate(phys_ids):
             polys = groups[phys]
             color = colors[idx % len(colors)]
-            ax.add_collection(
-                PolyCollection(
-                    polys,
-                    facecolors=[color],
-                    edgecolors="0.25",
-                    linewidths=0.15,
-                    alpha=0.88,
+            if outline:
+                # add_artist skips the per-segment data-limit update of add_patch;
+                # the limits are set from the viewport below
+                ax.add_artist(
+                    PathPatch(
+                        Mesh._group_outline_path(polys),
+                        facecolor=color,
+                        edgecolor="0.25",
+                        linewidth=0.15,
+                        alpha=0.88,
+                        rasterized=True,
+                    )
+                )
+                if zoomed and n_visible <= lod_threshold:
+                    ax.add_collection(
+                        PolyCollection(
+                            visible[phys],
+                            facecolors="none",
+                            edgecolors="0.25",
+                            linewidths=0.15,
+                        )
+                    )
+            else:
+                ax.add_collection(
+                    PolyCollection(
+                        visible[phys],
+                        facecolors=[color],
+                        edgecolors="0.25",
+                        linewidths=0.15,
+                        alpha=0.88,
+                    )
                 )
-            )
 
             if labeling == True:
                 label = id_to_name.get(str(phys), f"ID {phys}")
@@ -779,33 +2199,206 @@ class Mesh:
             plt.close(fig)
 
     @staticmethod
-    def _parse_qmetal_length(value: Any, design: Any) -> float:
-        """Parse a Qiskit Metal length into design units (mm by default)."""
-        if value is None or (isinstance(value, float) and np.isnan(value)):
-            raise ValueError("Missing length value for path geometry.")
+    def plot_mesh_slices(
+        meshfile,
+        origins,
+        normal="z",
+        tol=None,
+        ncols=3,
+        legend=True,
+        frames=None,
+        show=True,
+        save=None,
+        reader="numpy",
+        cache=True,
+    ):
+        """
+        Plot many parallel cuts through a Palace mesh from one spatial index.
 
-        if isinstance(value, (int, float, np.floating, np.integer)):
-            return float(value)
+        Each cut shows the mesh faces lying in the plane and the cross-sections
+        of the tets it passes through, colored by physical attribute. Colors
+        are consistent across cuts.
 
-        text = str(value).strip().lower().replace(" ", "")
-        text = text.replace("μm", "um").replace("µm", "um")
+        Parameters
+        ----------
+        meshfile : str, Path or Mesh.SliceIndex
+            Path to a ``.msh`` or ``.bdf`` mesh file, or an index from
+            :meth:`slice_index` to reuse across calls. The index is rebuilt if
+            it was made for a different normal.
+        origins : sequence
+            Cut positions. Each is a point ``(x, y, z)`` on the plane, or a
+            scalar offset along the normal (the coordinate itself for ``"x"``,
+            ``"y"``, ``"z"``).
+        normal : str or tuple, optional
+            ``"x"``, ``"y"``, ``"z"`` (default), or any 3-vector.
+        tol : float or None, optional
+            Distance from the plane within which nodes count as on it.
+            Default is ``1e-3`` times the mesh bounding-box span.
+        ncols : int, optional
+            Columns of the subplot grid. Default is 3.
+        legend : bool, optional
+            If True (default), add a legend of attribute names.
+        frames : str or Path or None, optional
+            If set, write one ``slice_###.png`` per cut into this directory
+            instead of drawing a grid; ``show`` and ``save`` are ignored.
+        show : bool, optional
+            If True (default), display the grid.
+        save : str or None, optional
+            If set, save the grid figure to this path.
+        reader, cache : optional
+            Mesh reader and parsed-mesh cache, as in :meth:`plot_mesh`.
 
-        suffixes = {
-            "m": 1.0,
-            "meter": 1.0,
-            "meters": 1.0,
-            "mm": 1e-3,
-            "millimeter": 1e-3,
-            "millimeters": 1e-3,
-            "um": 1e-6,
-            "micron": 1e-6,
-            "microns": 1e-6,
-            "nm": 1e-9,
-            "nanometer": 1e-9,
-            "nanometers": 1e-9,
-        }
+        Returns
+        -------
+        list of Path or None
+            Paths of the written frames when ``frames`` is set.
+        """
+        import matplotlib.pyplot as plt
+        from matplotlib.collections import PolyCollection
+        from matplotlib.patches import Patch
 
-        for suffix, meters_per_unit in sorted(
+        if isinstance(meshfile, Mesh.SliceIndex):
+            index = meshfile
+            if not np.allclose(index.unit_normal, Mesh._plane_normal(normal)) or (
+                isinstance(normal, str) != isinstance(index.normal, str)
+            ):
+                index = Mesh._build_slice_index(index.mesh, index.attributes, normal)
+        else:
+            index = Mesh.slice_index(meshfile, normal=normal, reader=reader, cache=cache)
+
+        coords = index.mesh.coords
+        if len(coords) == 0:
+            raise ValueError("No nodes found in mesh")
+        if tol == None:
+            span = float(np.max(coords.max(axis=0) - coords.min(axis=0)))
+            tol = max(1e-9, 1e-3 * span)
+
+        offsets = [
+            float(np.dot(np.asarray(origin, dtype=float), index.unit_normal))
+            if np.ndim(origin)
+            else float(origin)
+            for origin in origins
+        ]
+        if not offsets:
+            raise ValueError("origins must contain at least one cut position")
+
+        slices = [Mesh._slice_polygons(index, offset, tol) for offset in offsets]
+        if all(len(phys) == 0 for phys, _ in slices):
+            raise ValueError(
+                f"No mesh faces found on any cut plane (tol={tol:g}). "
+                "Try adjusting origins or tol."
+            )
+
+        id_to_name = {
+            str(row.ID): str(row.Name) for _, row in index.attributes.iterrows()
+        }
+        all_phys = sorted(set(np.concatenate([phys for phys, _ in slices]).tolist()))
+        colors = Mesh._PLOT_MESH_COLORS
+        phys_color = {phys: colors[idx % len(colors)] for idx, phys in enumerate(all_phys)}
+
+        if isinstance(index.normal, str):
+            i_ax, j_ax = Mesh._plane_axes(index.normal)
+            xlabel, ylabel = ["x", "y", "z"][i_ax], ["x", "y", "z"][j_ax]
+            title_key = index.normal
+        else:
+            xlabel, ylabel = "u", "v"
+            title_key = "n·r"
+
+        def draw(ax, phys_ids, polys, offset):
+            ax.set_title(f"{title_key} = {offset:g}", fontsize=9)
+            ax.set_xlabel(xlabel)
+            ax.set_ylabel(ylabel)
+            if len(phys_ids) == 0:
+                ax.text(0.5, 0.5, "no elements", ha="center", va="center", transform=ax.transAxes)
+                return
+            for phys in np.unique(phys_ids):
+                ax.add_collection(
+                    PolyCollection(
+                        polys[phys_ids == phys],
+                        facecolors=[phys_color[int(phys)]],
+                        edgecolors="0.25",
+                        linewidths=0.15,
+                        alpha=0.88,
+                    )
+                )
+            pts = polys.reshape(-1, 2)
+            ax.set_xlim(pts[:, 0].min(), pts[:, 0].max())
+            ax.set_ylim(pts[:, 1].min(), pts[:, 1].max())
+            ax.set_aspect("equal", adjustable="box")
+
+        def add_legend(target, phys_present, anchor):
+            if legend != True:
+                return
+            handles = [
+                Patch(
+                    facecolor=phys_color[phys],
+                    edgecolor="0.25",
+                    label=id_to_name.get(str(phys), f"ID {phys}"),
+                )
+                for phys in all_phys
+                if phys in phys_present
+            ]
+            target.legend(handles=handles, loc="center left", bbox_to_anchor=anchor, fontsize=8)
+
+        if frames != None:
+            frames = Path(frames)
+            frames.mkdir(parents=True, exist_ok=True)
+            written = []
+            for k, ((phys_ids, polys), offset) in enumerate(zip(slices, offsets)):
+                fig, ax = plt.subplots()
+                draw(ax, phys_ids, polys, offset)
+                add_legend(ax, set(phys_ids.tolist()), (1.02, 0.5))
+                path = frames / f"slice_{k:03d}.png"
+                fig.savefig(path, bbox_inches="tight")
+                plt.close(fig)
+                written.append(path)
+            return written
+
+        ncols = max(1, min(int(ncols), len(slices)))
+        nrows = math.ceil(len(slices) / ncols)
+        fig, axes = plt.subplots(nrows, ncols, figsize=(4 * ncols, 3.5 * nrows), squeeze=False)
+        for ax, (phys_ids, polys), offset in zip(axes.flat, slices, offsets):
+            draw(ax, phys_ids, polys, offset)
+        for ax in axes.flat[len(slices):]:
+            ax.set_axis_off()
+        fig.tight_layout()
+        add_legend(fig, set(all_phys), (1.0, 0.5))
+
+        if save != None:
+            fig.savefig(save, bbox_inches="tight")
+        if show == True:
+            plt.show()
+        else:
+            plt.close(fig)
+
+    @staticmethod
+    def _parse_qmetal_length(value: Any, design: Any) -> float:
+        """Parse a Qiskit Metal length into design units (mm by default)."""
+        if value is None or (isinstance(value, float) and np.isnan(value)):
+            raise ValueError("Missing length value for path geometry.")
+
+        if isinstance(value, (int, float, np.floating, np.integer)):
+            return float(value)
+
+        text = str(value).strip().lower().replace(" ", "")
+        text = text.replace("μm", "um").replace("µm", "um")
+
+        suffixes = {
+            "m": 1.0,
+            "meter": 1.0,
+            "meters": 1.0,
+            "mm": 1e-3,
+            "millimeter": 1e-3,
+            "millimeters": 1e-3,
+            "um": 1e-6,
+            "micron": 1e-6,
+            "microns": 1e-6,
+            "nm": 1e-9,
+            "nanometer": 1e-9,
+            "nanometers": 1e-9,
+        }
+
+        for suffix, meters_per_unit in sorted(
             suffixes.items(), key=lambda item: len(item[0]), reverse=True
         ):
             if text.endswith(suffix):
@@ -834,6 +2427,8 @@ class Mesh:
         resolution: int = 16,
     ) -> LineString:
         """Round path corners the same way QM's MPL renderer does."""
+        from shapely.geometry import LineString
+
         if fillet <= 0 or line.is_empty or len(line.coords) <= 2:
             return line
 
@@ -864,6 +2459,8 @@ class Mesh:
         path_resolution: int = 16,
     ) -> list[Polygon]:
         """Buffer a QM path centerline into imprintable polygon sheet(s)."""
+        from shapely.geometry import CAP_STYLE, JOIN_STYLE, MultiPolygon, Polygon
+
         if width <= 0:
             raise ValueError(f"Path width must be positive, got {width!r}.")
 
@@ -1006,6 +2603,49 @@ class Mesh:
         smooth_angle_deg: float = 35.0
         max_deviation: float | None = None
 
+    @dataclass(frozen=True)
+    class MeshPerformanceProfile:
+        """Gmsh 3D algorithm, threading, and stage-timing report for QM meshing."""
+
+        algorithm_3d: str | int = "delaunay"
+        num_threads: int = 1
+        threads_1d: int = 0
+        threads_2d: int = 0
+        threads_3d: int = 0
+        report_timings: bool = True
+
+    _ALGORITHMS_3D = {"delaunay": 1, "frontal": 4, "hxt": 10}
+
+    @staticmethod
+    def _resolve_mesh_performance(
+        performance: "Mesh.MeshPerformanceProfile | str | None",
+    ) -> "Mesh.MeshPerformanceProfile | None":
+        """Turn a preset name into a profile and the 3D algorithm name into its Gmsh number."""
+        if performance == None:
+            return None
+        if isinstance(performance, str):
+            presets = {
+                "default": Mesh.MeshPerformanceProfile(),
+                "hxt": Mesh.MeshPerformanceProfile(
+                    algorithm_3d="hxt", num_threads=len(_usable_cpus())
+                ),
+            }
+            if performance not in presets:
+                raise ValueError(
+                    f"Unknown performance preset {performance!r}; expected one of "
+                    f"{sorted(presets)} or a Mesh.MeshPerformanceProfile."
+                )
+            performance = presets[performance]
+        algorithm = performance.algorithm_3d
+        if isinstance(algorithm, str):
+            if algorithm.lower() not in Mesh._ALGORITHMS_3D:
+                raise ValueError(
+                    f"Unknown algorithm_3d {algorithm!r}; expected one of "
+                    f"{sorted(Mesh._ALGORITHMS_3D)} or a Gmsh Mesh.Algorithm3D number."
+                )
+            algorithm = Mesh._ALGORITHMS_3D[algorithm.lower()]
+        return replace(performance, algorithm_3d=int(algorithm))
+
     @staticmethod
     def _resolve_boundary_simplify_settings(
         settings: "Mesh.BoundarySimplifySettings",
@@ -1110,6 +2750,8 @@ class Mesh:
             return 0.0
         if Mesh._is_colinear_chain(chain):
             return 0.0
+        from shapely.geometry import LineString, Point
+
         chord = LineString([chain[0], chain[-1]])
         return max(Point(xy).distance(chord) for xy in chain[1:-1])
 
@@ -1251,6 +2893,7 @@ class Mesh:
         finest_surface_mesh_size: float | None = None,
         mesh_scale: float = 1.0,
         simplify_stats: dict[str, int] | None = None,
+        cut_lines: tuple[tuple[int, float], ...] = (),
     ) -> int:
         if scaled_surface_mesh_size is None:
             scaled_surface_mesh_size = lc
@@ -1276,6 +2919,23 @@ class Mesh:
                     finest_surface_mesh_size=finest_surface_mesh_size,
                 )
                 chains = Mesh._decompose_ring_to_chains(ring, settings)
+                if cut_lines:
+                    # tile cuts: keep plain edges near a cut so both tiles see the
+                    # same straight crossing segments
+                    chains = [
+                        piece
+                        for chain in chains
+                        for piece in (
+                            [[a, b] for a, b in zip(chain[:-1], chain[1:])]
+                            if len(chain) > 2
+                            and any(
+                                abs(point[axis] - value) <= settings.cluster_span
+                                for point in chain
+                                for axis, value in cut_lines
+                            )
+                            else [chain]
+                        )
+                    ]
                 if not Mesh._ring_chains_are_closed(chains, tol=ring_tol):
                     chains = [
                         [ring[i], ring[(i + 1) % len(ring)]]
@@ -1319,6 +2979,8 @@ class Mesh:
         to polygons before meshing. Returns QM-native columns, including
         ``component`` (internal component ID).
         """
+        from shapely.geometry import MultiPolygon
+
         tables = design.qgeometry.tables
         poly_df = tables["poly"].copy() if "poly" in tables else pd.DataFrame()
         path_df = tables["path"].copy() if "path" in tables else pd.DataFrame()
@@ -1413,53 +3075,1288 @@ class Mesh:
                 columns=["component_id", "component_name", "name", "subtract"]
             )
 
-        id_to_name = Mesh._qmetal_component_id_to_name(design)
+        id_to_name = Mesh._qmetal_component_id_to_name(design)
+
+        friendly = pd.DataFrame(
+            {
+                "component_id": surfaces["component"].astype(int),
+                "component_name": surfaces["component"].astype(int).map(id_to_name),
+                "name": surfaces["name"].astype(str),
+                "subtract": surfaces["subtract"].astype(bool),
+            }
+        )
+        return friendly
+
+
+    def _qmetal_design_unit_to_meters(design: Any) -> float:
+        """Return meters per Qiskit Metal design unit.
+
+        Qiskit Metal defaults to millimeters. This helper keeps unit handling out of
+        the public API while still supporting common non-default design units.
+        """
+
+        if hasattr(design, "get_units"):
+            unit = design.get_units()
+        else:
+            unit = getattr(design, "units", "mm")
+
+        unit = str(unit).strip().lower()
+        unit = {"μm": "um", "µm": "um"}.get(unit, unit)
+        unit_to_meters = {
+            "m": 1.0,
+            "meter": 1.0,
+            "meters": 1.0,
+            "mm": 1.0e-3,
+            "millimeter": 1.0e-3,
+            "millimeters": 1.0e-3,
+            "um": 1.0e-6,
+            "micron": 1.0e-6,
+            "microns": 1.0e-6,
+            "nm": 1.0e-9,
+            "nanometer": 1.0e-9,
+            "nanometers": 1.0e-9,
+        }
+        if unit not in unit_to_meters:
+            raise ValueError(
+                f"Unsupported Qiskit Metal design units {unit!r}. "
+                "Expected one of: m, mm, um, nm."
+            )
+        return unit_to_meters[unit]
+
+    @staticmethod
+    def _gmsh_add_size_fields(
+        gmsh: Any,
+        size_to_faces: Mapping[float, set[int]],
+        volume_mesh_size: float,
+        refinement_radius: float,
+    ) -> None:
+        """Grade the background size from each face set's size up to the volume size."""
+        mesh_fields: list[int] = []
+        for size_min, faces in size_to_faces.items():
+            if not faces:
+                continue
+            dist_field = gmsh.model.mesh.field.add("Distance")
+            gmsh.model.mesh.field.setNumbers(
+                dist_field, "SurfacesList", sorted(faces)
+            )
+            gmsh.model.mesh.field.setNumber(dist_field, "Sampling", 100)
+
+            thresh_field = gmsh.model.mesh.field.add("Threshold")
+            gmsh.model.mesh.field.setNumber(thresh_field, "InField", dist_field)
+            gmsh.model.mesh.field.setNumber(thresh_field, "SizeMin", size_min)
+            gmsh.model.mesh.field.setNumber(
+                thresh_field, "SizeMax", volume_mesh_size
+            )
+            gmsh.model.mesh.field.setNumber(thresh_field, "DistMin", 0.0)
+            gmsh.model.mesh.field.setNumber(
+                thresh_field, "DistMax", refinement_radius
+            )
+            mesh_fields.append(thresh_field)
+
+        if len(mesh_fields) == 1:
+            gmsh.model.mesh.field.setAsBackgroundMesh(mesh_fields[0])
+        elif len(mesh_fields) > 1:
+            min_field = gmsh.model.mesh.field.add("Min")
+            gmsh.model.mesh.field.setNumbers(
+                min_field, "FieldsList", mesh_fields
+            )
+            gmsh.model.mesh.field.setAsBackgroundMesh(min_field)
+
+    @staticmethod
+    def _gmsh_add_sizing_surfaces(
+        gmsh: Any,
+        sources: list[tuple[float, float, Polygon]],
+        size_to_faces: dict[float, set[int]],
+    ) -> None:
+        """Add hidden ``(size, z, polygon)`` surfaces that only feed the size fields."""
+        added: list[tuple[int, int]] = []
+        for size, z, polygon in sources:
+            try:
+                tag = Mesh._gmsh_add_polygon_surface(gmsh, polygon, z, size)
+            except ValueError:
+                continue
+            size_to_faces[size].add(tag)
+            added.append((2, tag))
+        gmsh.model.occ.synchronize()
+        if added:
+            gmsh.model.setVisibility(added, 0, recursive=True)
+            gmsh.option.setNumber("Mesh.MeshOnlyVisible", 1)
+
+    @staticmethod
+    def _qm_region_size_sources(
+        job: Mapping[str, Any],
+        polygons: list[dict[str, Any]],
+        region: Polygon,
+    ) -> list[tuple[float, float, Polygon]]:
+        """Record pieces inside ``region`` as sizing sources, sized like their faces would be."""
+        import shapely
+
+        sources: list[tuple[float, float, Polygon]] = []
+        pieces = shapely.intersection([record["polygon"] for record in polygons], region)
+        for record, piece in zip(polygons, pieces):
+            size = (
+                job["attr_mesh_sizes"][record["attribute"]]
+                if record["attribute"] is not None
+                else job["surface_mesh_size"]
+            )
+            for part in shapely.get_parts(piece):
+                if part.geom_type == "Polygon" and part.area > job["geom_tol"] ** 2:
+                    sources.append((size, 0.0, part))
+        return sources
+
+    @staticmethod
+    def _qm_tile_plan(
+        records: list[dict[str, Any]],
+        bounds: tuple[float, float, float, float],
+        tiles: tuple[int, int],
+        geom_tol: float,
+        previous: tuple[list[float], list[float]] | None = None,
+    ) -> tuple[list[float], list[float], list[np.ndarray], list[np.ndarray]]:
+        """
+        Internal: choose tile cuts and the z=0 crossing stations along each cut.
+
+        Each interior cut is placed within a quarter tile of its even-spacing
+        position where it crosses the fewest polygons, keeping clear of polygon
+        vertices so no polygon edge runs along a cut. ``previous`` tile edges
+        are kept while the layout bounds match and no vertex lands near a
+        cut, so an incremental run cuts where the last one did. Returns the
+        tile edges in x and y and, per interior cut, the sorted positions where
+        polygon boundaries cross it.
+        """
+        import shapely
+
+        polygons = [record["polygon"] for record in records]
+        poly_bounds = shapely.bounds(polygons)
+        vertices = shapely.get_coordinates(polygons)
+        # edges on a power-of-two grid finer than geom_tol make the far face of
+        # every tile box (corner + extent) land exactly on the cut
+        grid = 2.0 ** math.floor(math.log2(geom_tol))
+
+        def edges(axis: int, count: int) -> list[float]:
+            lo = math.floor(bounds[axis] / grid) * grid
+            hi = math.ceil(bounds[axis + 2] / grid) * grid
+            width = (hi - lo) / count
+            starts, ends = poly_bounds[:, axis], poly_bounds[:, axis + 2]
+            stations = np.sort(vertices[:, axis])
+            if previous is not None:
+                kept = previous[axis]
+                if (
+                    len(kept) == count + 1
+                    and (kept[0], kept[-1]) == (lo, hi)
+                    and not any(
+                        np.any(np.abs(stations - value) <= 10.0 * geom_tol)
+                        for value in kept[1:-1]
+                    )
+                ):
+                    return list(kept)
+            out = [lo]
+            for k in range(1, count):
+                nominal = lo + k * width
+                candidates = nominal + np.linspace(-0.25, 0.25, 51) * width
+                crossed = (
+                    (starts[:, None] < candidates) & (ends[:, None] > candidates)
+                ).sum(axis=0)
+                at = np.clip(np.searchsorted(stations, candidates), 1, max(len(stations) - 1, 1))
+                clearance = np.minimum(
+                    np.abs(candidates - stations[at - 1]),
+                    np.abs(candidates - stations[np.minimum(at, len(stations) - 1)]),
+                )
+                blocked = clearance <= 10.0 * geom_tol
+                order = np.lexsort((np.abs(candidates - nominal), crossed, blocked))
+                out.append(round(float(candidates[order[0]]) / grid) * grid)
+            out.append(hi)
+            return out
+
+        def crossings(axis: int, value: float) -> np.ndarray:
+            other = 1 - axis
+            hit = (poly_bounds[:, axis] < value) & (poly_bounds[:, axis + 2] > value)
+            if not hit.any():
+                return np.empty(0)
+            ends = [[0.0, 0.0], [0.0, 0.0]]
+            ends[0][axis] = ends[1][axis] = value
+            ends[0][other], ends[1][other] = bounds[other], bounds[other + 2]
+            line = shapely.linestrings(ends)
+            points = shapely.intersection(
+                shapely.boundary(np.asarray(polygons, dtype=object)[hit]), line
+            )
+            stations = np.sort(shapely.get_coordinates(points)[:, other])
+            if len(stations) == 0:
+                return stations
+            return stations[np.r_[True, np.diff(stations) > geom_tol]]
+
+        xs = edges(0, tiles[0])
+        ys = edges(1, tiles[1])
+        return (
+            xs,
+            ys,
+            [crossings(0, value) for value in xs[1:-1]],
+            [crossings(1, value) for value in ys[1:-1]],
+        )
+
+    @staticmethod
+    def _qm_mesh_interfaces(job: dict[str, Any]) -> list[dict[str, Any]]:
+        """
+        Internal: surface-mesh the tile interfaces in one gmsh session.
+
+        Every ``(axis, value, lo, hi, stops)`` side is a substrate and an air
+        rectangle on the plane ``axis = value``, split at z=0 through the
+        polygon crossing ``stops``. Meshing them together makes the pieces
+        shared by neighbouring tiles conformal; each tile later injects the
+        pieces on its sides. Polygons within ``refinement_radius`` of a cut
+        (the tile overlap) size the interface mesh through hidden surfaces.
+        """
+        import gmsh
+
+        z_bottom = -job["substrate_thickness"]
+        z_top = job["airbox_height"]
+
+        owns_gmsh = not gmsh.isInitialized()
+        if owns_gmsh:
+            gmsh.initialize()
+        else:
+            gmsh.clear()
+
+        try:
+            gmsh.model.add("qiskit_metal_tile_interfaces")
+
+            def point(axis: int, value: float, t: float, z: float) -> int:
+                x, y = (value, t) if axis == 0 else (t, value)
+                return gmsh.model.occ.addPoint(x, y, z)
+
+            surfaces: list[tuple[int, int]] = []
+            for axis, value, lo, hi, stops in job["sides"]:
+                mid = [point(axis, value, t, 0.0) for t in [lo, *stops, hi]]
+                z_line = [
+                    gmsh.model.occ.addLine(a, b) for a, b in zip(mid[:-1], mid[1:])
+                ]
+                for z in (z_bottom, z_top):
+                    a = point(axis, value, lo, z)
+                    b = point(axis, value, hi, z)
+                    loop = gmsh.model.occ.addCurveLoop(
+                        [
+                            gmsh.model.occ.addLine(mid[0], a),
+                            gmsh.model.occ.addLine(a, b),
+                            gmsh.model.occ.addLine(b, mid[-1]),
+                        ]
+                        + z_line[::-1]
+                    )
+                    surfaces.append((2, gmsh.model.occ.addPlaneSurface([loop])))
+
+            if len(surfaces) > 1:
+                surfaces, _ = gmsh.model.occ.fragment(surfaces[:1], surfaces[1:])
+            gmsh.model.occ.synchronize()
+
+            faces = sorted(tag for dim, tag in surfaces if dim == 2)
+            curves = sorted(
+                {
+                    tag
+                    for _, tag in gmsh.model.getBoundary(
+                        [(2, face) for face in faces], combined=False, oriented=False
+                    )
+                }
+            )
+            points = sorted(
+                {
+                    tag
+                    for _, tag in gmsh.model.getBoundary(
+                        [(1, curve) for curve in curves], combined=False, oriented=False
+                    )
+                }
+            )
+
+            size_to_faces: dict[float, set[int]] = defaultdict(set)
+            Mesh._gmsh_add_sizing_surfaces(gmsh, job["sources"], size_to_faces)
+            Mesh._gmsh_add_size_fields(
+                gmsh, size_to_faces, job["volume_mesh_size"], job["refinement_radius"]
+            )
+            gmsh.option.setNumber("Mesh.MeshSizeFromPoints", 0)
+            gmsh.option.setNumber("Mesh.MeshSizeFromCurvature", 0)
+            gmsh.option.setNumber("Mesh.MeshSizeExtendFromBoundary", 0)
+            gmsh.option.setNumber(
+                "Mesh.CharacteristicLengthMin", job["finest_surface_mesh_size"]
+            )
+            gmsh.option.setNumber(
+                "Mesh.CharacteristicLengthMax", job["volume_mesh_size"]
+            )
+            gmsh.model.mesh.generate(2)
+
+            entities: list[dict[str, Any]] = []
+            for dim, tags in ((0, points), (1, curves), (2, faces)):
+                for tag in tags:
+                    node_tags, coords, _ = gmsh.model.mesh.getNodes(dim, tag)
+                    types, elem_tags, elem_nodes = gmsh.model.mesh.getElements(dim, tag)
+                    entity = {
+                        "dim": dim,
+                        "tag": tag,
+                        "node_tags": np.asarray(node_tags, dtype=np.uint64),
+                        "coords": np.asarray(coords, dtype=float),
+                        "elements": [
+                            (int(t), np.asarray(e, dtype=np.uint64), np.asarray(n, dtype=np.uint64))
+                            for t, e, n in zip(types, elem_tags, elem_nodes)
+                        ],
+                    }
+                    if dim == 0:
+                        entity["xyz"] = np.asarray(gmsh.model.getValue(0, tag, []))
+                    else:
+                        entity["boundary"] = [
+                            t
+                            for _, t in gmsh.model.getBoundary(
+                                [(dim, tag)], combined=False, oriented=False
+                            )
+                        ]
+                    entities.append(entity)
+            return entities
+
+        finally:
+            if owns_gmsh and gmsh.isInitialized():
+                gmsh.finalize()
+
+    @staticmethod
+    def _qm_mesh_region(job: dict[str, Any]) -> dict[str, Any]:
+        """
+        Internal: imprint and mesh one region of a Quantum Metal design.
+
+        ``job`` holds the scaled records and sizing assembled by
+        :meth:`mesh_Quantum_Metal_design`. The region is either the whole
+        layout, written to ``job["output"]``, or one tile: its ``cuts`` sides
+        receive the shared interface mesh before generation and are left out
+        of the far field, and the tile mesh is returned as arrays.
+        """
+        import gmsh
+        import shapely
+
+        records = job["records"]
+        xmin, ymin, xmax, ymax = job["bounds"]
+        dx = xmax - xmin
+        dy = ymax - ymin
+        substrate_thickness = job["substrate_thickness"]
+        z_substrate_bottom = -substrate_thickness
+        substrate_attr, air_attr, ground_plane_attr, farfield_attr = job["attrs"]
+        attr_labels = job["attr_labels"]
+        attr_mesh_sizes = job["attr_mesh_sizes"]
+        custom_surface_mesh = job["custom_surface_mesh"]
+        surface_mesh_size = job["surface_mesh_size"]
+        volume_mesh_size = job["volume_mesh_size"]
+        finest_surface_mesh_size = job["finest_surface_mesh_size"]
+        geom_tol = job["geom_tol"]
+        boundary_simplify = job["boundary_simplify"]
+        cuts = tuple((axis, value) for axis, value in job.get("cuts", ()))
+        interfaces = job.get("interfaces", [])
+        performance = job.get("performance")
+        timings: dict[str, float] = {}
+
+        simplify_stats: dict[str, int] | None = (
+            {"polygon_edges": 0, "gmsh_curves": 0, "merged_runs": 0}
+            if boundary_simplify is not None
+            else None
+        )
+
+        def add_polygon_surface(polygon: Polygon, z: float, lc: float) -> int:
+            return Mesh._gmsh_add_polygon_surface(
+                gmsh,
+                polygon,
+                z,
+                lc,
+                boundary_simplify=boundary_simplify,
+                scaled_surface_mesh_size=surface_mesh_size,
+                finest_surface_mesh_size=finest_surface_mesh_size,
+                mesh_scale=job["mesh_scale"],
+                simplify_stats=simplify_stats,
+                cut_lines=cuts,
+            )
+
+        def split_volumes_by_z() -> tuple[list[int], list[int]]:
+            substrate_volumes: list[int] = []
+            air_volumes: list[int] = []
+            for dim, tag in gmsh.model.getEntities(3):
+                _, _, z = gmsh.model.occ.getCenterOfMass(dim, tag)
+                (substrate_volumes if z < -geom_tol else air_volumes).append(tag)
+            return substrate_volumes, air_volumes
+
+        def outer_faces(volumes: list[int]) -> list[tuple[int, int]]:
+            if not volumes:
+                return []
+            return [
+                (dim, tag)
+                for dim, tag in gmsh.model.getBoundary(
+                    [(3, volume) for volume in volumes],
+                    combined=True,
+                    oriented=False,
+                    recursive=False,
+                )
+                if dim == 2
+            ]
+
+        def on_cut(face_tag: int) -> bool:
+            box = gmsh.model.getBoundingBox(2, face_tag)
+            return any(
+                abs(box[axis] - value) <= geom_tol and abs(box[axis + 3] - value) <= geom_tol
+                for axis, value in cuts
+            )
+
+        def face_boundary_xy(face_tag: int) -> np.ndarray:
+            points: list[tuple[float, float]] = []
+            for dim, tag in gmsh.model.getBoundary(
+                [(2, face_tag)], recursive=True, oriented=False
+            ):
+                if dim != 0:
+                    continue
+                try:
+                    x, y, _ = gmsh.model.getValue(0, tag, [])
+                except Exception:
+                    continue
+                points.append((x, y))
+            return np.asarray(points, dtype=float).reshape(-1, 2)
+
+        def points_inside_polygon(points: np.ndarray, polygon: Polygon) -> bool:
+            # interior points are at distance 0; only the rest need a distance
+            inside = shapely.contains_xy(polygon, points[:, 0], points[:, 1])
+            if inside.all():
+                return True
+            rest = shapely.points(points[~inside])
+            return bool(np.all(shapely.distance(polygon, rest) <= geom_tol))
+
+        def match_interfaces() -> dict[tuple[int, int], int]:
+            # interface entities are matched point -> curve -> face by their
+            # boundaries (fragment can leave orphan copies of polygon edges
+            # lying on a cut, so only the closure of the volumes is considered)
+            closure = {3: [(3, volume) for volume in all_vols]}
+            for dim in (2, 1, 0):
+                closure[dim] = sorted(
+                    set(gmsh.model.getBoundary(closure[dim + 1], combined=False, oriented=False))
+                )
+            point_tags = [tag for _, tag in closure[0]]
+            point_xyz = np.array([gmsh.model.getValue(0, tag, []) for tag in point_tags])
+            by_boundary: dict[int, dict[frozenset[int], int]] = {1: {}, 2: {}}
+            for dim in (1, 2):
+                for _, tag in closure[dim]:
+                    bounding = gmsh.model.getBoundary([(dim, tag)], combined=False, oriented=False)
+                    by_boundary[dim].setdefault(frozenset(t for _, t in bounding), tag)
+
+            target: dict[tuple[int, int], int] = {}
+            for entity in interfaces:
+                dim = entity["dim"]
+                if dim == 0:
+                    distance = np.linalg.norm(point_xyz - entity["xyz"], axis=1)
+                    match = int(np.argmin(distance))
+                    found = point_tags[match] if distance[match] <= geom_tol else None
+                else:
+                    bounding = frozenset(target.get((dim - 1, t)) for t in entity["boundary"])
+                    found = by_boundary[dim].get(bounding)
+                if found == None:
+                    raise RuntimeError(
+                        f"tile {job['bounds']} has no entity matching interface "
+                        f"entity ({dim}, {entity['tag']}); try other tile counts"
+                    )
+                target[(dim, entity["tag"])] = found
+            return target
+
+        def inject_interfaces(target: dict[tuple[int, int], int], dim: int) -> None:
+            # points and curves keep their interface tags (nothing is meshed
+            # yet); faces are injected after 2D meshing, so their interior
+            # nodes and elements are given fresh tags
+            for entity in interfaces:
+                if entity["dim"] != dim:
+                    continue
+                tag = target[(dim, entity["tag"])]
+                node_tags, coords = entity["node_tags"], entity["coords"]
+                params = (
+                    gmsh.model.getParametrization(dim, tag, coords)
+                    if dim > 0 and len(coords)
+                    else []
+                )
+                if dim == 2:
+                    old_tags = node_tags
+                    node_tags = np.arange(1, len(old_tags) + 1) + gmsh.model.mesh.getMaxNodeTag()
+                gmsh.model.mesh.addNodes(dim, tag, node_tags, coords, params)
+                for elem_type, elem_tags, elem_nodes in entity["elements"]:
+                    if dim == 2:
+                        order = np.argsort(old_tags)
+                        at = np.minimum(np.searchsorted(old_tags[order], elem_nodes), len(order) - 1)
+                        interior = old_tags[order][at] == elem_nodes
+                        elem_nodes = np.where(interior, node_tags[order][at], elem_nodes)
+                        elem_tags = np.arange(1, len(elem_tags) + 1) + gmsh.model.mesh.getMaxElementTag()
+                    gmsh.model.mesh.addElementsByType(tag, elem_type, elem_tags, elem_nodes)
+
+        def mesh_arrays() -> dict[str, Any]:
+            node_tags, coords, _ = gmsh.model.mesh.getNodes()
+            node_tags = np.asarray(node_tags, dtype=np.int64)
+            index = np.zeros(int(node_tags.max()) + 1, dtype=np.int64)
+            index[node_tags] = np.arange(len(node_tags))
+            groups: list[tuple[int, int, int, np.ndarray]] = []
+            names: dict[tuple[int, int], str] = {}
+            for dim, physical in gmsh.model.getPhysicalGroups():
+                names[(dim, physical)] = gmsh.model.getPhysicalName(dim, physical)
+                for entity in gmsh.model.getEntitiesForPhysicalGroup(dim, physical):
+                    types, _, elem_nodes = gmsh.model.mesh.getElements(dim, entity)
+                    for elem_type, nodes in zip(types, elem_nodes):
+                        width = gmsh.model.mesh.getElementProperties(elem_type)[3]
+                        groups.append(
+                            (dim, physical, int(elem_type), index[np.asarray(nodes, dtype=np.int64)].reshape(-1, width))
+                        )
+            coords = np.asarray(coords, dtype=float).reshape(-1, 3)
+            return {
+                "coords": coords,
+                "shared": np.isin(coords[:, 0], [v for a, v in cuts if a == 0])
+                | np.isin(coords[:, 1], [v for a, v in cuts if a == 1]),
+                "groups": groups,
+                "names": names,
+            }
+
+        owns_gmsh = not gmsh.isInitialized()
+        if owns_gmsh:
+            gmsh.initialize()
+        else:
+            gmsh.clear()
+
+        try:
+            gmsh.model.add(job["model_name"])
+
+            substrate = gmsh.model.occ.addBox(
+                xmin, ymin, z_substrate_bottom, dx, dy, substrate_thickness
+            )
+            airbox = gmsh.model.occ.addBox(xmin, ymin, 0.0, dx, dy, job["airbox_height"])
+
+            for record in records:
+                record["surface_tag"] = add_polygon_surface(
+                    record["polygon"], z=0.0, lc=record["mesh_lc"]
+                )
+            surface_tags = [record["surface_tag"] for record in records]
+
+            started = time.perf_counter()
+            gmsh.model.occ.fragment([(3, substrate)], [(3, airbox)])
+            gmsh.model.occ.removeAllDuplicates()
+            gmsh.model.occ.synchronize()
+            sub_vols, air_vols = split_volumes_by_z()
+
+            if surface_tags:
+                gmsh.model.occ.fragment(
+                    [(3, volume) for volume in sub_vols + air_vols],
+                    [(2, tag) for tag in surface_tags],
+                )
+                gmsh.model.occ.removeAllDuplicates()
+                gmsh.model.occ.synchronize()
+                sub_vols, air_vols = split_volumes_by_z()
+            timings["fragment"] = time.perf_counter() - started
+
+            all_vols = sub_vols + air_vols
+            outer = outer_faces(all_vols)
+            outer_set = {tag for _, tag in outer}
+            # faces are matched to the smallest enclosing record polygon; the
+            # tree narrows each face to polygons whose bounds can contain it
+            record_polygons = [record["polygon"] for record in records]
+            record_tree = shapely.STRtree(record_polygons)
+            record_bounds = shapely.bounds(record_polygons)
+            area_rank = np.empty(len(records), dtype=np.int64)
+            area_rank[np.argsort(shapely.area(record_polygons), kind="stable")] = np.arange(len(records))
+
+            attr_to_faces: dict[int, set[int]] = defaultdict(set)
+            ground_plane_faces: set[int] = set()
+            gap_faces: set[int] = set()
+
+            for dim, tag in gmsh.model.getEntities(2):
+                if tag in outer_set:
+                    continue
+                _, _, z = gmsh.model.occ.getCenterOfMass(dim, tag)
+                if abs(z) > geom_tol:
+                    continue
+
+                matched_record = None
+                points = face_boundary_xy(tag)
+                if len(points):
+                    lo = points.min(axis=0)
+                    hi = points.max(axis=0)
+                    candidates = record_tree.query(shapely.box(*(lo - geom_tol), *(hi + geom_tol)))
+                    fits = (
+                        (record_bounds[candidates, :2] <= lo + geom_tol).all(axis=1)
+                        & (record_bounds[candidates, 2:] >= hi - geom_tol).all(axis=1)
+                    )
+                    candidates = candidates[fits]
+                    for index in candidates[np.argsort(area_rank[candidates])]:
+                        if points_inside_polygon(points, records[index]["polygon"]):
+                            matched_record = records[index]
+                            break
+
+                if matched_record is None:
+                    ground_plane_faces.add(tag)
+                elif matched_record["attribute"] is not None:
+                    attr_to_faces[int(matched_record["attribute"])].add(tag)
+                else:
+                    gap_faces.add(tag)
+
+            farfield_faces = sorted({tag for _, tag in outer if not (cuts and on_cut(tag))})
+
+            if sub_vols:
+                gmsh.model.addPhysicalGroup(3, sub_vols, substrate_attr)
+                gmsh.model.setPhysicalName(3, substrate_attr, "substrate")
+            if air_vols:
+                gmsh.model.addPhysicalGroup(3, air_vols, air_attr)
+                gmsh.model.setPhysicalName(3, air_attr, "air")
+
+            for attr, faces in attr_to_faces.items():
+                if not faces:
+                    continue
+                gmsh.model.addPhysicalGroup(2, sorted(faces), attr)
+                gmsh.model.setPhysicalName(2, attr, attr_labels.get(attr, f"attr_{attr}"))
+
+            if ground_plane_faces:
+                gmsh.model.addPhysicalGroup(2, sorted(ground_plane_faces), ground_plane_attr)
+                gmsh.model.setPhysicalName(2, ground_plane_attr, "ground_plane")
+
+            if farfield_faces:
+                gmsh.model.addPhysicalGroup(2, farfield_faces, farfield_attr)
+                gmsh.model.setPhysicalName(2, farfield_attr, "far_field")
+
+            size_to_faces: dict[float, set[int]] = defaultdict(set)
+            for attr, faces in attr_to_faces.items():
+                size_to_faces[attr_mesh_sizes[attr]].update(faces)
+            if gap_faces:
+                size_to_faces[surface_mesh_size].update(gap_faces)
+
+            if ground_plane_faces and "ground_plane" in custom_surface_mesh:
+                size_to_faces[custom_surface_mesh["ground_plane"]].update(
+                    ground_plane_faces
+                )
+
+            if farfield_faces and "far_field" in custom_surface_mesh:
+                size_to_faces[custom_surface_mesh["far_field"]].update(farfield_faces)
+
+            # before the sizing surfaces, which would otherwise be matched too
+            if interfaces:
+                interface_target = match_interfaces()
+                inject_interfaces(interface_target, 0)
+                inject_interfaces(interface_target, 1)
+                gmsh.option.setNumber("Mesh.MeshOnlyEmpty", 1)
+                # injected faces refer to curve nodes by tag
+                gmsh.option.setNumber("Mesh.Renumber", 0)
+
+            # polygons of neighbouring tiles within the overlap still refine
+            # this tile near its cuts
+            if job.get("sources"):
+                Mesh._gmsh_add_sizing_surfaces(gmsh, job["sources"], size_to_faces)
+
+            Mesh._gmsh_add_size_fields(
+                gmsh, size_to_faces, volume_mesh_size, job["refinement_radius"]
+            )
+
+            gmsh.option.setNumber("Mesh.MeshSizeFromPoints", 0)
+            gmsh.option.setNumber("Mesh.MeshSizeFromCurvature", 0)
+            gmsh.option.setNumber("Mesh.MeshSizeExtendFromBoundary", 0)
+            gmsh.option.setNumber(
+                "Mesh.CharacteristicLengthMin", finest_surface_mesh_size
+            )
+            gmsh.option.setNumber("Mesh.CharacteristicLengthMax", volume_mesh_size)
+            gmsh.option.setNumber("Mesh.ElementOrder", 1)
+            gmsh.option.setNumber("Mesh.MshFileVersion", float(job["msh_version"]))
+            gmsh.option.setNumber("Mesh.Binary", int(bool(job["msh_binary"])))
+            gmsh.option.setNumber("Mesh.SaveAll", 0)
+            if performance is None:
+                gmsh.option.setNumber("Mesh.Algorithm3D", 1)
+            else:
+                gmsh.option.setNumber("Mesh.Algorithm3D", performance.algorithm_3d)
+                gmsh.option.setNumber("General.NumThreads", performance.num_threads)
+                gmsh.option.setNumber("Mesh.MaxNumThreads1D", performance.threads_1d)
+                gmsh.option.setNumber("Mesh.MaxNumThreads2D", performance.threads_2d)
+                gmsh.option.setNumber("Mesh.MaxNumThreads3D", performance.threads_3d)
+
+            started = time.perf_counter()
+            if performance is None and not interfaces:
+                # one call keeps the default mesh identical to earlier releases
+                gmsh.model.mesh.generate(3)
+                timings["mesh"] = time.perf_counter() - started
+            else:
+                gmsh.model.mesh.generate(1)
+                timings["mesh_1d"] = time.perf_counter() - started
+                gmsh.model.mesh.generate(2)
+                if interfaces:
+                    # generate(1) would drop an injected surface mesh and
+                    # generate(2) would redo it, so the interface faces replace
+                    # their 2D mesh here
+                    interface_faces = [
+                        (2, interface_target[(2, entity["tag"])])
+                        for entity in interfaces
+                        if entity["dim"] == 2
+                    ]
+                    gmsh.model.mesh.clear(interface_faces)
+                    inject_interfaces(interface_target, 2)
+                timings["mesh_2d"] = time.perf_counter() - started - timings["mesh_1d"]
+                gmsh.model.mesh.generate(3)
+                timings["mesh_3d"] = (
+                    time.perf_counter() - started - timings["mesh_1d"] - timings["mesh_2d"]
+                )
+
+            result: dict[str, Any] = {
+                "groups": set(gmsh.model.getPhysicalGroups()),
+                "simplify_stats": simplify_stats,
+                "timings": timings,
+            }
+            if job.get("output"):
+                started = time.perf_counter()
+                gmsh.write(job["output"])
+                timings["write"] = time.perf_counter() - started
+            else:
+                result["mesh"] = mesh_arrays()
+            return result
+
+        finally:
+            if owns_gmsh and gmsh.isInitialized():
+                gmsh.finalize()
+
+    @staticmethod
+    def _qm_mesh_tiled(
+        job: dict[str, Any],
+        tiles: tuple[int, int],
+        tile_workers: int | None,
+        state: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Internal: mesh ``job`` as a grid of tiles in worker processes and merge.
+
+        The interface mesh is generated first so every tile sees identical
+        nodes on its cut sides; the merge then identifies those nodes by their
+        coordinates and writes one conformal mesh with the usual physical groups.
+
+        With ``state`` (incremental mode), each tile is hashed over its clipped
+        polygons, sizing sources, and the interface triangles on its sides. A
+        tile whose hash matches the previous run reuses its stored mesh, which
+        stays conformal because its interface triangles are unchanged.
+        """
+        import shapely
+        from concurrent.futures import ProcessPoolExecutor
+
+        records = job["records"]
+        geom_tol = job["geom_tol"]
+        radius = job["refinement_radius"]
+        xs, ys, x_stops, y_stops = Mesh._qm_tile_plan(
+            records,
+            job["bounds"],
+            tiles,
+            geom_tol,
+            previous=state["edges"] if state is not None else None,
+        )
+        edges = (xs, ys)
+        stations = {
+            (0, value): np.union1d(stops, ys) for value, stops in zip(xs[1:-1], x_stops)
+        }
+        stations.update(
+            {(1, value): np.union1d(stops, xs) for value, stops in zip(ys[1:-1], y_stops)}
+        )
+
+        # one interface side per cut and tile row/column
+        sides: list[tuple[int, float, float, float, list[float]]] = []
+        for axis in (0, 1):
+            across = edges[1 - axis]
+            for value in edges[axis][1:-1]:
+                stops = stations[(axis, value)]
+                for lo, hi in zip(across[:-1], across[1:]):
+                    inner = stops[(stops > lo + geom_tol) & (stops < hi - geom_tol)]
+                    sides.append((axis, value, lo, hi, inner.tolist()))
+
+        def band(axis: int, value: float, lo: float, hi: float) -> Polygon:
+            if axis == 0:
+                return shapely.box(value - radius, lo - radius, value + radius, hi + radius)
+            return shapely.box(lo - radius, value - radius, hi + radius, value + radius)
+
+        interface_sources: list[tuple[float, float, Polygon]] = []
+        custom = job["custom_surface_mesh"]
+        for axis, value, lo, hi, _ in sides:
+            region = band(axis, value, lo, hi)
+            interface_sources += Mesh._qm_region_size_sources(job, records, region)
+            if "ground_plane" in custom:
+                interface_sources.append((custom["ground_plane"], 0.0, region))
+            if "far_field" in custom:
+                interface_sources.append((custom["far_field"], -job["substrate_thickness"], region))
+                interface_sources.append((custom["far_field"], job["airbox_height"], region))
+
+        def snap(coords: np.ndarray) -> np.ndarray:
+            # clipped vertices on a cut land exactly on its crossing stations
+            coords = coords.copy()
+            for (axis, value), stops in stations.items():
+                on = np.abs(coords[:, axis] - value) <= geom_tol
+                if not on.any():
+                    continue
+                coords[on, axis] = value
+                other = coords[on, 1 - axis]
+                at = np.clip(np.searchsorted(stops, other), 1, len(stops) - 1)
+                pick = np.where(
+                    np.abs(stops[at - 1] - other) <= np.abs(stops[at] - other), at - 1, at
+                )
+                close = np.abs(stops[pick] - other) <= geom_tol
+                other[close] = stops[pick][close]
+                coords[on, 1 - axis] = other
+            return coords
+
+        polygons = [record["polygon"] for record in records]
+        poly_bounds = shapely.bounds(polygons)
+        tile_jobs: list[dict[str, Any]] = []
+        for i in range(tiles[0]):
+            for j in range(tiles[1]):
+                x0, x1, y0, y1 = xs[i], xs[i + 1], ys[j], ys[j + 1]
+                rect = shapely.box(x0, y0, x1, y1)
+                inside = (
+                    (poly_bounds[:, 0] >= x0)
+                    & (poly_bounds[:, 2] <= x1)
+                    & (poly_bounds[:, 1] >= y0)
+                    & (poly_bounds[:, 3] <= y1)
+                )
+                touching = ~inside & (
+                    (poly_bounds[:, 0] < x1)
+                    & (poly_bounds[:, 2] > x0)
+                    & (poly_bounds[:, 1] < y1)
+                    & (poly_bounds[:, 3] > y0)
+                )
+                tile_records = [dict(records[k]) for k in np.flatnonzero(inside)]
+                clipped = shapely.intersection(
+                    np.asarray(polygons, dtype=object)[touching], rect
+                )
+                for k, piece in zip(np.flatnonzero(touching), clipped):
+                    for part in shapely.get_parts(piece):
+                        if part.geom_type != "Polygon" or part.area <= geom_tol**2:
+                            continue
+                        tile_records.append(
+                            dict(records[k], polygon=shapely.transform(part, snap))
+                        )
+
+                cuts = [(0, x0)] if i > 0 else []
+                cuts += [(0, x1)] if i < tiles[0] - 1 else []
+                cuts += [(1, y0)] if j > 0 else []
+                cuts += [(1, y1)] if j < tiles[1] - 1 else []
+                neighbours = [
+                    record
+                    for record, box in zip(records, poly_bounds)
+                    if box[0] < x1 + radius
+                    and box[2] > x0 - radius
+                    and box[1] < y1 + radius
+                    and box[3] > y0 - radius
+                ]
+                outside = shapely.difference(
+                    shapely.box(x0 - radius, y0 - radius, x1 + radius, y1 + radius), rect
+                )
+                tile_jobs.append(
+                    dict(
+                        job,
+                        records=tile_records,
+                        bounds=(x0, y0, x1, y1),
+                        cuts=cuts,
+                        sides=[
+                            side
+                            for side in sides
+                            if (side[0], side[1]) in cuts
+                            and side[2] >= (x0, y0)[1 - side[0]] - geom_tol
+                            and side[3] <= (x1, y1)[1 - side[0]] + geom_tol
+                        ],
+                        sources=Mesh._qm_region_size_sources(job, neighbours, outside),
+                        model_name=f"{job['model_name']}_tile_{i}_{j}",
+                        output=None,
+                    )
+                )
+
+        timings: dict[str, float] = {}
+        workers = tile_workers or min(len(tile_jobs), len(_usable_cpus()))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            started = time.perf_counter()
+            interfaces = pool.submit(
+                Mesh._qm_mesh_interfaces,
+                dict(job, sides=sides, sources=interface_sources),
+            ).result()
+            timings["interfaces"] = time.perf_counter() - started
+
+            by_key = {(entity["dim"], entity["tag"]): entity for entity in interfaces}
+            point_xyz = {
+                entity["tag"]: entity["xyz"] for entity in interfaces if entity["dim"] == 0
+            }
+
+            def face_points(entity: dict[str, Any]) -> np.ndarray:
+                tags = {
+                    point
+                    for curve in entity["boundary"]
+                    for point in by_key[(1, curve)]["boundary"]
+                }
+                return np.array([point_xyz[tag] for tag in tags])
+
+            face_xyz = {
+                entity["tag"]: face_points(entity)
+                for entity in interfaces
+                if entity["dim"] == 2
+            }
+            node_xyz = dict(
+                zip(
+                    np.concatenate([entity["node_tags"] for entity in interfaces]).tolist(),
+                    np.concatenate([entity["coords"] for entity in interfaces]).reshape(-1, 3),
+                )
+            )
+
+            def tile_hash(tile_job: dict[str, Any]) -> str:
+                # tags differ between runs, so elements are hashed by node coordinates
+                digest = hashlib.blake2b(state["key"].encode(), digest_size=20)
+                digest.update(json.dumps([tile_job["bounds"], tile_job["cuts"]]).encode())
+                for record in tile_job["records"]:
+                    digest.update(shapely.to_wkb(record["polygon"]))
+                    digest.update(repr((record["attribute"], record["mesh_lc"])).encode())
+                for size, z, polygon in tile_job["sources"]:
+                    digest.update(repr((size, z)).encode())
+                    digest.update(shapely.to_wkb(polygon))
+                blocks = []
+                for entity in tile_job["interfaces"]:
+                    for elem_type, elem_tags, nodes in entity["elements"]:
+                        rows = np.array([node_xyz[tag] for tag in nodes.tolist()])
+                        rows = rows.reshape(len(elem_tags), -1)
+                        rows = rows[np.lexsort(rows.T[::-1])]
+                        blocks.append(repr((entity["dim"], elem_type)).encode() + rows.tobytes())
+                for block in sorted(blocks):
+                    digest.update(block)
+                return digest.hexdigest()
+
+            names = [f"{i}_{j}" for i in range(tiles[0]) for j in range(tiles[1])]
+            futures = {}
+            hashes: dict[str, str] = {}
+            reused: dict[str, dict[str, Any]] = {}
+            for name, tile_job in zip(names, tile_jobs):
+                chosen: set[tuple[int, int]] = set()
+                for axis, value, lo, hi, _ in tile_job.pop("sides"):
+                    for tag, xyz in face_xyz.items():
+                        along = xyz[:, 1 - axis]
+                        if (
+                            np.all(np.abs(xyz[:, axis] - value) <= geom_tol)
+                            and along.min() >= lo - geom_tol
+                            and along.max() <= hi + geom_tol
+                        ):
+                            chosen.add((2, tag))
+                for _, tag in list(chosen):
+                    for curve in by_key[(2, tag)]["boundary"]:
+                        chosen.add((1, curve))
+                        chosen.update((0, point) for point in by_key[(1, curve)]["boundary"])
+                tile_job["interfaces"] = [by_key[key] for key in sorted(chosen)]
+                if state is not None:
+                    hashes[name] = tile_hash(tile_job)
+                    if state["tiles"].get(name) == hashes[name]:
+                        previous = Mesh._load_qm_tile_mesh(state["dir"] / f"tile_{name}.npz")
+                        if previous != None:
+                            reused[name] = previous
+                            continue
+                futures[name] = pool.submit(Mesh._qm_mesh_region, tile_job)
+            started = time.perf_counter()
+            results = [
+                reused[name] if name in reused else futures[name].result()
+                for name in names
+            ]
+            timings["tiles"] = time.perf_counter() - started
+
+        if state is not None:
+            for name, result in zip(names, results):
+                if name not in reused:
+                    Mesh._store_qm_tile_mesh(state["dir"] / f"tile_{name}.npz", result)
+
+        # per-stage times are summed over tiles, i.e. worker seconds
+        for result in results:
+            for stage, seconds in result["timings"].items():
+                timings[stage] = timings.get(stage, 0.0) + seconds
+
+        started = time.perf_counter()
+        Mesh._qm_merge_tile_meshes(
+            [result["mesh"] for result in results],
+            job["output"],
+            job["msh_version"],
+            job["msh_binary"],
+        )
+        timings["merge"] = time.perf_counter() - started
+
+        simplify_stats = None
+        if job["boundary_simplify"] is not None:
+            simplify_stats = {
+                key: sum(result["simplify_stats"][key] for result in results)
+                for key in ("polygon_edges", "gmsh_curves", "merged_runs")
+            }
+        return {
+            "groups": set().union(*(result["groups"] for result in results)),
+            "simplify_stats": simplify_stats,
+            "timings": timings,
+            "edges": [xs, ys],
+            "tile_hashes": hashes,
+            "reused_tiles": sorted(reused),
+        }
+
+    @staticmethod
+    def _store_qm_tile_mesh(path: Path, result: dict[str, Any]) -> None:
+        """Internal: save a tile's mesh arrays and result for incremental reuse (best effort)."""
+        mesh = result["mesh"]
+        meta = {
+            "version": Mesh._QM_MESH_CACHE_VERSION,
+            "groups": [list(group[:3]) for group in mesh["groups"]],
+            "names": [[dim, physical, name] for (dim, physical), name in mesh["names"].items()],
+            "result_groups": sorted(result["groups"]),
+            "simplify_stats": result["simplify_stats"],
+        }
+        arrays = {f"conn_{k}": group[3] for k, group in enumerate(mesh["groups"])}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            with open(tmp, "wb") as f:
+                np.savez(
+                    f,
+                    meta=json.dumps(meta),
+                    coords=mesh["coords"],
+                    shared=mesh["shared"],
+                    **arrays,
+                )
+            os.replace(tmp, path)
+        except OSError:
+            return
+        Mesh._touch_mesh_cache_index(path, nbytes=path.stat().st_size)
+
+    @staticmethod
+    def _load_qm_tile_mesh(path: Path) -> dict[str, Any] | None:
+        """Internal: a tile result saved by :meth:`_store_qm_tile_mesh`, else None."""
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                meta = json.loads(str(data["meta"]))
+                if meta.get("version") != Mesh._QM_MESH_CACHE_VERSION:
+                    return None
+                mesh = {
+                    "coords": data["coords"],
+                    "shared": data["shared"],
+                    "groups": [
+                        (dim, physical, elem_type, data[f"conn_{k}"])
+                        for k, (dim, physical, elem_type) in enumerate(meta["groups"])
+                    ],
+                    "names": {(dim, physical): name for dim, physical, name in meta["names"]},
+                }
+        except (OSError, ValueError, KeyError):
+            return None
+        Mesh._touch_mesh_cache_index(path)
+        return {
+            "groups": {tuple(group) for group in meta["result_groups"]},
+            "simplify_stats": meta["simplify_stats"],
+            "timings": {},
+            "mesh": mesh,
+        }
+
+    @staticmethod
+    def _qm_merge_tile_meshes(
+        meshes: list[dict[str, Any]],
+        output: str,
+        msh_version: float,
+        msh_binary: bool,
+    ) -> None:
+        """Internal: stitch tile meshes on their shared interface nodes and write one ``.msh``."""
+        import gmsh
+
+        coords = np.concatenate([mesh["coords"] for mesh in meshes])
+        shared = np.concatenate([mesh["shared"] for mesh in meshes])
+        offsets = np.cumsum([0] + [len(mesh["coords"]) for mesh in meshes])
+
+        # interface nodes come from one interface mesh, so the copies held by
+        # neighbouring tiles have bit-identical coordinates
+        ids = np.arange(len(coords))
+        on_cut = np.flatnonzero(shared)
+        _, first, inverse = np.unique(
+            coords[on_cut], axis=0, return_index=True, return_inverse=True
+        )
+        ids[on_cut] = on_cut[first][inverse.ravel()]
+
+        blocks: dict[tuple[int, int], dict[int, list[np.ndarray]]] = {}
+        names: dict[tuple[int, int], str] = {}
+        for mesh, offset in zip(meshes, offsets):
+            names.update(mesh["names"])
+            for dim, physical, elem_type, conn in mesh["groups"]:
+                blocks.setdefault((dim, physical), defaultdict(list))[elem_type].append(
+                    ids[conn + offset]
+                )
+
+        used = np.unique(
+            np.concatenate(
+                [conn.ravel() for by_type in blocks.values() for parts in by_type.values() for conn in parts]
+            )
+        )
+        renumber = np.zeros(len(coords), dtype=np.int64)
+        renumber[used] = np.arange(1, len(used) + 1)
+
+        owns_gmsh = not gmsh.isInitialized()
+        if owns_gmsh:
+            gmsh.initialize()
+        else:
+            gmsh.clear()
+
+        try:
+            gmsh.model.add("qiskit_metal_tiled")
+            entities = {
+                key: gmsh.model.addDiscreteEntity(key[0])
+                for key in sorted(blocks, key=lambda key: -key[0])
+            }
+            volume = next(tag for (dim, _), tag in entities.items() if dim == 3)
+            gmsh.model.mesh.addNodes(
+                3, volume, np.arange(1, len(used) + 1), coords[used].ravel()
+            )
+            next_tag = 1
+            for key, by_type in blocks.items():
+                for elem_type, parts in by_type.items():
+                    conn = np.concatenate(parts)
+                    gmsh.model.mesh.addElementsByType(
+                        entities[key],
+                        elem_type,
+                        np.arange(next_tag, next_tag + len(conn)),
+                        renumber[conn].ravel(),
+                    )
+                    next_tag += len(conn)
+                gmsh.model.addPhysicalGroup(key[0], [entities[key]], key[1])
+                gmsh.model.setPhysicalName(key[0], key[1], names[key])
+
+            gmsh.option.setNumber("Mesh.MshFileVersion", float(msh_version))
+            gmsh.option.setNumber("Mesh.Binary", int(bool(msh_binary)))
+            gmsh.option.setNumber("Mesh.SaveAll", 0)
+            gmsh.write(output)
+
+        finally:
+            if owns_gmsh and gmsh.isInitialized():
+                gmsh.finalize()
+
+    @staticmethod
+    def _qm_mesh_incremental(
+        job: dict[str, Any],
+        tiles: tuple[int, int],
+        tile_workers: int | None,
+        settings: dict[str, Any],
+        surface_digests: list[tuple[str, str, bool, str]],
+        id_to_name: Mapping[Any, str],
+    ) -> dict[str, Any]:
+        """
+        Internal: tiled meshing that reuses the unchanged tiles of the previous run.
+
+        The state for one set of settings lives in a directory keyed by their
+        hash: a manifest with the surface digests, tile edges and tile hashes,
+        and one ``.npz`` mesh per tile.
+        """
+        key = Mesh._qm_mesh_cache_key([], settings)
+        state_dir = Mesh._qm_mesh_cache_paths(key)[0].parent / "incremental" / key
+        manifest_path = state_dir / "manifest.json"
+        try:
+            manifest = json.loads(manifest_path.read_text())
+        except (OSError, ValueError):
+            manifest = {}
+
+        previous = {tuple(row) for row in manifest.get("surfaces", [])}
+        current = set(surface_digests)
+        names = {str(k): v for k, v in id_to_name.items()}
+        changed = sorted(
+            {
+                names.get(component, component)
+                for component, _, _, _ in previous.symmetric_difference(current)
+            }
+        )
+
+        result = Mesh._qm_mesh_tiled(
+            job,
+            tiles,
+            tile_workers,
+            state={
+                "key": key,
+                "dir": state_dir,
+                "edges": manifest.get("edges"),
+                "tiles": manifest.get("tiles", {}),
+            },
+        )
+        count = len(result["tile_hashes"])
+        if manifest:
+            print(
+                f"incremental: {len(changed)} changed component(s)"
+                + (f" ({', '.join(map(str, changed))})" if changed else "")
+                + f"; re-meshed {count - len(result['reused_tiles'])} of {count} tiles"
+            )
+
+        try:
+            state_dir.mkdir(parents=True, exist_ok=True)
+            tmp = manifest_path.with_name(f".{manifest_path.name}.{os.getpid()}.tmp")
+            tmp.write_text(
+                json.dumps(
+                    {
+                        "surfaces": sorted(current),
+                        "edges": result["edges"],
+                        "tiles": result["tile_hashes"],
+                    }
+                )
+            )
+            os.replace(tmp, manifest_path)
+        except OSError:
+            pass
+        return result
 
-        friendly = pd.DataFrame(
-            {
-                "component_id": surfaces["component"].astype(int),
-                "component_name": surfaces["component"].astype(int).map(id_to_name),
-                "name": surfaces["name"].astype(str),
-                "subtract": surfaces["subtract"].astype(bool),
-            }
-        )
-        return friendly
+    @staticmethod
+    def _qm_surface_digests(surfaces: pd.DataFrame) -> list[tuple[str, str, bool, str]]:
+        """Internal: ``(component, name, subtract, digest)`` per surface row, hashing normalized WKB."""
+        import shapely
 
+        digests = []
+        for _, row in surfaces.iterrows():
+            if bool(row.get("helper", False)):
+                continue
+            wkb = shapely.to_wkb(shapely.normalize(row["geometry"]))
+            digests.append(
+                (
+                    str(row["component"]),
+                    str(row["name"]),
+                    bool(row["subtract"]),
+                    hashlib.blake2b(wkb, digest_size=16).hexdigest(),
+                )
+            )
+        return digests
 
-    def _qmetal_design_unit_to_meters(design: Any) -> float:
-        """Return meters per Qiskit Metal design unit.
+    @staticmethod
+    def _qm_mesh_cache_key(surface_digests: list[tuple[str, str, bool, str]], settings: dict[str, Any]) -> str:
+        """Internal: hash of the surface digests, meshing settings, and Gmsh version."""
+        import gmsh
 
-        Qiskit Metal defaults to millimeters. This helper keeps unit handling out of
-        the public API while still supporting common non-default design units.
-        """
+        payload = {
+            "version": Mesh._QM_MESH_CACHE_VERSION,
+            "gmsh": gmsh.__version__,
+            "surfaces": sorted(surface_digests),
+            "settings": settings,
+        }
+        text = json.dumps(payload, sort_keys=True, default=repr)
+        return hashlib.blake2b(text.encode(), digest_size=20).hexdigest()
 
-        if hasattr(design, "get_units"):
-            unit = design.get_units()
-        else:
-            unit = getattr(design, "units", "mm")
+    @staticmethod
+    def _qm_mesh_cache_paths(key: str) -> tuple[Path, Path]:
+        """Internal: cached mesh and its manifest under ``$PYPALACE_CACHE_DIR/qm_meshes``."""
+        root = Mesh._mesh_cache_index_path().parent / "qm_meshes"
+        return root / f"{key}.msh", root / f"{key}.json"
 
-        unit = str(unit).strip().lower()
-        unit = {"μm": "um", "µm": "um"}.get(unit, unit)
-        unit_to_meters = {
-            "m": 1.0,
-            "meter": 1.0,
-            "meters": 1.0,
-            "mm": 1.0e-3,
-            "millimeter": 1.0e-3,
-            "millimeters": 1.0e-3,
-            "um": 1.0e-6,
-            "micron": 1.0e-6,
-            "microns": 1.0e-6,
-            "nm": 1.0e-9,
-            "nanometer": 1.0e-9,
-            "nanometers": 1.0e-9,
+    @staticmethod
+    def _load_qm_mesh_cache(key: str, output: Path) -> dict[str, Any] | None:
+        """Internal: copy a cached mesh to ``output`` and return its stored result, else None."""
+        mesh_path, manifest_path = Mesh._qm_mesh_cache_paths(key)
+        try:
+            manifest = json.loads(manifest_path.read_text())
+            if not mesh_path.is_file():
+                return None
+            tmp = output.with_name(f".{output.name}.{os.getpid()}.tmp")
+            shutil.copyfile(mesh_path, tmp)
+            os.replace(tmp, output)
+        except (OSError, ValueError):
+            return None
+        Mesh._touch_mesh_cache_index(mesh_path)
+        return {
+            "groups": {tuple(group) for group in manifest["groups"]},
+            "simplify_stats": manifest["simplify_stats"],
+            "timings": {},
         }
-        if unit not in unit_to_meters:
-            raise ValueError(
-                f"Unsupported Qiskit Metal design units {unit!r}. "
-                "Expected one of: m, mm, um, nm."
-            )
-        return unit_to_meters[unit]
+
+    @staticmethod
+    def _store_qm_mesh_cache(key: str, output: Path, result: dict[str, Any]) -> None:
+        """Internal: copy a finished mesh and its result into the cache (best effort)."""
+        mesh_path, manifest_path = Mesh._qm_mesh_cache_paths(key)
+        manifest = {
+            "groups": sorted(result["groups"]),
+            "simplify_stats": result["simplify_stats"],
+        }
+        try:
+            mesh_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = mesh_path.with_name(f".{mesh_path.name}.{os.getpid()}.tmp")
+            shutil.copyfile(output, tmp)
+            os.replace(tmp, mesh_path)
+            manifest_path.write_text(json.dumps(manifest))
+        except OSError:
+            return
+        Mesh._touch_mesh_cache_index(mesh_path, nbytes=mesh_path.stat().st_size)
 
     def mesh_Quantum_Metal_design(
         design: Any,
@@ -1488,6 +4385,13 @@ class Mesh:
         simplify_short_edge: float | None = None,
         simplify_smooth_angle_deg: float = 35.0,
         simplify_max_deviation: float | None = None,
+        msh_version: float = 2.2,
+        msh_binary: bool = False,
+        tiles: int | tuple[int, int] | None = None,
+        tile_workers: int | None = None,
+        performance: "Mesh.MeshPerformanceProfile | str | None" = None,
+        cache: bool = False,
+        incremental: bool = False,
     ):
         """Generate a Palace-ready Gmsh mesh from a Quantum Metal design.
            Only for coplanar designs.
@@ -1553,9 +4457,69 @@ class Mesh:
         simplify_min_edges, simplify_cluster_span, simplify_short_edge,
         simplify_smooth_angle_deg, simplify_max_deviation:
             Boundary simplification heuristics; see :class:`BoundarySimplifySettings`.
+        msh_version:
+            Gmsh file format version to write, ``2.2`` (default) or ``4.1``.
+        msh_binary:
+            When ``True``, write a binary instead of an ASCII mesh file. Binary
+            files are several times smaller and much faster to write and to
+            reload with :meth:`plot_mesh` and :meth:`get_mesh_attributes`.
+        tiles:
+            Mesh the layout as a grid of tiles, ``(nx, ny)``, in parallel worker
+            processes. An integer cuts that many strips along the longer side.
+            Cuts are moved to cross as few polygons as possible. The tile
+            interfaces are surface-meshed once, sized by the polygons within
+            ``refinement_radius`` on both sides, and every tile meshes its
+            volume against them. The tiles are then merged into one conformal
+            mesh with the same physical groups as the untiled mesh. Default
+            ``None`` meshes the whole layout in one Gmsh model. On platforms
+            that spawn worker processes, call this from a script guarded by
+            ``if __name__ == "__main__":``.
+        tile_workers:
+            Number of worker processes for ``tiles``; defaults to one per tile,
+            up to the number of CPUs this process may use (its affinity mask,
+            e.g. a Slurm allocation).
+        performance:
+            Optional :class:`MeshPerformanceProfile`, or the preset ``"hxt"``
+            (HXT 3D meshing on all usable CPUs) or ``"default"``. A profile selects
+            ``Mesh.Algorithm3D`` (``"delaunay"``, ``"frontal"``, ``"hxt"`` or a
+            Gmsh number), ``General.NumThreads`` and the per-dimension
+            ``Mesh.MaxNumThreads1D/2D/3D`` (``0`` follows ``num_threads``). It
+            also meshes dimension by dimension and prints the fragment, 1D, 2D
+            and 3D times. With ``tiles``, each worker uses the profile's threads
+            and the stage times are summed over tiles. Stage timings are also
+            stored in ``mesh_attributes.attrs["timings"]``. Default ``None``
+            keeps single-threaded Delaunay meshing.
+        cache:
+            When ``True``, reuse a previous mesh built from the same
+            inputs. The key hashes the normalized polygon geometry, the
+            ``Attributes`` map and the physical group names it yields, every
+            sizing, simplification, tiling and file format setting, the 3D
+            algorithm, and the Gmsh version. On a hit
+            the cached mesh is copied to ``output_mesh`` without meshing.
+            Meshes are kept in ``$PYPALACE_CACHE_DIR/qm_meshes`` (default
+            ``~/.cache/pypalace``) and evicted least recently used along with
+            the parsed-mesh sidecars; ``Mesh.clear_mesh_cache()`` removes them.
+            The default ``False`` always meshes and stores nothing.
+        incremental:
+            Re-mesh only the tiles whose geometry changed since the previous
+            run with the same settings; requires ``tiles``. Surfaces are diffed
+            by component, name and geometry hash, the previous cut positions
+            are kept while the layout bounds allow it, and each tile is reused
+            when its clipped polygons, nearby sizing polygons and interface
+            mesh are unchanged. A change within ``refinement_radius`` of a cut
+            also re-meshes the neighbouring tile. Tile meshes are stored next
+            to the ``cache`` meshes.
         """
-        
-        import gmsh
+
+        from shapely.affinity import scale as shapely_scale
+        from shapely.geometry import MultiPolygon, Polygon
+        from shapely.ops import unary_union
+
+        if msh_version not in (2.2, 4.1):
+            raise ValueError(f"msh_version must be 2.2 or 4.1, got {msh_version!r}.")
+        performance = Mesh._resolve_mesh_performance(performance)
+        if incremental and tiles == None:
+            raise ValueError("incremental=True requires tiles, e.g. tiles=4.")
 
         if enable_boundary_simplify:
             if boundary_simplify is None:
@@ -1570,6 +4534,9 @@ class Mesh:
             boundary_simplify = None
 
         surfaces_df = Mesh._collect_qm_imprint_surfaces(design).copy()
+        surface_digests = (
+            Mesh._qm_surface_digests(surfaces_df) if cache or incremental else []
+        )
 
         def polygon_needs_dedupe(p: Polygon) -> bool:
             ext = list(p.exterior.coords)[:-1]
@@ -1802,275 +4769,153 @@ class Mesh:
         ymin -= margin_y
         xmax += margin_x
         ymax += margin_y
-        dx = xmax - xmin
-        dy = ymax - ymin
-        z_substrate_bottom = -substrate_thickness
-
-        simplify_stats: dict[str, int] | None = (
-            {"polygon_edges": 0, "gmsh_curves": 0, "merged_runs": 0}
-            if boundary_simplify is not None
-            else None
-        )
 
-        def add_polygon_surface(polygon: Polygon, z: float, lc: float) -> int:
-            return Mesh._gmsh_add_polygon_surface(
-                gmsh,
-                polygon,
-                z,
-                lc,
-                boundary_simplify=boundary_simplify,
-                scaled_surface_mesh_size=surface_mesh_size,
-                finest_surface_mesh_size=finest_surface_mesh_size,
-                mesh_scale=mesh_scale,
-                simplify_stats=simplify_stats,
+        attr_labels: dict[int, str] = {}
+        for record in tagged_records:
+            attr_labels.setdefault(
+                int(record["attribute"]),
+                Mesh._qmetal_physical_surface_name(
+                    record["component"],
+                    record["name"],
+                    record["key"],
+                    id_to_name,
+                ),
             )
 
-        def split_volumes_by_z() -> tuple[list[int], list[int]]:
-            substrate_volumes: list[int] = []
-            air_volumes: list[int] = []
-            for dim, tag in gmsh.model.getEntities(3):
-                _, _, z = gmsh.model.occ.getCenterOfMass(dim, tag)
-                (substrate_volumes if z < -geom_tol else air_volumes).append(tag)
-            return substrate_volumes, air_volumes
-
-        def outer_faces(volumes: list[int]) -> list[tuple[int, int]]:
-            if not volumes:
-                return []
-            return [
-                (dim, tag)
-                for dim, tag in gmsh.model.getBoundary(
-                    [(3, volume) for volume in volumes],
-                    combined=True,
-                    oriented=False,
-                    recursive=False,
-                )
-                if dim == 2
-            ]
-
-        def face_boundary_xy(face_tag: int) -> list[tuple[float, float]]:
-            points: list[tuple[float, float]] = []
-            for dim, tag in gmsh.model.getBoundary(
-                [(2, face_tag)], recursive=True, oriented=False
-            ):
-                if dim != 0:
-                    continue
-                try:
-                    x, y, _ = gmsh.model.getValue(0, tag, [])
-                except Exception:
-                    continue
-                points.append((x, y))
-            return points
-
-        def face_inside_polygon(face_tag: int, polygon: Polygon) -> bool:
-            points = face_boundary_xy(face_tag)
-            if not points:
-                return False
-            return all(polygon.distance(Point(x, y)) <= geom_tol for x, y in points)
-
-        owns_gmsh = not gmsh.isInitialized()
-        if owns_gmsh:
-            gmsh.initialize()
-        else:
-            gmsh.clear()
-
-        try:
-            gmsh.model.add(
+        job: dict[str, Any] = {
+            "records": [
+                {
+                    "polygon": record["polygon"],
+                    "attribute": record["attribute"],
+                    "mesh_lc": record["mesh_lc"],
+                }
+                for record in records
+            ],
+            "bounds": (xmin, ymin, xmax, ymax),
+            "substrate_thickness": substrate_thickness,
+            "airbox_height": airbox_height,
+            "attrs": (substrate_attr, air_attr, ground_plane_attr, farfield_attr),
+            "attr_labels": attr_labels,
+            "attr_mesh_sizes": attr_mesh_sizes,
+            "custom_surface_mesh": {
+                key: custom_surface_mesh[key]
+                for key in ("ground_plane", "far_field")
+                if key in custom_surface_mesh
+            },
+            "surface_mesh_size": surface_mesh_size,
+            "volume_mesh_size": volume_mesh_size,
+            "refinement_radius": refinement_radius,
+            "finest_surface_mesh_size": finest_surface_mesh_size,
+            "geom_tol": geom_tol,
+            "boundary_simplify": boundary_simplify,
+            "mesh_scale": mesh_scale,
+            "msh_version": msh_version,
+            "msh_binary": msh_binary,
+            "model_name": (
                 "qiskit_metal_boundary_simplify_gmsh"
                 if boundary_simplify is not None
                 else "qiskit_metal_pure_gmsh"
-            )
-
-            substrate = gmsh.model.occ.addBox(
-                xmin, ymin, z_substrate_bottom, dx, dy, substrate_thickness
-            )
-            airbox = gmsh.model.occ.addBox(xmin, ymin, 0.0, dx, dy, airbox_height)
-
-            for record in records:
-                record["surface_tag"] = add_polygon_surface(
-                    record["polygon"], z=0.0, lc=record["mesh_lc"]
-                )
-            surface_tags = [record["surface_tag"] for record in records]
-
-            gmsh.model.occ.fragment([(3, substrate)], [(3, airbox)])
-            gmsh.model.occ.removeAllDuplicates()
-            gmsh.model.occ.synchronize()
-            sub_vols, air_vols = split_volumes_by_z()
-
-            if surface_tags:
-                gmsh.model.occ.fragment(
-                    [(3, volume) for volume in sub_vols + air_vols],
-                    [(2, tag) for tag in surface_tags],
-                )
-                gmsh.model.occ.removeAllDuplicates()
-                gmsh.model.occ.synchronize()
-                sub_vols, air_vols = split_volumes_by_z()
-
-            all_vols = sub_vols + air_vols
-            outer = outer_faces(all_vols)
-            outer_set = {tag for _, tag in outer}
-            records_by_area = sorted(records, key=lambda record: record["polygon"].area)
-
-            attr_to_faces: dict[int, set[int]] = defaultdict(set)
-            ground_plane_faces: set[int] = set()
-            gap_faces: set[int] = set()
-
-            for dim, tag in gmsh.model.getEntities(2):
-                if tag in outer_set:
-                    continue
-                _, _, z = gmsh.model.occ.getCenterOfMass(dim, tag)
-                if abs(z) > geom_tol:
-                    continue
-
-                matched_record = None
-                for record in records_by_area:
-                    if face_inside_polygon(tag, record["polygon"]):
-                        matched_record = record
-                        break
-
-                if matched_record is None:
-                    ground_plane_faces.add(tag)
-                elif matched_record["attribute"] is not None:
-                    attr_to_faces[int(matched_record["attribute"])].add(tag)
-                else:
-                    gap_faces.add(tag)
-
-            farfield_faces = sorted({tag for _, tag in outer})
-
-            if sub_vols:
-                gmsh.model.addPhysicalGroup(3, sub_vols, substrate_attr)
-                gmsh.model.setPhysicalName(3, substrate_attr, "substrate")
-            if air_vols:
-                gmsh.model.addPhysicalGroup(3, air_vols, air_attr)
-                gmsh.model.setPhysicalName(3, air_attr, "air")
-
-            attr_labels: dict[int, str] = {}
-            attr_sources: dict[int, set[tuple[Any, str]]] = defaultdict(set)
-            attr_is_subtract: dict[int, bool] = {}
+            ),
+            "output": str(output_path),
+            "performance": performance,
+        }
 
-            for record in tagged_records:
-                attr = int(record["attribute"])
-                label = Mesh._qmetal_physical_surface_name(
-                    record["component"],
-                    record["name"],
-                    record["key"],
-                    id_to_name,
+        if isinstance(tiles, int):
+            tiles = (tiles, 1) if xmax - xmin >= ymax - ymin else (1, tiles)
+        if tiles != None and tuple(tiles) == (1, 1):
+            tiles = None
+
+        settings = {
+            "attributes": sorted((repr(key), int(value)) for key, value in Attributes.items()),
+            # group names follow component names, which the surface digests key by ID
+            "attr_labels": sorted(attr_labels.items()),
+            "custom_surface_mesh": sorted((repr(key), value) for key, value in custom_surface_mesh.items()),
+            "lengths": [substrate_thickness, airbox_height, margin_x, margin_y],
+            "sizes": [volume_mesh_size, surface_mesh_size, refinement_radius, geom_tol],
+            "mesh_scale": mesh_scale,
+            "attrs": job["attrs"],
+            "boundary_simplify": boundary_simplify,
+            "msh": [msh_version, msh_binary],
+            "tiles": tiles,
+            "algorithm_3d": None if performance is None else performance.algorithm_3d,
+        }
+        result = None
+        if cache:
+            cache_key = Mesh._qm_mesh_cache_key(surface_digests, settings)
+            result = Mesh._load_qm_mesh_cache(cache_key, output_path)
+            if result != None:
+                print(f"mesh cache: reused {cache_key[:12]} for {output_path}")
+        if result == None:
+            if tiles == None:
+                result = Mesh._qm_mesh_region(job)
+            elif incremental:
+                result = Mesh._qm_mesh_incremental(
+                    job, tuple(tiles), tile_workers, settings, surface_digests, id_to_name
                 )
-                attr_labels.setdefault(attr, label)
-                attr_sources[attr].add((record["component"], record["name"]))
-                attr_is_subtract.setdefault(attr, bool(record["subtract"]))
-
-            for attr, faces in attr_to_faces.items():
-                if not faces:
-                    continue
-                gmsh.model.addPhysicalGroup(2, sorted(faces), attr)
-                gmsh.model.setPhysicalName(2, attr, attr_labels.get(attr, f"attr_{attr}"))
-
-            if ground_plane_faces:
-                gmsh.model.addPhysicalGroup(2, sorted(ground_plane_faces), ground_plane_attr)
-                gmsh.model.setPhysicalName(2, ground_plane_attr, "ground_plane")
             else:
-                warnings.append("no ground_plane faces were identified")
-
-            if farfield_faces:
-                gmsh.model.addPhysicalGroup(2, farfield_faces, farfield_attr)
-                gmsh.model.setPhysicalName(2, farfield_attr, "far_field")
-            else:
-                warnings.append("no far_field faces were identified")
-
-            size_to_faces: dict[float, set[int]] = defaultdict(set)
-            for attr, faces in attr_to_faces.items():
-                size_to_faces[attr_mesh_sizes[attr]].update(faces)
-            if gap_faces:
-                size_to_faces[surface_mesh_size].update(gap_faces)
-
-            if ground_plane_faces and "ground_plane" in custom_surface_mesh:
-                size_to_faces[custom_surface_mesh["ground_plane"]].update(
-                    ground_plane_faces
-                )
-
-            if farfield_faces and "far_field" in custom_surface_mesh:
-                size_to_faces[custom_surface_mesh["far_field"]].update(farfield_faces)
-
-            mesh_fields: list[int] = []
-            for size_min, faces in size_to_faces.items():
-                if not faces:
-                    continue
-                dist_field = gmsh.model.mesh.field.add("Distance")
-                gmsh.model.mesh.field.setNumbers(
-                    dist_field, "SurfacesList", sorted(faces)
-                )
-                gmsh.model.mesh.field.setNumber(dist_field, "Sampling", 100)
-
-                thresh_field = gmsh.model.mesh.field.add("Threshold")
-                gmsh.model.mesh.field.setNumber(thresh_field, "InField", dist_field)
-                gmsh.model.mesh.field.setNumber(thresh_field, "SizeMin", size_min)
-                gmsh.model.mesh.field.setNumber(
-                    thresh_field, "SizeMax", volume_mesh_size
-                )
-                gmsh.model.mesh.field.setNumber(thresh_field, "DistMin", 0.0)
-                gmsh.model.mesh.field.setNumber(
-                    thresh_field, "DistMax", refinement_radius
+                result = Mesh._qm_mesh_tiled(job, tuple(tiles), tile_workers)
+            if cache:
+                Mesh._store_qm_mesh_cache(cache_key, output_path, result)
+
+        if (2, ground_plane_attr) not in result["groups"]:
+            warnings.append("no ground_plane faces were identified")
+        if (2, farfield_attr) not in result["groups"]:
+            warnings.append("no far_field faces were identified")
+        if warnings:
+            print("USER WARNING: " + "; ".join(warnings))
+
+        simplify_stats = result["simplify_stats"]
+        if simplify_stats is not None:
+            polygon_edges = simplify_stats.get("polygon_edges", 0)
+            gmsh_curves = simplify_stats.get("gmsh_curves", 0)
+            merged_runs = simplify_stats.get("merged_runs", 0)
+            if polygon_edges > 0:
+                resolved = Mesh._resolve_boundary_simplify_settings(
+                    boundary_simplify,
+                    surface_mesh_size,
+                    mesh_scale,
+                    finest_surface_mesh_size=finest_surface_mesh_size,
                 )
-                mesh_fields.append(thresh_field)
-
-            if len(mesh_fields) == 1:
-                gmsh.model.mesh.field.setAsBackgroundMesh(mesh_fields[0])
-            elif len(mesh_fields) > 1:
-                min_field = gmsh.model.mesh.field.add("Min")
-                gmsh.model.mesh.field.setNumbers(
-                    min_field, "FieldsList", mesh_fields
+                print(
+                    "boundary simplify: "
+                    f"{polygon_edges} QM polygon edges -> "
+                    f"{gmsh_curves} Gmsh curves "
+                    f"({merged_runs} merged runs; "
+                    f"short_edge={resolved.short_edge / mesh_scale:.4g} mm, "
+                    f"cluster_span={resolved.cluster_span / mesh_scale:.4g} mm)"
                 )
-                gmsh.model.mesh.field.setAsBackgroundMesh(min_field)
-
-            gmsh.option.setNumber("Mesh.MeshSizeFromPoints", 0)
-            gmsh.option.setNumber("Mesh.MeshSizeFromCurvature", 0)
-            gmsh.option.setNumber("Mesh.MeshSizeExtendFromBoundary", 0)
-            gmsh.option.setNumber(
-                "Mesh.CharacteristicLengthMin", finest_surface_mesh_size
-            )
-            gmsh.option.setNumber("Mesh.CharacteristicLengthMax", volume_mesh_size)
-            gmsh.option.setNumber("Mesh.ElementOrder", 1)
-            gmsh.option.setNumber("Mesh.MshFileVersion", 2.2)
-            gmsh.option.setNumber("Mesh.Binary", 0)
-            gmsh.option.setNumber("Mesh.SaveAll", 0)
-            gmsh.option.setNumber("Mesh.Algorithm3D", 1)
-
-            gmsh.model.mesh.generate(3)
-            gmsh.write(str(output_path))
-
-            if warnings:
-                print("USER WARNING: " + "; ".join(warnings))
-
-            if simplify_stats is not None:
-                polygon_edges = simplify_stats.get("polygon_edges", 0)
-                gmsh_curves = simplify_stats.get("gmsh_curves", 0)
-                merged_runs = simplify_stats.get("merged_runs", 0)
-                if polygon_edges > 0:
-                    resolved = Mesh._resolve_boundary_simplify_settings(
-                        boundary_simplify,
-                        surface_mesh_size,
-                        mesh_scale,
-                        finest_surface_mesh_size=finest_surface_mesh_size,
-                    )
+                if merged_runs == 0:
                     print(
-                        "boundary simplify: "
-                        f"{polygon_edges} QM polygon edges -> "
-                        f"{gmsh_curves} Gmsh curves "
-                        f"({merged_runs} merged runs; "
-                        f"short_edge={resolved.short_edge / mesh_scale:.4g} mm, "
-                        f"cluster_span={resolved.cluster_span / mesh_scale:.4g} mm)"
+                        "USER WARNING: boundary simplify merged 0 edge runs; "
+                        "try lowering simplify_min_edges or raising "
+                        "simplify_cluster_span / simplify_short_edge."
                     )
-                    if merged_runs == 0:
-                        print(
-                            "USER WARNING: boundary simplify merged 0 edge runs; "
-                            "try lowering simplify_min_edges or raising "
-                            "simplify_cluster_span / simplify_short_edge."
-                        )
 
-        finally:
-            if owns_gmsh and gmsh.isInitialized():
-                gmsh.finalize()
+        timings = result["timings"]
+        if performance is not None and performance.report_timings and timings:
+            labels = {
+                "fragment": "fragment",
+                "interfaces": "interfaces",
+                "mesh_1d": "1D",
+                "mesh_2d": "2D",
+                "mesh_3d": "3D",
+                "tiles": "tiles wall",
+                "merge": "merge",
+                "write": "write",
+            }
+            algorithm = {v: k for k, v in Mesh._ALGORITHMS_3D.items()}.get(
+                performance.algorithm_3d, f"Algorithm3D={performance.algorithm_3d}"
+            )
+            print(
+                f"mesh timings ({algorithm}, {performance.num_threads} threads): "
+                + ", ".join(
+                    f"{label} {timings[key]:.2f} s"
+                    for key, label in labels.items()
+                    if key in timings
+                )
+            )
 
         mesh_attributes = Mesh.get_mesh_attributes(output_mesh)
         mesh_attributes = mesh_attributes.sort_values("ID")
+        mesh_attributes.attrs["timings"] = timings
         return mesh_attributes
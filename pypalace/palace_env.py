@@ -3,6 +3,12 @@ import platform
 import shutil
 from pathlib import Path
 
+def _usable_cpus() -> list[int]:
+    """IDs of the CPUs this process may run on (its affinity mask, e.g. under Slurm or cgroups)."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
 def get_palace_executable() -> str:
     """Return path to a Palace executable suitable for pyPalace Simulation.run()."""
     if env_path := os.environ.get("PATH_TO_PALACE"):
@@ -3,18 +3,32 @@ Simulation interface for running AWS Palace workflows.
 
 This module provides the :class:`Simulation` class, which executes Palace
 simulations (locally or on HPC systems) and extracts outputs such as
-capacitance matrices, eigenfrequencies, linewidths, and S-parameters.
+capacitance matrices, eigenfrequencies, linewidths, and S-parameters,
+:class:`Results`, the cached CSV output a simulation's getters read,
+:class:`SimulationRun`, a handle to a simulation running in the background,
+:class:`SimulationSweep`, which runs many simulations concurrently under
+a shared core budget, and :class:`ResultCache`, which skips re-running
+simulations whose results are already known.
 """
 
+from __future__ import annotations
 
-import pandas as pd
 import subprocess
-import matplotlib.pyplot as plt
-import pyvista as pv
 import numpy as np
 import json
+import os
+import copy
+import hashlib
+import shutil
+import re
+import time
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
 from .config import Config
 from .palace_env import *
+from .palace_env import _usable_cpus
 
 class Simulation:
 
@@ -32,6 +46,11 @@ class Simulation:
         Config object defining the Palace simulation.
     path_to_palace : str
         Path to the Palace executable.
+
+    Attributes
+    ----------
+    results : Results
+        Cached Palace CSV output, shared by the result getters.
     """
 
 
@@ -51,6 +70,7 @@ class Simulation:
         self.path_to_palace = path_to_palace
         self.config = config
         self.path_to_json = self.config.config_name
+        self.results = Results(self)
         
     def HPC_options(partition,time,nodes,ntasks_per_node,mem,job_name,custom = None):
         
@@ -99,7 +119,7 @@ class Simulation:
         return slurm_list
     
         
-    def run(self,n,HPC_options=None,custom_script_name=None):
+    def run(self,n,HPC_options=None,custom_script_name=None,cache=None,cache_link=False):
     
         """
         Run the simulation.
@@ -116,15 +136,29 @@ class Simulation:
             Slurm directive list generated by :meth:`Simulation.HPC_options`.
         custom_script_name : str, optional
             Name of the generated job script file.
+        cache : bool or ResultCache, optional
+            If given, results of an identical earlier run (same config apart
+            from ``Problem.Output``, mesh, and Palace build) are restored from
+            the cache instead of running Palace, and results of local runs
+            are added to it. True uses the default :class:`ResultCache`.
+        cache_link : bool, optional
+            On a cache hit, symlink ``Problem.Output`` to the cached results
+            instead of copying them (default False).
         """
     
         if self.config.saved == False:
             self.config.save_config()
+
+        result_cache = _result_cache(cache)
+        if result_cache != None and result_cache.restore(self, link=cache_link):
+            print("Restored cached results into {}".format(self.config.config["Problem"]["Output"]))
+            return
+        self._detach_cached_output()
     
         if HPC_options == None:
 
             command = subprocess.Popen(
-                ["mpirun", "-n", str(n), self.path_to_palace, self.path_to_json],
+                self._mpirun_command(n),
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 text=True,
@@ -135,6 +169,9 @@ class Simulation:
 
             command.wait()
 
+            if result_cache != None and command.returncode == 0:
+                result_cache.store(self)
+
         else:
                 if custom_script_name == None:
                     custom_script_name = "palace_jobscript.sh"
@@ -161,6 +198,58 @@ class Simulation:
                 print(command.stderr.strip())
                 
                 
+    async def run_async(self, n, log_file=None, echo=False):
+        """
+        Start the simulation locally without blocking and return a handle.
+
+        ``mpirun`` runs as an asyncio subprocess. Its output is parsed as it
+        arrives into :attr:`SimulationRun.status`, so many simulations can be
+        monitored from one event loop.
+
+        Parameters
+        ----------
+        n : int
+            Number of MPI processes.
+        log_file : str, optional
+            File to copy the Palace output into.
+        echo : bool, optional
+            If True, also print each output line, as :meth:`run` does.
+
+        Returns
+        -------
+        SimulationRun
+            Handle to the running simulation. ``await handle`` waits for it
+            and returns the exit code.
+
+        Examples
+        --------
+        >>> handle = await sim.run_async(8)
+        >>> handle.status.driven_step, handle.status.elapsed
+        >>> returncode = await handle
+        """
+
+        if self.config.saved == False:
+            self.config.save_config()
+        self._detach_cached_output()
+
+        process = await asyncio.create_subprocess_exec(
+            *self._mpirun_command(n),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        return SimulationRun(self, process, log_file=log_file, echo=echo)
+
+    def _detach_cached_output(self):
+        """Replace a ``Problem.Output`` symlinked into a result cache with an empty directory."""
+        output = self.config.config["Problem"]["Output"]
+        if os.path.islink(output):
+            os.unlink(output)
+            os.makedirs(output)
+
+    def _mpirun_command(self, n, mpirun_args=None):
+        """Argument list for a local ``mpirun`` launch of this simulation."""
+        return ["mpirun", *(mpirun_args or []), "-n", str(n), self.path_to_palace, self.path_to_json]
+
     def get_capacitance_matrix(self):
     
         """
@@ -180,9 +269,7 @@ class Simulation:
         if self.config.config["Problem"]["Type"] != "Electrostatic":
             raise ValueError("Simulation type is not electrostatic, no capacitance matrix to extract")
         else:
-            cap_matrix_results = self.config.config["Problem"]["Output"]+"/terminal-C.csv"
-            cap_matrix = pd.read_csv(cap_matrix_results)
-            cap_matrix = cap_matrix.drop(columns=['        i'])
+            cap_matrix = self.results.table("terminal-C.csv").drop(columns=["i"])
             
             from .meshing import Mesh
 
@@ -240,9 +327,7 @@ class Simulation:
             
         else:
         
-            freq_results = self.config.config["Problem"]["Output"]+"/eig.csv"
-            freqs = pd.read_csv(freq_results,usecols = [0,1,2,3])
-            freqs.columns = ["m","frequency_GHz","frequency_Im","Q"]
+            freqs = self.results.eigenmodes()
             f_i = freqs[freqs.m == mode].frequency_GHz.iloc[0]*1e9
             
             return f_i
@@ -272,9 +357,7 @@ class Simulation:
             
         else:
         
-            freq_results = self.config.config["Problem"]["Output"]+"/eig.csv"
-            freqs = pd.read_csv(freq_results,usecols = [0,1,2,3])
-            freqs.columns = ["m","frequency_GHz","frequency_Im","Q"]
+            freqs = self.results.eigenmodes()
             f_complex = freqs[freqs.m == mode].frequency_Im.iloc[0]*1e9
             
             kappa = abs(2*f_complex)
@@ -309,10 +392,9 @@ class Simulation:
         else:
         
             try:
-                portQ_results = self.config.config["Problem"]["Output"]+"/port-Q.csv"
-                portQ = pd.read_csv(portQ_results)
-                portQ_i = portQ[portQ['        m'] == mode]
-                label = '             κ_ext[{}] (GHz)'
+                portQ = self.results.table("port-Q.csv")
+                portQ_i = portQ[portQ.m == mode]
+                label = 'κ_ext[{}] (GHz)'
                 
                 kappa_ext = 0
                 for port in ports:
@@ -351,15 +433,43 @@ class Simulation:
             raise ValueError("Simulation type is not eigenmode, no port EPR to extract")
             
         try:
-            EPR_results = self.config.config["Problem"]["Output"]+"/port-EPR.csv"
-            EPR = pd.read_csv(EPR_results,usecols=[0,port_index])
-            EPR.columns = ["m","EPR"]
-            p_i = EPR[EPR.m == mode].EPR.iloc[0]
+            EPR = self.results.table("port-EPR.csv")
+            p_i = EPR[EPR.columns[port_index]][EPR.m == mode].iloc[0]
             return abs(p_i)
             
         except:
             raise ValueError("Are you sure you defined a port?")
 
+    def get_portEPR_matrix(self, ports=None):
+        """
+        Extract the energy participation ratios of every mode and port at once.
+
+        Parameters
+        ----------
+        ports : list of int, optional
+            Port indices (e.g. one per junction). Default is every port in
+            ``port-EPR.csv``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Participation ratios ``|p|`` of shape (n_modes, n_ports), rows
+            ordered by mode index.
+
+        Raises
+        ------
+        ValueError
+            If the simulation type is not eigenmode or if a port is not defined.
+        """
+
+        if self.config.config["Problem"]["Type"] != "Eigenmode":
+            raise ValueError("Simulation type is not eigenmode, no port EPR to extract")
+
+        try:
+            return self.results.port_EPR(ports)
+        except (OSError, KeyError):
+            raise ValueError("Are you sure you defined a port?")
+
     def get_Sij(self, index2: int, index1: int):
         """
         Extract S-parameters between two ports from a driven simulation.
@@ -387,14 +497,15 @@ class Simulation:
             
         else:
         
-            Smatrix_results = self.config.config["Problem"]["Output"]+"/port-S.csv"
-            Smatrix = pd.read_csv(Smatrix_results)
+            Smatrix = self.results.table("port-S.csv")
             
-            ReSij =  '             |S[{}][{}]| (dB)'.format(index2,index1)
-            ImSij =  '        arg(S[{}][{}]) (deg.)'.format(index2,index1)
+            ReSij =  '|S[{}][{}]| (dB)'.format(index2,index1)
+            ImSij =  'arg(S[{}][{}]) (deg.)'.format(index2,index1)
             
             try:
-                f_GHz = Smatrix['        f (GHz)'].to_numpy()
+                import pandas as pd
+
+                f_GHz = Smatrix['f (GHz)'].to_numpy()
                 ReSij_column = Smatrix[ReSij].to_numpy()
                 ImSij_column = Smatrix[ImSij].to_numpy()
                 columns = ["frequency_GHz","|S[{}][{}]| (dB)".format(index2,index1),"arg(S[{}][{}]) (deg)".format(index2,index1)]
@@ -511,6 +622,8 @@ class Simulation:
         type = self.config.config["Problem"]["Type"].lower()
         paraview_data = self.config.config["Problem"]["Output"] + "/paraview/" + type + "/{}.pvd".format(type)
             
+        import pyvista as pv
+
         reader = pv.get_reader(paraview_data)
         reader.set_active_time_point(index)
         mb = reader.read()
@@ -573,6 +686,8 @@ class Simulation:
         else:
             vmin, vmax = scale
 
+        import matplotlib.pyplot as plt
+
         fig,ax = plt.subplots()
         sc = plt.scatter(x_plot, y_plot, c=data, s=1, cmap=cmap, vmin=vmin, vmax=vmax)
         plt.colorbar(sc)
@@ -581,5 +696,1084 @@ class Simulation:
             plt.savefig(save)
         if show == True:
             plt.show()
-            
-        
+
+
+class Results:
+
+    """
+    Palace CSV output of a simulation, parsed once and cached.
+
+    Each CSV in the ``Problem.Output`` directory is read on first access,
+    with Palace's padded column names stripped (``"        m"`` becomes
+    ``"m"``), and kept until the file's modification time or size changes,
+    so repeated getter calls do not re-parse the file. Bulk accessors return
+    every mode and port at once as NumPy arrays.
+
+    Available as :attr:`Simulation.results`.
+
+    Parameters
+    ----------
+    simulation : Simulation
+        Simulation whose output directory is read.
+
+    Examples
+    --------
+    >>> sim.results.frequencies()            # Hz, one per mode
+    >>> sim.results.port_EPR()               # shape (n_modes, n_ports)
+    """
+
+    _PORT = re.compile(r"\[(\d+)\]")
+
+    def __init__(self, simulation):
+        self.simulation = simulation
+        self._tables = {}
+
+    @property
+    def output(self):
+        """Output directory, read from the config on each access."""
+        return self.simulation.config.config["Problem"]["Output"]
+
+    def table(self, name):
+        """
+        Return a Palace output CSV as a DataFrame.
+
+        Parameters
+        ----------
+        name : str
+            File name within the output directory, e.g. ``"port-S.csv"``.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Table with stripped column names. The index/mode column
+            (``m`` or ``i``) is cast to int. Cached; do not modify in place.
+        """
+        path = os.path.join(self.output, name)
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._tables.get(path)
+        if cached != None and cached[0] == stamp:
+            return cached[1]
+
+        import pandas as pd
+
+        df = pd.read_csv(path, skipinitialspace=True)
+        df.columns = [str(column).strip() for column in df.columns]
+        for column in ("m", "i"):
+            if column in df.columns:
+                df[column] = df[column].round().astype(int)
+        self._tables[path] = (stamp, df)
+        return df
+
+    def clear(self):
+        """Drop every cached table."""
+        self._tables.clear()
+
+    def ports(self, name):
+        """Port (or terminal) indices appearing in a table's column names, in order."""
+        found = []
+        for column in self.table(name).columns:
+            match = self._PORT.search(column)
+            if match != None and int(match.group(1)) not in found:
+                found.append(int(match.group(1)))
+        return found
+
+    def eigenmodes(self):
+        """
+        Return ``eig.csv`` with columns ``m``, ``frequency_GHz``,
+        ``frequency_Im``, and ``Q`` followed by Palace's error estimates.
+        """
+        eig = self.table("eig.csv")
+        names = ["m", "frequency_GHz", "frequency_Im", "Q"]
+        return eig.rename(columns=dict(zip(eig.columns[: len(names)], names)))
+
+    def modes(self):
+        """Eigenmode indices, the row order of every per-mode array."""
+        return self.eigenmodes().m.to_numpy()
+
+    def frequencies(self):
+        """Eigenfrequencies of all modes in Hz."""
+        return self.eigenmodes().frequency_GHz.to_numpy() * 1e9
+
+    def kappas(self):
+        """Linewidths ``|2 Im f|`` of all modes in Hz."""
+        return np.abs(2 * self.eigenmodes().frequency_Im.to_numpy()) * 1e9
+
+    def _per_port(self, name, label, ports):
+        """Stack ``label.format(port)`` columns into an (n_modes, n_ports) array, rows sorted by mode."""
+        table = self.table(name)
+        table = table.sort_values("m", kind="stable")
+        if ports == None:
+            ports = self.ports(name)
+        return table.m.to_numpy(), np.column_stack(
+            [table[label.format(port)].to_numpy(dtype=float) for port in ports]
+        ).reshape(len(table), len(ports))
+
+    def kappa_ext(self, ports=None):
+        """
+        External linewidths of all modes from ``port-Q.csv``.
+
+        Parameters
+        ----------
+        ports : list of int, optional
+            Port indices, default every port in the file.
+
+        Returns
+        -------
+        numpy.ndarray
+            ``|κ_ext|`` in Hz with shape (n_modes, n_ports), rows ordered by
+            mode index; sum over axis 1 for the total from several ports.
+        """
+        return np.abs(self._per_port("port-Q.csv", "κ_ext[{}] (GHz)", ports)[1]) * 1e9
+
+    def port_EPR(self, ports=None):
+        """
+        Energy participation ratios of all modes from ``port-EPR.csv``.
+
+        Parameters
+        ----------
+        ports : list of int, optional
+            Port indices, default every port in the file.
+
+        Returns
+        -------
+        numpy.ndarray
+            ``|p|`` with shape (n_modes, n_ports), rows ordered by mode index.
+        """
+        return np.abs(self._per_port("port-EPR.csv", "p[{}]", ports)[1])
+
+    def S_parameters(self, ports=None):
+        """
+        Full S-matrix sweep from ``port-S.csv``.
+
+        Parameters
+        ----------
+        ports : list of int, optional
+            Port indices spanning both matrix axes, default every port in
+            the file.
+
+        Returns
+        -------
+        frequency_GHz : numpy.ndarray
+            Frequencies, shape (n_f,).
+        magnitude_dB, phase_deg : numpy.ndarray
+            ``|S[i][j]|`` in dB and ``arg S[i][j]`` in degrees, shape
+            (n_f, n_ports, n_ports), with ``[:, a, b]`` the element between
+            output ``ports[a]`` and input ``ports[b]``. Elements Palace did
+            not write (non-excited inputs) are NaN.
+        """
+        table = self.table("port-S.csv")
+        if ports == None:
+            ports = self.ports("port-S.csv")
+        frequency = table["f (GHz)"].to_numpy(dtype=float)
+        magnitude = np.full((len(table), len(ports), len(ports)), np.nan)
+        phase = np.full_like(magnitude, np.nan)
+        for a, i in enumerate(ports):
+            for b, j in enumerate(ports):
+                column = "|S[{}][{}]| (dB)".format(i, j)
+                if column in table.columns:
+                    magnitude[:, a, b] = table[column].to_numpy(dtype=float)
+                    phase[:, a, b] = table["arg(S[{}][{}]) (deg.)".format(i, j)].to_numpy(dtype=float)
+        return frequency, magnitude, phase
+
+
+@dataclass
+class RunStatus:
+    """
+    Live progress of a simulation started with :meth:`Simulation.run_async`.
+
+    Fields are parsed from the Palace output as it arrives and stay None
+    until Palace reports them.
+
+    Attributes
+    ----------
+    state : str
+        ``"running"``, ``"finished"``, ``"failed"``, or ``"cancelled"``.
+    amr_iteration : int or None
+        Current adaptive mesh refinement iteration.
+    eigen_converged : int or None
+        Number of converged eigenpairs reported by the eigensolver.
+    step, n_steps : int or None
+        Current driven frequency / transient time / electrostatic terminal
+        step, and the total number of steps when Palace prints it.
+    frequency_GHz : float or None
+        Frequency of the current driven step.
+    linear_iterations : int or None
+        Iterations of the most recent linear solve.
+    returncode : int or None
+        ``mpirun`` exit status once finished.
+    """
+
+    state: str = "running"
+    amr_iteration: int | None = None
+    eigen_converged: int | None = None
+    step: int | None = None
+    n_steps: int | None = None
+    frequency_GHz: float | None = None
+    linear_iterations: int | None = None
+    returncode: int | None = None
+    start_time: float = 0.0
+    end_time: float | None = None
+
+    @property
+    def elapsed(self):
+        """Seconds since the simulation started (until it ended, once done)."""
+        end = self.end_time if self.end_time != None else time.time()
+        return end - self.start_time
+
+
+class SimulationRun:
+
+    """
+    Handle to a simulation started with :meth:`Simulation.run_async`.
+
+    ``await handle`` waits for the simulation and returns its exit code.
+
+    Attributes
+    ----------
+    simulation : Simulation
+        The simulation being run.
+    status : RunStatus
+        Live progress, updated as Palace output arrives.
+    tail : collections.deque
+        The most recent output lines.
+    """
+
+    # each pattern is tried only on lines containing its key
+    _PATTERNS = (
+        ("It ", re.compile(r"^\s*It\s+(\d+)(?:/(\d+))?:")),
+        ("GHz", re.compile(r"ω/2π\s*=\s*([-+0-9.eE]+)\s*GHz")),
+        ("onverged", re.compile(r"Found\s+(\d+)\s+converged\s+eigen")),
+        ("nconv", re.compile(r"nconv\s*=\s*(\d+)")),
+        ("efinement", re.compile(r"(?i)mesh\s+refinement\b.*?\biteration\s*:?\s*(\d+)")),
+        ("iterations", re.compile(r"converged in\s+(\d+)\s+iterations")),
+    )
+
+    def __init__(self, simulation, process, log_file=None, echo=False, tail_lines=200):
+        self.simulation = simulation
+        self.status = RunStatus(start_time=time.time())
+        self.tail = deque(maxlen=tail_lines)
+        self._process = process
+        self._cancelled = False
+        self._log_file = log_file
+        self._echo = echo
+        self._task = asyncio.ensure_future(self._monitor())
+        # the loop keeps only weak references to tasks, so hold the SIGKILL fallback
+        self._kill_task = None
+
+    def _parse(self, line):
+        status = self.status
+        for key, pattern in SimulationRun._PATTERNS:
+            if key not in line:
+                continue
+            match = pattern.search(line)
+            if match == None:
+                continue
+            if key == "It ":
+                status.step = int(match.group(1))
+                if match.group(2) != None:
+                    status.n_steps = int(match.group(2))
+            elif key == "GHz":
+                status.frequency_GHz = float(match.group(1))
+            elif key in ("onverged", "nconv"):
+                status.eigen_converged = int(match.group(1))
+            elif key == "efinement":
+                status.amr_iteration = int(match.group(1))
+            else:
+                status.linear_iterations = int(match.group(1))
+
+    async def _monitor(self):
+        log = open(self._log_file, "w") if self._log_file != None else None
+        try:
+            async for raw in self._process.stdout:
+                line = raw.decode(errors="replace")
+                self.tail.append(line.rstrip("\n"))
+                self._parse(line)
+                if log != None:
+                    log.write(line)
+                if self._echo == True:
+                    print(line, end="")
+            returncode = await self._process.wait()
+        finally:
+            if log != None:
+                log.close()
+
+        self.status.returncode = returncode
+        self.status.end_time = time.time()
+        if self._cancelled:
+            self.status.state = "cancelled"
+        else:
+            self.status.state = "finished" if returncode == 0 else "failed"
+        return returncode
+
+    def __await__(self):
+        return asyncio.shield(self._task).__await__()
+
+    def done(self):
+        """True once the simulation has exited."""
+        return self._task.done()
+
+    async def wait(self, timeout=None):
+        """
+        Wait for the simulation to exit.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum number of seconds to wait. The simulation keeps running
+            if the timeout expires.
+
+        Returns
+        -------
+        int or None
+            Exit code, or None if the simulation is still running.
+        """
+        try:
+            returncode = await asyncio.wait_for(asyncio.shield(self._task), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if self._kill_task != None:
+            # ends as soon as the process has exited
+            await self._kill_task
+        return returncode
+
+    def cancel(self, grace=10.0):
+        """
+        Stop the simulation.
+
+        ``mpirun`` receives SIGTERM, which it forwards to the Palace ranks,
+        and SIGKILL if it is still running ``grace`` seconds later.
+        """
+        if self.done():
+            return
+        self._cancelled = True
+        self._process.terminate()
+
+        async def kill_after_grace():
+            try:
+                await asyncio.wait_for(asyncio.shield(self._task), grace)
+            except asyncio.TimeoutError:
+                if self._process.returncode == None:
+                    self._process.kill()
+
+        self._kill_task = asyncio.ensure_future(kill_after_grace())
+
+
+def _slurm_dependency(dependency):
+    """``--dependency`` value from a Slurm spec string or job ID(s) to run after."""
+    if dependency == None:
+        return None
+    # anything but a job ID is passed through: a full spec such as
+    # "afterany:1234" or a keyword such as "singleton"
+    if isinstance(dependency, str) and not re.fullmatch(r"[0-9_]+", dependency.strip()):
+        return dependency
+    ids = [dependency] if isinstance(dependency, (str, int)) else list(dependency)
+    # array task IDs ("123_4") stay as they are: afterok waits for that task only
+    return "afterok:" + ":".join(dict.fromkeys(str(job_id).strip() for job_id in ids))
+
+
+def _write_sbatch_script(script_name, HPC_options, lines, extra=()):
+    """Write a Slurm batch script with ``HPC_options`` directives and a body."""
+    for sbatches in HPC_options:
+        key = str(sbatches).split("=")[0].strip().lstrip("-")
+        if key in ("array", "dependency"):
+            raise ValueError(f"'{key}' is set by pyPalace; remove it from HPC_options")
+
+    directory = os.path.dirname(script_name)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(script_name, "w") as file:
+        file.write("#!/bin/bash\n")
+        file.write("\n")
+        for sbatches in list(HPC_options) + list(extra):
+            file.write("#SBATCH --{}\n".format(sbatches))
+        file.write("\n")
+        for line in lines:
+            file.write(line + "\n")
+
+
+def _sbatch(script_name):
+    """Submit a script with ``sbatch --parsable`` and return its job ID."""
+    command = subprocess.run(["sbatch", "--parsable", script_name], capture_output=True, text=True)
+    if command.returncode != 0:
+        raise RuntimeError(f"sbatch {script_name} failed: {command.stderr.strip()}")
+    # --parsable prints "jobid" or "jobid;cluster"
+    return command.stdout.strip().splitlines()[-1].split(";")[0]
+
+
+@dataclass
+class SweepJob:
+    """
+    One simulation of a :class:`SimulationSweep` and its run status.
+
+    Attributes
+    ----------
+    simulation : Simulation
+        Simulation object, usable for result extraction once the job is done.
+    n : int
+        Number of MPI processes.
+    log : str
+        File receiving the job's Palace stdout and stderr.
+    cores : tuple
+        CPU cores the job was pinned to, empty if not pinned.
+    slurm_id : str or None
+        Slurm array task ID (``"<jobid>_<index>"``) after
+        :meth:`SimulationSweep.submit_slurm`.
+    returncode : int or None
+        ``mpirun`` exit status, None until the job finishes.
+    start_time, end_time : float or None
+        Wall-clock start and end times (``time.time()``).
+    cached : bool
+        True if the results were restored from a :class:`ResultCache`
+        instead of running Palace.
+    """
+
+    simulation: Simulation
+    n: int
+    log: str
+    cores: tuple = ()
+    slurm_id: str | None = None
+    returncode: int | None = None
+    start_time: float | None = None
+    end_time: float | None = None
+    cached: bool = False
+
+    @property
+    def succeeded(self):
+        """True if the job finished with exit status 0."""
+        return self.returncode == 0
+
+    @property
+    def elapsed(self):
+        """Run time in seconds, None if the job has not finished."""
+        if self.start_time == None or self.end_time == None:
+            return None
+        return self.end_time - self.start_time
+
+
+class SimulationSweep:
+
+    """
+    Run many Palace simulations concurrently on one machine.
+
+    Jobs are packed into a total core budget: whenever cores free up, the
+    next pending jobs that fit are launched, so many small jobs run side by
+    side instead of one at a time. On Linux each job is pinned to its own
+    set of cores, so concurrent ``mpirun`` instances do not bind their ranks
+    to the same cores.
+
+    Parameters
+    ----------
+    configs : list of pypalace.config.Config
+        Config variants to run. Each needs its own config file name and
+        ``Problem.Output`` directory.
+    path_to_palace : str
+        Path to the Palace executable.
+    n : int or list of int, optional
+        MPI processes per job, either one value for all jobs or one per
+        config (default 1).
+    cores : int, optional
+        Total number of cores the sweep may use at once. Default is every
+        core available to this process.
+    pin : bool, optional
+        If True (default), pin each job to a disjoint set of cores where the
+        platform supports it (Linux).
+    mpirun_args : list of str, optional
+        Extra arguments passed to every ``mpirun`` call.
+    cache : bool or ResultCache, optional
+        If given, :meth:`run` restores jobs already in the cache instead of
+        running them and adds successful jobs to it. True uses the default
+        :class:`ResultCache`.
+    cache_link : bool, optional
+        Symlink cached results into place instead of copying them (default
+        False).
+    """
+
+    def __init__(
+        self, configs, path_to_palace, n=1, cores=None, pin=True, mpirun_args=None, cache=None, cache_link=False
+    ):
+
+        configs = list(configs)
+        if len(configs) == 0:
+            raise ValueError("SimulationSweep needs at least one Config")
+
+        ranks = [n] * len(configs) if isinstance(n, (int, np.integer)) else list(n)
+        if len(ranks) != len(configs):
+            raise ValueError(f"got {len(ranks)} process counts for {len(configs)} configs")
+
+        for attr in ("config_name", "output"):
+            seen = {}
+            for i, config in enumerate(configs):
+                key = config.config_name if attr == "config_name" else config.config["Problem"]["Output"]
+                key = os.path.abspath(key)
+                if key in seen:
+                    raise ValueError(
+                        f"configs {seen[key]} and {i} share the {attr.replace('_', ' ')} {key!r}; "
+                        "concurrent jobs would overwrite each other"
+                    )
+                seen[key] = i
+
+        available = _usable_cpus()
+        self.cores = len(available) if cores == None else int(cores)
+        if self.cores < 1:
+            raise ValueError("cores must be at least 1")
+        if max(ranks) > self.cores:
+            raise ValueError(f"a job needs {max(ranks)} processes but the core budget is {self.cores}")
+
+        self.pin = pin and hasattr(os, "sched_setaffinity") and self.cores <= len(available)
+        # core IDs when pinning, otherwise just budget slots
+        self._slots = available[: self.cores] if self.pin else list(range(self.cores))
+        self.path_to_palace = path_to_palace
+        self.mpirun_args = list(mpirun_args or [])
+        self.cache = _result_cache(cache)
+        self.cache_link = cache_link
+        self.jobs = [
+            SweepJob(
+                simulation=Simulation(config, path_to_palace),
+                n=int(k),
+                log=os.path.join(config.config["Problem"]["Output"], "palace-stdout.log"),
+            )
+            for config, k in zip(configs, ranks)
+        ]
+
+    def _launch(self, job, cores):
+        """Start one job's ``mpirun`` with its output sent to the job log."""
+        config = job.simulation.config
+        if config.saved == False:
+            config.save_config()
+        job.simulation._detach_cached_output()
+        os.makedirs(os.path.dirname(job.log) or ".", exist_ok=True)
+
+        env = dict(os.environ)
+        # one thread per rank: the core budget counts MPI processes
+        env.setdefault("OMP_NUM_THREADS", "1")
+
+        preexec_fn = None
+        if self.pin:
+            preexec_fn = lambda: os.sched_setaffinity(0, cores)
+
+        with open(job.log, "w") as log:
+            process = subprocess.Popen(
+                job.simulation._mpirun_command(job.n, self.mpirun_args),
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                env=env,
+                preexec_fn=preexec_fn,
+            )
+        job.cores = tuple(cores) if self.pin else ()
+        job.returncode = None
+        job.cached = False
+        job.start_time = time.time()
+        job.end_time = None
+        return process
+
+    def run(self, poll_interval=0.5, verbose=True):
+        """
+        Run every job, keeping as many in flight as the core budget allows.
+
+        Jobs start in the order given; when the next job does not fit in the
+        free cores, later jobs that do fit are started first. A failed job
+        does not stop the sweep. If the sweep is interrupted, running jobs
+        are terminated. With a result cache, a job found in it when its turn
+        comes is restored instead of launched.
+
+        Parameters
+        ----------
+        poll_interval : float, optional
+            Seconds between completion checks (default 0.5).
+        verbose : bool, optional
+            If True (default), print a line when each job starts and ends.
+
+        Returns
+        -------
+        list of SweepJob
+            The sweep's jobs, with return codes and timings filled in.
+        """
+
+        pending = list(range(len(self.jobs)))
+        running = {}
+        free = list(self._slots)
+        total = len(self.jobs)
+
+        try:
+            while pending or running:
+                for i in list(pending):
+                    job = self.jobs[i]
+                    if job.n > len(free):
+                        continue
+                    # checked at launch, so repeats of a finished job are hits too
+                    if self.cache != None and self.cache.restore(job.simulation, link=self.cache_link):
+                        job.returncode, job.cached, job.cores = 0, True, ()
+                        job.start_time = job.end_time = time.time()
+                        pending.remove(i)
+                        if verbose == True:
+                            print(f"[{i + 1}/{total}] restored {job.simulation.path_to_json} from cache")
+                        continue
+                    cores, free = free[: job.n], free[job.n :]
+                    running[i] = (self._launch(job, cores), cores)
+                    pending.remove(i)
+                    if verbose == True:
+                        print(f"[{i + 1}/{total}] started {job.simulation.path_to_json} on {job.n} cores")
+
+                time.sleep(poll_interval)
+
+                for i, (process, cores) in list(running.items()):
+                    returncode = process.poll()
+                    if returncode == None:
+                        continue
+                    job = self.jobs[i]
+                    job.returncode = returncode
+                    job.end_time = time.time()
+                    if self.cache != None and returncode == 0:
+                        self.cache.store(job.simulation)
+                    free = sorted(free + cores)
+                    del running[i]
+                    if verbose == True:
+                        status = "finished" if returncode == 0 else f"FAILED (exit {returncode}, see {job.log})"
+                        print(f"[{i + 1}/{total}] {status} {job.simulation.path_to_json} in {job.elapsed:.1f} s")
+        except BaseException:
+            for process, _ in running.values():
+                process.terminate()
+            for process, _ in running.values():
+                process.wait()
+            raise
+
+        return self.jobs
+
+    def submit_slurm(
+        self,
+        HPC_options,
+        script_name="palace_array.sh",
+        manifest_name=None,
+        max_concurrent=None,
+        dependency=None,
+    ):
+        """
+        Submit the whole sweep to Slurm as a single job array.
+
+        Every config is saved, a manifest with one ``<n> <config>`` line per
+        job is written, and one ``#SBATCH --array`` script is submitted. Task
+        ``i`` runs the ``i``-th manifest line, so the scheduler receives a
+        single submission however many configs the sweep has.
+
+        Parameters
+        ----------
+        HPC_options : list
+            Slurm directives for each array task, from
+            :meth:`Simulation.HPC_options`. Size them for the largest ``n``.
+        script_name : str, optional
+            Path of the generated job script (default ``"palace_array.sh"``).
+        manifest_name : str, optional
+            Path of the manifest. Default is ``script_name`` with a
+            ``.manifest`` suffix.
+        max_concurrent : int, optional
+            Maximum number of array tasks running at once (``--array=...%N``).
+        dependency : str, list, or None, optional
+            Job(s) that must succeed before the array starts: job IDs
+            (``"123_4"`` waits for that array task only), or a full Slurm
+            dependency spec such as ``"afterany:1234"`` or ``"singleton"``.
+
+        Returns
+        -------
+        list of str
+            Array task IDs (``"<jobid>_<index>"``) in config order. They are
+            also stored on each job's ``slurm_id``.
+        """
+
+        for job in self.jobs:
+            job.simulation.config.save_config()
+
+        if manifest_name == None:
+            manifest_name = os.path.splitext(script_name)[0] + ".manifest"
+        manifest_dir = os.path.dirname(manifest_name)
+        if manifest_dir:
+            os.makedirs(manifest_dir, exist_ok=True)
+        with open(manifest_name, "w") as manifest:
+            for job in self.jobs:
+                manifest.write("{}\t{}\n".format(job.n, os.path.abspath(job.simulation.path_to_json)))
+
+        array = "array=0-{}".format(len(self.jobs) - 1)
+        if max_concurrent != None:
+            array += "%{}".format(int(max_concurrent))
+        extra = [array]
+        dependency = _slurm_dependency(dependency)
+        if dependency != None:
+            extra.append("dependency={}".format(dependency))
+
+        _write_sbatch_script(
+            script_name,
+            HPC_options,
+            [
+                'export PALACE="{}"'.format(self.path_to_palace),
+                'MANIFEST="{}"'.format(os.path.abspath(manifest_name)),
+                'IFS=$\'\\t\' read -r MPI_PROCESSES MY_SIM < <(sed -n "$((SLURM_ARRAY_TASK_ID + 1))p" "$MANIFEST")',
+                "",
+                'mpirun {}-n $MPI_PROCESSES $PALACE "$MY_SIM"'.format(
+                    "".join(arg + " " for arg in self.mpirun_args)
+                ),
+            ],
+            extra,
+        )
+
+        job_id = _sbatch(script_name)
+        for index, job in enumerate(self.jobs):
+            job.slurm_id = "{}_{}".format(job_id, index)
+        return [job.slurm_id for job in self.jobs]
+
+    def submit_after(self, HPC_options, commands, script_name="palace_post.sh", kind="afterok"):
+        """
+        Submit a Slurm job that starts once the submitted array has finished.
+
+        Useful for post-processing a sweep, e.g. gathering results.
+
+        Parameters
+        ----------
+        HPC_options : list
+            Slurm directives for the job, from :meth:`Simulation.HPC_options`.
+        commands : str or list of str
+            Shell command(s) the job runs.
+        script_name : str, optional
+            Path of the generated job script (default ``"palace_post.sh"``).
+        kind : str, optional
+            Slurm dependency type: ``"afterok"`` (default, only if every task
+            succeeded) or ``"afterany"``.
+
+        Returns
+        -------
+        str
+            Job ID of the submitted job.
+        """
+        array_ids = {job.slurm_id.split("_")[0] for job in self.jobs if job.slurm_id != None}
+        if not array_ids:
+            raise ValueError("submit the sweep with submit_slurm before chaining jobs after it")
+        if isinstance(commands, str):
+            commands = [commands]
+        dependency = "{}:{}".format(kind, ":".join(sorted(array_ids)))
+        _write_sbatch_script(script_name, HPC_options, list(commands), ["dependency={}".format(dependency)])
+        return _sbatch(script_name)
+
+    def slurm_status(self):
+        """
+        Query the Slurm state of every submitted array task without waiting.
+
+        Uses ``sacct`` and falls back to ``squeue`` where accounting is not
+        available, in which case finished tasks report ``None``. Every task
+        reports ``None`` when neither command is installed.
+
+        Returns
+        -------
+        pandas.DataFrame
+            One row per job with columns ``config``, ``slurm_id``, and
+            ``state`` (e.g. ``PENDING``, ``RUNNING``, ``COMPLETED``,
+            ``FAILED``).
+        """
+        import pandas as pd
+
+        ids = sorted({job.slurm_id.split("_")[0] for job in self.jobs if job.slurm_id != None})
+        states = {}
+        if ids:
+            try:
+                command = subprocess.run(
+                    ["sacct", "-n", "-P", "-X", "-o", "JobID,State", "-j", ",".join(ids)],
+                    capture_output=True,
+                    text=True,
+                )
+                ok = command.returncode == 0
+            except FileNotFoundError:
+                ok = False
+            if not ok:
+                try:
+                    command = subprocess.run(
+                        ["squeue", "-h", "-r", "-o", "%i|%T", "-j", ",".join(ids)],
+                        capture_output=True,
+                        text=True,
+                    )
+                except FileNotFoundError:
+                    command = None
+            lines = command.stdout.splitlines() if command != None else []
+            for line in lines:
+                if "|" not in line:
+                    continue
+                task, state = (part.strip() for part in line.split("|", 1))
+                # sacct reports e.g. "CANCELLED by 123"
+                state = state.split(" ")[0]
+                if task.endswith("]") and "_[" in task:
+                    # pending tasks are listed as one range, e.g. "123_[4-9,12%5]"
+                    job_id, ranges = task[:-1].split("_[")
+                    for part in ranges.split("%")[0].split(","):
+                        lo, _, hi = part.partition("-")
+                        for index in range(int(lo), int(hi or lo) + 1):
+                            states["{}_{}".format(job_id, index)] = state
+                else:
+                    states[task] = state
+
+        return pd.DataFrame(
+            {
+                "config": [job.simulation.path_to_json for job in self.jobs],
+                "slurm_id": [job.slurm_id for job in self.jobs],
+                "state": [states.get(job.slurm_id) for job in self.jobs],
+            }
+        )
+
+    def summary(self):
+        """
+        Tabulate the status of every job.
+
+        Returns
+        -------
+        pandas.DataFrame
+            One row per job with columns ``config``, ``output``, ``n``,
+            ``returncode``, ``elapsed_s``, ``cached``, and ``log``.
+        """
+        import pandas as pd
+
+        return pd.DataFrame(
+            {
+                "config": [job.simulation.path_to_json for job in self.jobs],
+                "output": [job.simulation.config.config["Problem"]["Output"] for job in self.jobs],
+                "n": [job.n for job in self.jobs],
+                "returncode": [job.returncode for job in self.jobs],
+                "elapsed_s": [job.elapsed for job in self.jobs],
+                "cached": [job.cached for job in self.jobs],
+                "log": [job.log for job in self.jobs],
+            }
+        )
+
+    def gather(self, method, *args, **kwargs):
+        """
+        Call a :class:`Simulation` result getter on every job.
+
+        Parameters
+        ----------
+        method : str
+            Name of the getter, e.g. ``"get_frequency_eigenmode"``.
+        *args, **kwargs
+            Arguments passed to the getter.
+
+        Returns
+        -------
+        list
+            One result per job, in config order; None for jobs that did not
+            succeed.
+
+        Examples
+        --------
+        >>> sweep.run()
+        >>> freqs = sweep.gather("get_frequency_eigenmode", 1)
+        """
+        getter = getattr(Simulation, method)
+        return [getter(job.simulation, *args, **kwargs) if job.succeeded else None for job in self.jobs]
+
+
+class ResultCache:
+
+    """
+    Content-addressed cache of finished Palace output directories.
+
+    A result is keyed by a hash of the config with ``Problem.Output``
+    removed, the mesh file's contents, and the Palace executable's contents,
+    so the same design point solved again, under any output directory, is
+    served from the cache instead of re-running Palace. Entries are evicted
+    least recently used first once the cache exceeds ``max_bytes``.
+
+    Parameters
+    ----------
+    root : str, optional
+        Cache directory. Default is ``$PYPALACE_CACHE_DIR/results`` (or
+        ``~/.cache/pypalace/results``).
+    max_bytes : int, optional
+        Disk budget in bytes (default 20 GiB).
+
+    Examples
+    --------
+    >>> cache = ResultCache(max_bytes=50 * 2**30)
+    >>> sim.run(8, cache=cache)
+    """
+
+    # (path, size, mtime_ns) -> hex digest, so unchanged files are hashed once
+    _file_digests = {}
+
+    def __init__(self, root=None, max_bytes=20 << 30):
+        if root == None:
+            base = os.environ.get("PYPALACE_CACHE_DIR")
+            base = Path(base).expanduser() if base else Path.home() / ".cache" / "pypalace"
+            root = base / "results"
+        self.root = Path(root)
+        self.max_bytes = int(max_bytes)
+
+    @staticmethod
+    def _file_digest(path):
+        """BLAKE2b digest of a file's contents, memoized on size and mtime."""
+        path = os.path.realpath(path)
+        stat = os.stat(path)
+        memo = (path, stat.st_size, stat.st_mtime_ns)
+        digest = ResultCache._file_digests.get(memo)
+        if digest == None:
+            h = hashlib.blake2b(digest_size=20)
+            with open(path, "rb") as file:
+                for block in iter(lambda: file.read(1 << 20), b""):
+                    h.update(block)
+            digest = h.hexdigest()
+            ResultCache._file_digests[memo] = digest
+        return digest
+
+    def key(self, simulation):
+        """
+        Return the cache key of a simulation, or None if an input is missing.
+
+        Parameters
+        ----------
+        simulation : Simulation
+            Simulation whose config, mesh, and Palace executable are hashed.
+
+        Returns
+        -------
+        str or None
+            Hex digest identifying the simulation's results.
+        """
+        config = copy.deepcopy(simulation.config.config)
+        config.get("Problem", {}).pop("Output", None)
+        # the mesh enters by content, so a moved or copied mesh still hits
+        mesh = config.get("Model", {}).pop("Mesh", None)
+        canonical = json.dumps(config, sort_keys=True, separators=(",", ":"))
+
+        palace = shutil.which(simulation.path_to_palace) or simulation.path_to_palace
+        try:
+            mesh_digest = self._file_digest(mesh) if mesh != None else ""
+            palace_digest = self._file_digest(palace)
+        except OSError:
+            return None
+
+        h = hashlib.blake2b(digest_size=20)
+        for part in (canonical, mesh_digest, palace_digest):
+            h.update(part.encode())
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def _index_path(self):
+        """JSON index of entries used for LRU eviction."""
+        return self.root / "index.json"
+
+    def _touch(self, key, nbytes=None, remove=False):
+        """Record an entry use, then evict least recently used entries over budget."""
+        try:
+            index = json.loads(self._index_path().read_text())
+        except (OSError, ValueError):
+            index = {}
+
+        if remove:
+            index.pop(key, None)
+        else:
+            entry = index.setdefault(key, {"bytes": 0})
+            if nbytes != None:
+                entry["bytes"] = int(nbytes)
+            entry["last_used"] = time.time()
+
+        index = {k: entry for k, entry in index.items() if (self.root / k).is_dir()}
+        total = sum(entry.get("bytes", 0) for entry in index.values())
+        for k in sorted(index, key=lambda k: index[k].get("last_used", 0.0)):
+            if total <= self.max_bytes:
+                break
+            if k == key:
+                continue
+            total -= index.pop(k).get("bytes", 0)
+            shutil.rmtree(self.root / k, ignore_errors=True)
+
+        # the cache is best-effort: an unwritable index only disables eviction
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp = self._index_path().with_name("index.json.{}.tmp".format(os.getpid()))
+            tmp.write_text(json.dumps(index))
+            os.replace(tmp, self._index_path())
+        except OSError:
+            pass
+
+    def restore(self, simulation, link=False):
+        """
+        Fill a simulation's output directory from the cache if possible.
+
+        Parameters
+        ----------
+        simulation : Simulation
+            Simulation to look up.
+        link : bool, optional
+            If True, make ``Problem.Output`` a symlink to the cache entry
+            instead of copying it. Falls back to copying when the output
+            directory already exists as a real directory. Launching Palace
+            through :class:`Simulation` or :class:`SimulationSweep` replaces
+            the link with an empty directory first, so a later run never
+            writes into the cache. A copy replaces the whole output directory.
+
+        Returns
+        -------
+        bool
+            True on a cache hit.
+        """
+        key = self.key(simulation)
+        if key == None or not (self.root / key).is_dir():
+            return False
+
+        entry = self.root / key
+        output = simulation.config.config["Problem"]["Output"]
+        if os.path.islink(output):
+            os.unlink(output)
+        if link == True and not os.path.exists(output):
+            parent = os.path.dirname(os.path.abspath(output))
+            os.makedirs(parent, exist_ok=True)
+            os.symlink(entry.resolve(), output, target_is_directory=True)
+        else:
+            # copy next to the output and swap it in, so no file of an
+            # earlier run is left beside the restored ones
+            tmp = "{}.{}.tmp".format(os.path.abspath(output), os.getpid())
+            shutil.rmtree(tmp, ignore_errors=True)
+            shutil.copytree(entry, tmp, symlinks=True)
+            shutil.rmtree(output, ignore_errors=True)
+            os.replace(tmp, output)
+        self._touch(key)
+        return True
+
+    def store(self, simulation):
+        """
+        Copy a finished simulation's output directory into the cache.
+
+        Parameters
+        ----------
+        simulation : Simulation
+            Simulation that completed successfully.
+
+        Returns
+        -------
+        str or None
+            Cache key of the stored entry, None if nothing was stored.
+        """
+        key = self.key(simulation)
+        output = simulation.config.config["Problem"]["Output"]
+        if key == None or not os.path.isdir(output):
+            return None
+        entry = self.root / key
+        if os.path.realpath(output) == os.path.realpath(entry):
+            # output is a link to this very entry
+            self._touch(key)
+            return key
+
+        # copy under a temporary name so readers never see a partial entry
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / ".{}.{}.tmp".format(key, os.getpid())
+        shutil.rmtree(tmp, ignore_errors=True)
+        shutil.copytree(output, tmp, symlinks=True)
+        nbytes = sum(f.stat().st_size for f in tmp.rglob("*") if f.is_file() and not f.is_symlink())
+        shutil.rmtree(entry, ignore_errors=True)
+        os.replace(tmp, entry)
+        self._touch(key, nbytes=nbytes)
+        return key
+
+    def clear(self):
+        """Delete every cache entry."""
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+def _result_cache(cache):
+    """Resolve a ``cache`` argument (True, ResultCache, or falsy) to a ResultCache or None."""
+    if isinstance(cache, ResultCache):
+        return cache
+    return ResultCache() if cache == True else None
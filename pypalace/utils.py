@@ -1,6 +1,5 @@
 import numpy as np
 import pandas as pd
-from scipy.optimize import curve_fit, least_squares
 
 ''' backend functions for DCM fitting '''
 
@@ -56,51 +55,110 @@ class DCM_backend:
         return float(np.min(np.diff(f)))
 
     @staticmethod
-    def _kappa_guess_from_mag(f: np.ndarray, mag_db: np.ndarray) -> float:
-        """Rough linewidth (Hz) from |S21| half-max width."""
-        f0_idx = int(np.argmin(mag_db))
-        n_edge = max(2, len(mag_db) // 10)
-        baseline = float(np.median(np.r_[mag_db[:n_edge], mag_db[-n_edge:]]))
-        half = 0.5 * (baseline + float(mag_db[f0_idx]))
-        df_min = DCM_backend._frequency_step_hz(f)
+    def _blocks(n: int, chunk: int | None):
+        """``(start, stop)`` windows over ``n`` points, overlapping by one so no neighbor pair is split."""
+        if chunk is None or chunk >= n:
+            yield 0, n
+            return
+        for start in range(0, max(n - 1, 1), chunk):
+            yield start, min(start + chunk + 1, n)
 
-        crossings: list[float] = []
-        for idx in range(len(f) - 1):
-            y0 = float(mag_db[idx] - half)
-            y1 = float(mag_db[idx + 1] - half)
-            if y0 == 0.0:
-                crossings.append(float(f[idx]))
-            elif y0 * y1 < 0.0:
-                frac = y0 / (y0 - y1)
-                crossings.append(float(f[idx] + frac * (f[idx + 1] - f[idx])))
+    @staticmethod
+    def _argmin_chunked(x: np.ndarray, chunk: int | None) -> int:
+        """First index of the minimum of ``x``, reading it block by block."""
+        best_idx, best = 0, np.inf
+        for start, stop in DCM_backend._blocks(len(x), chunk):
+            block = np.asarray(x[start:stop])
+            idx = int(np.argmin(block))
+            if block[idx] < best:
+                best_idx, best = start + idx, float(block[idx])
+        return best_idx
 
-        if len(crossings) >= 2:
-            return max(float(max(crossings) - min(crossings)), df_min)
+    @staticmethod
+    def _kappa_guess_from_mag(f: np.ndarray, mag_db: np.ndarray, chunk: int | None = None) -> float:
+        """
+        Rough linewidth (Hz) from |S21| half-max width.
 
-        below = np.where(mag_db < half)[0]
-        if len(below) >= 2:
-            return max(float(f[below[-1]] - f[below[0]]), df_min)
+        With ``chunk`` set, ``f`` and ``mag_db`` (e.g. ``np.memmap`` arrays)
+        are read ``chunk`` points at a time instead of all at once.
+        """
+        n = len(f)
+        f0_idx = DCM_backend._argmin_chunked(mag_db, chunk)
+        n_edge = max(2, n // 10)
+        baseline = float(np.median(np.r_[mag_db[:n_edge], mag_db[-n_edge:]]))
+        half = 0.5 * (baseline + float(mag_db[f0_idx]))
+
+        df_min = np.inf
+        lo, hi, n_crossings = np.inf, -np.inf, 0
+        below_first, below_last = None, None
+        for start, stop in DCM_backend._blocks(n, chunk):
+            fb = np.asarray(f[start:stop], dtype=float)
+            y = np.asarray(mag_db[start:stop], dtype=float) - half
+            if len(fb) >= 2:
+                df_min = min(df_min, float(np.min(np.diff(fb))))
+
+            # half-max crossings: exact hits plus linear interpolation at sign changes
+            y0, y1 = y[:-1], y[1:]
+            exact = y0 == 0.0
+            change = y0 * y1 < 0.0
+            frac = y0[change] / (y0[change] - y1[change])
+            crossings = np.r_[fb[:-1][exact], fb[:-1][change] + frac * np.diff(fb)[change]]
+            n_crossings += len(crossings)
+            if len(crossings):
+                lo, hi = min(lo, float(crossings.min())), max(hi, float(crossings.max()))
+
+            below = np.flatnonzero(y < 0.0)
+            if len(below):
+                if below_first is None:
+                    below_first = start + int(below[0])
+                below_last = start + int(below[-1])
+
+        if n < 2:
+            df_min = 1e6
+
+        if n_crossings >= 2:
+            return max(hi - lo, df_min)
+
+        if below_first is not None and below_last > below_first:
+            return max(float(f[below_last] - f[below_first]), df_min)
 
         return max(float(f[-1] - f[0]) / 10.0, df_min)
 
     @staticmethod
     def _trim_around_dip(
-        f: np.ndarray, mag_db: np.ndarray, phase_deg: np.ndarray, *, min_points: int = 8
+        f: np.ndarray,
+        mag_db: np.ndarray,
+        phase_deg: np.ndarray,
+        *,
+        min_points: int = 8,
+        chunk: int | None = None,
     ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
-        """Keep points near the |S21| dip so wide coarse sweeps do not break DCM."""
-        f0_idx = int(np.argmin(mag_db))
-        f0 = f[f0_idx]
-        kappa_mag = DCM_backend._kappa_guess_from_mag(f, mag_db)
+        """
+        Keep points near the |S21| dip so wide coarse sweeps do not break DCM.
+
+        ``f`` must be sorted. With ``chunk`` set the trace is scanned in
+        blocks, so memory-mapped sweeps are trimmed without loading them.
+        """
+        f0_idx = DCM_backend._argmin_chunked(mag_db, chunk)
+        f0 = float(f[f0_idx])
+        kappa_mag = DCM_backend._kappa_guess_from_mag(f, mag_db, chunk=chunk)
         f_span = float(f[-1] - f[0])
         half_width = max(3.0 * kappa_mag, 0.05 * f_span)
 
-        mask = np.abs(f - f0) <= half_width
-        if mask.sum() < min_points:
-            order = np.argsort(np.abs(f - f0))[:max(min_points, 4)]
-            mask = np.zeros_like(f, dtype=bool)
-            mask[order] = True
+        # f is sorted, so the kept points are one contiguous run
+        start = int(np.searchsorted(f, f0 - half_width, side="left"))
+        stop = int(np.searchsorted(f, f0 + half_width, side="right"))
+        if stop - start < min_points:
+            k = max(min_points, 4)
+            lo, hi = max(0, f0_idx - k), min(len(f), f0_idx + k + 1)
+            nearest = lo + np.argsort(np.abs(np.asarray(f[lo:hi]) - f0))[:k]
+            start, stop = int(nearest.min()), int(nearest.max()) + 1
 
-        return f[mask], mag_db[mask], phase_deg[mask]
+        return (
+            np.array(f[start:stop]),
+            np.array(mag_db[start:stop]),
+            np.array(phase_deg[start:stop]),
+        )
 
     @staticmethod
     def _dcm_complex_residuals(params, f, S21, sign):
@@ -109,21 +167,49 @@ class DCM_backend:
         diff = model - S21
         return np.r_[diff.real, diff.imag]
 
+    @staticmethod
+    def _dcm_complex_jacobian(params, f, S21, sign):
+        """Closed-form Jacobian of :meth:`_dcm_complex_residuals`, shape (2 * len(f), 6)."""
+        ax, ay, R, f0, kappa, theta0 = params
+        u = 2 * (f - f0) / kappa
+        rot = np.exp(1j * (theta0 + sign * 2 * np.arctan(u)))
+        dS_dphi = 1j * R * rot
+        dphi = sign * 2 / (kappa * (1 + u**2))
+
+        jac = np.empty((len(f), 6), dtype=complex)
+        jac[:, 0] = 1.0
+        jac[:, 1] = 1j
+        jac[:, 2] = rot
+        jac[:, 3] = -2 * dphi * dS_dphi
+        jac[:, 4] = -u * dphi * dS_dphi
+        jac[:, 5] = dS_dphi
+        return np.vstack((jac.real, jac.imag))
+
+    @staticmethod
+    def _winding_travel(S21: np.ndarray, center: complex) -> float:
+        """Signed angle (rad) S21 travels around ``center`` as frequency rises."""
+        return float(np.diff(np.unwrap(np.angle(S21 - center))).sum())
+
     @staticmethod
     def _fit_dcm_complex(
-        f: np.ndarray, S21: np.ndarray, mag_db: np.ndarray
+        f: np.ndarray, S21: np.ndarray, mag_db: np.ndarray, warm_start: dict | None = None
     ) -> tuple[float, float, float, float, float, float, float, float, float]:
         """
         Fit the full DCM model in the IQ plane:
         S21(f) = (a + ib) + R * exp(i * (theta0 + sign * 2 arctan(2*(f-f0)/kappa)))
+
+        ``warm_start`` is a previous fit result (a dict with ``kappa_kHz``),
+        used as the linewidth guess for a neighboring trace.
         """
         f0_idx = int(np.argmin(mag_db))
         f0_guess = float(f[f0_idx])
         f_span = float(f[-1] - f[0])
         df_min = DCM_backend._frequency_step_hz(f)
-        kappa_guess = float(
-            np.clip(DCM_backend._kappa_guess_from_mag(f, mag_db), df_min, max(f_span, df_min))
-        )
+        if warm_start is not None:
+            kappa_guess = float(warm_start["kappa_kHz"]) * 1e3
+        else:
+            kappa_guess = DCM_backend._kappa_guess_from_mag(f, mag_db)
+        kappa_guess = float(np.clip(kappa_guess, df_min, max(f_span, df_min)))
 
         a, b, R0 = DCM_backend.fit_to_circle(S21.real, S21.imag)
         if R0 <= 0 or not np.isfinite(R0):
@@ -132,9 +218,9 @@ class DCM_backend:
         center = a + 1j * b
         theta0_guess = float(np.angle(S21[f0_idx] - center))
 
-        best: tuple[float, float, float, float, float, float, float, float, float] | None = None
+        from scipy.optimize import least_squares
 
-        for sign in (1.0, -1.0):
+        def fit(sign: float):
             p0 = [a, b, R0, f0_guess, kappa_guess, theta0_guess]
             lower = [-np.inf, -np.inf, 0.0, float(f[0]), df_min, -np.pi]
             upper = [np.inf, np.inf, np.inf, float(f[-1]), max(kappa_guess * 10.0, f_span), np.pi]
@@ -143,12 +229,13 @@ class DCM_backend:
                 result = least_squares(
                     DCM_backend._dcm_complex_residuals,
                     p0,
+                    jac=DCM_backend._dcm_complex_jacobian,
                     args=(f, S21, sign),
                     bounds=(lower, upper),
                     max_nfev=10000,
                 )
             except Exception:
-                continue
+                return None
 
             ax, ay, R, f0_fit, kappa_fit, theta0_fit = map(float, result.x)
             pred = DCM_backend._dcm_complex_model(f, ax, ay, R, f0_fit, kappa_fit, theta0_fit, sign)
@@ -165,18 +252,38 @@ class DCM_backend:
                 + f0_penalty
             )
 
-            if best is None or score < best[8]:
-                best = (
-                    f0_fit,
-                    kappa_fit,
-                    theta0_fit,
-                    sign,
-                    ax,
-                    ay,
-                    R,
-                    rmse_db,
-                    score,
-                )
+            return (f0_fit, kappa_fit, theta0_fit, sign, ax, ay, R, rmse_db, score)
+
+        def trusted(result) -> bool:
+            # a noisy trace can show the wrong winding: keep the single branch
+            # only if its angular noise is small next to the travel and it
+            # passes the same sanity checks DCM_fit applies afterwards
+            if result is None:
+                return False
+            f0_fit, kappa_fit, theta0_fit, sign, ax, ay, R, rmse_db, _ = result
+            residual = DCM_backend._dcm_complex_model(f, ax, ay, R, f0_fit, kappa_fit, theta0_fit, sign) - S21
+            angle_noise = float(np.sqrt(np.mean(np.abs(residual) ** 2))) / max(R, 1e-30)
+            if angle_noise > 0.25 or abs(travel) < np.pi / 2 + 4.0 * angle_noise:
+                return False
+            try:
+                DCM_backend._validate_fit(f, mag_db, f0_fit, kappa_fit, rmse_db, df_min=df_min)
+            except ValueError:
+                return False
+            return True
+
+        # the direction S21 winds around the circle fixes the sign branch;
+        # the other branch is fitted too when the winding is unclear or the
+        # chosen fit does not hold up
+        travel = DCM_backend._winding_travel(S21, center)
+        if abs(travel) < np.pi / 2:
+            results = [fit(1.0), fit(-1.0)]
+        else:
+            winding = 1.0 if travel > 0 else -1.0
+            results = [fit(winding)]
+            if not trusted(results[0]):
+                results.append(fit(-winding))
+        results = [result for result in results if result is not None]
+        best = min(results, key=lambda result: result[8]) if results else None
 
         if best is None:
             raise RuntimeError(
@@ -237,7 +344,40 @@ class DCM_backend:
             )
 
     @staticmethod
-    def DCM_fit(S_ij: pd.DataFrame, *, auto_trim: bool = True, min_points: int = 8):
+    def _fit_trace(item):
+        """Batch worker: fit one ``(key, S_ij, auto_trim, min_points)`` job, returning errors instead of raising."""
+        key, S_ij, auto_trim, min_points = item
+        try:
+            (
+                f0_fit,
+                kappa_fit,
+                _,
+                _,
+                _,
+                _,
+                _,
+                _,
+                iq_rmse,
+                f_dip,
+                rmse_db,
+                df_min,
+            ) = DCM_backend.DCM_fit(S_ij, auto_trim=auto_trim, min_points=min_points)
+        except Exception as exc:
+            return key, None, f"{type(exc).__name__}: {exc}"
+
+        return key, {
+            "frequency_GHz": f0_fit / 1e9,
+            "kappa_kHz": kappa_fit / 1e3,
+            "frequency_dip_GHz": f_dip / 1e9,
+            "frequency_step_kHz": df_min / 1e3,
+            "fit_rmse": iq_rmse,
+            "fit_rmse_db": rmse_db,
+        }, None
+
+    @staticmethod
+    def DCM_fit(
+        S_ij: pd.DataFrame, *, auto_trim: bool = True, min_points: int = 8, warm_start: dict | None = None
+    ):
         f, mag_db, phase_deg = DCM_backend._parse_sij(S_ij)
 
         if len(f) < max(min_points, 6):
@@ -263,7 +403,7 @@ class DCM_backend:
             R,
             rmse_db,
             iq_rmse,
-        ) = DCM_backend._fit_dcm_complex(f, S21_complex, mag_db)
+        ) = DCM_backend._fit_dcm_complex(f, S21_complex, mag_db, warm_start=warm_start)
 
         DCM_backend._validate_fit(
             f, mag_db, f0_fit, kappa_fit, rmse_db, df_min=df_min
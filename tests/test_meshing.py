@@ -0,0 +1,9 @@
+import inspect
+
+from pypalace.meshing import Mesh
+
+
+def test_quantum_metal_mesh_cache_is_opt_in():
+    parameters = inspect.signature(Mesh.mesh_Quantum_Metal_design).parameters
+    assert parameters["cache"].default is False
+    assert parameters["incremental"].default is False
@@ -0,0 +1,29 @@
+from types import SimpleNamespace
+
+from pypalace import simulation
+from pypalace.simulation import SimulationSweep, SweepJob
+
+
+def _submitted_sweep(slurm_ids):
+    sweep = SimulationSweep.__new__(SimulationSweep)
+    sweep.jobs = [
+        SweepJob(
+            simulation=SimpleNamespace(path_to_json="config{}.json".format(i)),
+            n=1,
+            log="palace-stdout.log",
+            slurm_id=slurm_id,
+        )
+        for i, slurm_id in enumerate(slurm_ids)
+    ]
+    return sweep
+
+
+def test_slurm_status_without_sacct_or_squeue(monkeypatch):
+    def missing(args, **kwargs):
+        raise FileNotFoundError(args[0])
+
+    monkeypatch.setattr(simulation.subprocess, "run", missing)
+    status = _submitted_sweep(["123_0", "123_1"]).slurm_status()
+
+    assert list(status["slurm_id"]) == ["123_0", "123_1"]
+    assert list(status["state"]) == [None, None]